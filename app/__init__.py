@@ -1,9 +1,17 @@
+import io
 import logging
 import logging.config
 import os
+import sys
+import time
+from contextlib import redirect_stdout
 from dotenv import load_dotenv
+from app.log_queue import start_queue_logging, stop_queue_logging
 from app.plugins.plugins_manager import load_plugins
 
+# Approximate number of bytes of input read per chunk in script mode
+SCRIPT_READ_HINT = 1 << 16
+
 class App:
     """
     The main application class for the CLI calculator.
@@ -43,11 +51,24 @@ class App:
             os.makedirs(LOG_DIR)  # Create the logs directory if it doesn't exist
 
         # Load logging configuration
+        stop_queue_logging()  # Flush a previous queue before its handlers are replaced
         if os.path.exists(LOG_CONFIG_PATH):
             logging.config.fileConfig(LOG_CONFIG_PATH)
         else:
             logging.basicConfig(level=logging.INFO)  # Fallback in case logging.conf is missing
             logging.warning(f"Logging configuration file '{LOG_CONFIG_PATH}' not found. Using default settings.")
+        # Decide the calculator's hot-path log guards again for the new levels; if the
+        # calculator is not imported yet, its guards are decided when it is
+        log_guards = sys.modules.get("calculator.log_guards")
+        if log_guards is not None:
+            log_guards.refresh_log_guards()
+        # Optionally move the handlers behind a bounded queue and a listener thread
+        queue_size = self.get_environment_variable('LOG_QUEUE_SIZE')
+        if queue_size:
+            try:
+                start_queue_logging(int(queue_size), self.get_environment_variable('LOG_QUEUE_OVERFLOW') or "drop")
+            except ValueError as e:
+                logging.warning(f"Invalid log queue settings, logging synchronously: {e}")
         self.logger = logging.getLogger(__name__)
         self.logger.info("Logging is successfully set up.")
     
@@ -77,6 +98,42 @@ class App:
         """
         return self.settings.get(env_var, None)  # Return the value of the requested environment variable or None
 
+    def dispatch(self, cmd_name: str, args: list) -> bool:
+        """
+        Executes one command through the command handler.
+
+        Parameters:
+        -----------
+        cmd_name (str): The command name, in lower case.
+        args (list): The arguments for the command.
+
+        Returns:
+        --------
+        bool: False if the command asked the application to exit, True otherwise.
+        """
+        self.logger.info(f"User input received: {cmd_name} {args}")
+
+        # Check if the command is available in the registered commands
+        if self.command_handler.get_command(cmd_name) is not None:
+            try:
+                self.logger.info(f"Executing command: {cmd_name}")
+                # Execute the command with the provided arguments
+                self.command_handler.dispatch(cmd_name, args)
+            except Exception as e:
+                self.logger.error(f"Error executing command '{cmd_name}': {e}", exc_info=True)
+                # Handle errors during command execution
+                print(f"Error executing command '{cmd_name}': {e}")
+        elif cmd_name == "exit":
+            self.logger.info("Exiting application.")
+            # Exit the application
+            print("Exiting application...")
+            return False
+        else:
+            self.logger.warning(f"Unknown command: {cmd_name}")
+            # Inform the user if the command is not recognized
+            print(f"No such command: {cmd_name}")
+        return True
+
     def start(self):
         """
         Runs the command loop to process user input.
@@ -97,24 +154,55 @@ class App:
 
             cmd_name = cmd_input[0].lower()  # The first part of the input is the command name
             args = cmd_input[1:]  # Remaining parts are arguments for the command
-            self.logger.info(f"User input received: {cmd_name} {args}")
-    
-            # Check if the command is available in the registered commands
-            if cmd_name in self.command_handler.commands:
-                try:
-                    self.logger.info(f"Executing command: {cmd_name}")
-                    # Execute the command with the provided arguments
-                    self.command_handler.commands[cmd_name].execute(args)
-                except Exception as e:
-                    self.logger.error(f"Error executing command '{cmd_name}': {e}", exc_info=True)
-                    # Handle errors during command execution
-                    print(f"Error executing command '{cmd_name}': {e}")
-            elif cmd_name == "exit":
-                self.logger.info("Exiting application.")
-                # Exit the application
-                print("Exiting application...")
+            if not self.dispatch(cmd_name, args):
                 break  # Exit the loop and terminate the program
-            else:
-                self.logger.warning(f"Unknown command: {cmd_name}")
-                # Inform the user if the command is not recognized
-                print(f"No such command: {cmd_name}")
\ No newline at end of file
+
+    def run_script(self, stream, output=None) -> int:
+        """
+        Runs commands from a file or pipe without prompting.
+
+        Input is read in chunks of about `SCRIPT_READ_HINT` bytes. Each command is
+        dispatched through the command handler exactly as in `start`, but its output is
+        collected in memory and written to `output` once per chunk instead of once per
+        line. Processing stops at the end of the input or at the first `exit` command,
+        and a throughput summary is printed to stderr.
+
+        Parameters:
+        -----------
+        stream (TextIO): The command script, one command per line.
+        output (TextIO, optional): Where command output is written. Defaults to stdout.
+
+        Returns:
+        --------
+        int: The number of commands executed.
+        """
+        output = output or sys.stdout
+        self.logger.info("Application started in script mode.")
+        commands = 0
+        running = True
+        started = time.perf_counter()
+        while running:
+            lines = stream.readlines(SCRIPT_READ_HINT)
+            if not lines:
+                break  # End of input
+            block = io.StringIO()
+            with redirect_stdout(block):
+                for line in lines:
+                    cmd_input = line.split()
+                    if not cmd_input:
+                        continue  # Ignore empty lines
+                    commands += 1
+                    try:
+                        running = self.dispatch(cmd_input[0].lower(), cmd_input[1:])
+                    except SystemExit:
+                        running = False  # The exit command terminates the script
+                    if not running:
+                        break
+            output.write(block.getvalue())
+            output.flush()
+
+        elapsed = time.perf_counter() - started
+        rate = commands / elapsed if elapsed > 0 else float("inf")
+        self.logger.info(f"Script finished: {commands} commands in {elapsed:.3f}s.")
+        print(f"Processed {commands} commands in {elapsed:.3f}s ({rate:,.0f} commands/s).", file=sys.stderr)
+        return commands
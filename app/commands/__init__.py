@@ -1,13 +1,19 @@
 """
 Command Handling System.
 
-This module defines an abstract base class (CLI) for commands and a CommandHandler
-to register and execute commands in the application.
+This module defines an abstract base class (CLI) for commands, a LazyCommand proxy
+for commands whose module has not been imported yet, and a CommandHandler to
+register and execute commands in the application. Commands dispatched through the
+CommandHandler are timed into the shared `command_stats`.
 """
+import importlib
 import logging
+import time
 # Import ABC and abstractmethod to define an abstract base class for commands
 from abc import ABC, abstractmethod  
 
+from app.commands.stats import CommandStats, command_stats
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
@@ -26,9 +32,79 @@ class CLI(ABC):
         Parameters:
         -----------
         args (list): List of arguments passed to the command.
+
+        Returns:
+        --------
+        False if the command failed and already reported the error to the user (e.g. an
+        invalid number or a division by zero); anything else means it succeeded.
         """
         pass  # To be implemented by subclasses
 
+class LazyCommand(CLI):
+    """
+    A placeholder for a command whose plugin module has not been imported yet.
+
+    The module is imported and the command class instantiated on the first call to
+    `execute`. The real command then replaces the placeholder in its `CommandHandler`,
+    so later calls go straight to it.
+    """
+
+    def __init__(self, handler: "CommandHandler", command_name: str, module_name: str, class_name: str):
+        """
+        Initializes a LazyCommand.
+
+        Parameters:
+        -----------
+        handler (CommandHandler): The command handler the command is registered in.
+        command_name (str): The name of the command.
+        module_name (str): The module that defines the command class.
+        class_name (str): The name of the command class.
+        """
+        self.handler = handler
+        self.command_name = command_name
+        self.module_name = module_name
+        self.class_name = class_name
+
+    def resolve(self) -> CLI:
+        """
+        Import the plugin module and replace this placeholder with the real command.
+
+        Returns:
+        --------
+        CLI: The instantiated command.
+
+        Raises:
+        -------
+        ImportError: If the module cannot be imported or does not define the command class.
+        """
+        try:
+            module = importlib.import_module(self.module_name)
+        except Exception as e:
+            self.handler.commands.pop(self.command_name, None)  # Do not retry a broken plugin
+            logger.error(f"❌ Error loading plugin {self.module_name}: {e}")
+            raise ImportError(f"Error loading plugin {self.module_name}: {e}") from e
+
+        command_class = getattr(module, self.class_name, None)
+        if command_class is None:
+            self.handler.commands.pop(self.command_name, None)
+            logger.warning(f"⚠ Warning: {self.class_name} not found in {self.module_name}")
+            raise ImportError(f"{self.class_name} not found in {self.module_name}")
+
+        command = command_class()
+        self.handler.commands[self.command_name] = command
+        logger.info(f"Successfully loaded plugin: {self.module_name} -> {self.class_name}")
+        return command
+
+    def execute(self, args):
+        """
+        Resolve the command and execute it.
+
+        Parameters:
+        -----------
+        args (list): List of arguments passed to the command.
+        """
+        return self.resolve().execute(args)
+
 class CommandHandler:
     """
     A class that manages the registration and execution of commands.
@@ -37,13 +113,25 @@ class CommandHandler:
     -----------
     commands : dict
         A dictionary mapping command names to command instances.
+    stats : CommandStats
+        The counters and latency histograms that `dispatch` records into.
+    fallback : callable or None
+        Called with the name of a command that is not registered; returns a command to
+        register under that name, or None. `load_plugins` uses it to turn operations
+        registered at runtime into commands.
     """
 
-    def __init__(self):
+    def __init__(self, stats: CommandStats = None):
         """
         Initializes a CommandHandler instance with an empty command dictionary.
+
+        Parameters:
+        -----------
+        stats (CommandStats, optional): Where to record dispatch statistics. Defaults to the shared `command_stats`.
         """
         self.commands = {}  # Dictionary to store registered commands
+        self.stats = stats if stats is not None else command_stats
+        self.fallback = None
         logger.info("CommandHandler initialized.")
 
     def register_command(self, command_name: str, command: CLI):
@@ -58,6 +146,71 @@ class CommandHandler:
         self.commands[command_name] = command  # Store the command in the dictionary
         logger.info(f"Command registered: {command_name}")
 
+    def register_lazy_command(self, command_name: str, module_name: str, class_name: str):
+        """
+        Registers a command whose module is imported on first execution.
+
+        Parameters:
+        -----------
+        command_name (str): The name of the command.
+        module_name (str): The module that defines the command class.
+        class_name (str): The name of the command class.
+        """
+        self.commands[command_name] = LazyCommand(self, command_name, module_name, class_name)
+        logger.debug(f"Lazy command registered: {command_name} -> {module_name}.{class_name}")
+
+    def get_command(self, command_name: str):
+        """
+        Return a registered command, asking `fallback` for names that are not registered.
+
+        Parameters:
+        -----------
+        command_name (str): The name of the command.
+
+        Returns:
+        --------
+        CLI or None: The command, or None if there is no such command.
+        """
+        command = self.commands.get(command_name)
+        if command is None and self.fallback is not None:
+            command = self.fallback(command_name)
+            if command is not None:
+                self.commands[command_name] = command  # Later lookups skip the fallback
+                logger.info(f"Command registered by fallback: {command_name}")
+        return command
+
+    def dispatch(self, command_name: str, args: list):
+        """
+        Executes a registered command and records its latency and outcome in `stats`.
+
+        The command counts as failed if it raises, or returns False after handling and
+        printing its own error.
+
+        Parameters:
+        -----------
+        command_name (str): The name of the command to execute.
+        args (list): List of arguments passed to the command.
+
+        Raises:
+        -------
+        KeyError: If the command does not exist in the registry.
+        Exception: Any error raised by the command, after it has been counted.
+        """
+        command = self.get_command(command_name)
+        if command is None:
+            raise KeyError(command_name)
+        failed = False
+        start = time.perf_counter_ns()
+        try:
+            outcome = command.execute(args)
+            failed = outcome is False
+            return outcome
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.stats.record(command_name, time.perf_counter_ns() - start, failed)
+
     def execute_command(self, command_name: str):
         """
         Executes a registered command.
@@ -72,7 +225,7 @@ class CommandHandler:
         """
         try:
             logger.info(f"Executing command: {command_name}")
-            self.commands[command_name].execute([])  # Execute command with empty argument list
+            self.dispatch(command_name, [])  # Execute command with empty argument list
         except KeyError:
             logger.warning(f"No such command: {command_name}")
             print(f"No such command: {command_name}")  # Handle missing command gracefully
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Operation Command.
+
+This module defines the `OperationCommand` class, a generic command that performs any
+operation of the calculator's operation registry by name. `load_plugins` installs it as
+the command handler's fallback, so operations registered at runtime become commands
+without a plugin folder of their own.
+"""
+import logging
+# Import CLI as the base class for commands
+from app.commands import CLI
+
+# Import Calculator to perform registered operations by name
+from calculator import Calculator
+from calculator.numeric import parse_number  # Parses with the active numeric backend
+from calculator.operations import registry
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+class OperationCommand(CLI):
+    """
+    Command class that performs one registered operation.
+
+    Attributes:
+    -----------
+    operation : str
+        The name of the operation in `calculator.operations.registry`.
+    """
+
+    def __init__(self, operation: str):
+        """
+        Initializes an OperationCommand.
+
+        Parameters:
+        -----------
+        operation (str): The name of a registered operation.
+        """
+        self.operation = operation
+
+    def execute(self, args):
+        """
+        Executes the operation.
+
+        Parameters:
+        -----------
+        args (list): List of arguments passed from the command-line input.
+                     Expected format: ["number1", "number2"]
+
+        Error Handling:
+        ---------------
+        - Prints a usage message if incorrect arguments are provided.
+        - Handles ValueError if inputs are not valid numbers.
+        - Prints arithmetic errors raised by the operation (e.g. division by zero).
+        """
+        if len(args) != 2:
+            logger.warning(f"Invalid number of arguments passed to {self.operation} command.")
+            print(f"Usage: {self.operation} <a> <b>")
+            return False
+
+        try:
+            a, b = parse_number(args[0]), parse_number(args[1])  # Convert inputs to numbers
+        except ValueError:
+            logger.error(f"Invalid number input: {args[0]} or {args[1]} is not a valid number.")
+            print(f"Invalid number input: {args[0]} or {args[1]} is not a valid number.")
+            return False
+
+        try:
+            result = Calculator.calculate(self.operation, a, b)
+        except ArithmeticError as e:
+            logger.error(f"{self.operation} failed for {a} and {b}: {e}")
+            print(f"An error occurred: {e}")
+            return False
+        symbol = registry[self.operation].symbol
+        logger.info(f"Operation performed: {a} {symbol} {b} = {result}")
+        print(f"The result of {args[0]} {symbol} {args[1]} is equal to {result}")
@@ -0,0 +1,144 @@
+"""
+Command Statistics.
+
+This module defines the `LatencyHistogram` and `CommandStats` classes used to
+instrument command dispatch, and the shared `command_stats` instance that
+`CommandHandler.dispatch` records into and the `stats` plugin reports from.
+
+Recording a command costs one dictionary lookup and a few integer operations: the
+latency is added to a log-linear histogram instead of being kept as a sample, so
+memory does not grow with the number of commands and percentiles are accurate to
+within about 3%.
+"""
+import logging
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+class LatencyHistogram:
+    """
+    A log-linear histogram of latencies in nanoseconds.
+
+    Each power of two is split into 2**(SUB_BUCKET_BITS - 1) equal buckets, so a
+    bucket is never wider than 1/16 of the values it holds.
+
+    Attributes:
+    -----------
+    counts : dict
+        Number of recorded values per bucket index.
+    total : int
+        Number of recorded values.
+    max_ns : int
+        The largest recorded value.
+    """
+
+    SUB_BUCKET_BITS = 5
+
+    def __init__(self):
+        """Initializes an empty histogram."""
+        self.counts = {}
+        self.total = 0
+        self.max_ns = 0
+
+    def record(self, value_ns: int):
+        """
+        Record one latency.
+
+        Parameters:
+        -----------
+        value_ns (int): The latency in nanoseconds.
+        """
+        shift = max(value_ns.bit_length() - self.SUB_BUCKET_BITS, 0)
+        index = (shift << self.SUB_BUCKET_BITS) | (value_ns >> shift)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def _bucket_bounds(self, index: int) -> tuple:
+        """Return the [lower, upper) bounds of a bucket, in nanoseconds."""
+        shift, mantissa = index >> self.SUB_BUCKET_BITS, index & ((1 << self.SUB_BUCKET_BITS) - 1)
+        return mantissa << shift, (mantissa + 1) << shift
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile of the recorded latencies.
+
+        Parameters:
+        -----------
+        fraction (float): The percentile as a fraction, e.g. 0.95.
+
+        Returns:
+        --------
+        float: The estimated latency in nanoseconds, or 0.0 if nothing was recorded.
+        """
+        if not self.total:
+            return 0.0
+        rank = fraction * self.total
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                lower, upper = self._bucket_bounds(index)
+                return min((lower + upper - 1) / 2, float(self.max_ns))
+        return float(self.max_ns)
+
+class CommandStats:
+    """
+    Per-command counters, error counts and latency histograms.
+
+    Attributes:
+    -----------
+    commands : dict
+        Maps each command name to its `[count, errors, LatencyHistogram]` record.
+    """
+
+    def __init__(self):
+        """Initializes empty statistics."""
+        self.commands = {}
+
+    def record(self, command_name: str, elapsed_ns: int, failed: bool = False):
+        """
+        Record one execution of a command.
+
+        Parameters:
+        -----------
+        command_name (str): The name of the command.
+        elapsed_ns (int): How long the command took, in nanoseconds.
+        failed (bool): Whether the command raised an error.
+        """
+        entry = self.commands.get(command_name)
+        if entry is None:
+            entry = self.commands[command_name] = [0, 0, LatencyHistogram()]
+        entry[0] += 1
+        if failed:
+            entry[1] += 1
+        entry[2].record(elapsed_ns)
+
+    def reset(self):
+        """Forget all recorded executions."""
+        self.commands = {}
+        logger.info("Command statistics reset.")
+
+    def summary(self) -> dict:
+        """
+        Summarize the statistics of every command.
+
+        Returns:
+        --------
+        dict: Per command, its count, errors and p50/p95/p99/max latency in milliseconds.
+        """
+        return {
+            name: {
+                "count": count,
+                "errors": errors,
+                "p50_ms": histogram.percentile(0.50) / 1e6,
+                "p95_ms": histogram.percentile(0.95) / 1e6,
+                "p99_ms": histogram.percentile(0.99) / 1e6,
+                "max_ms": histogram.max_ns / 1e6,
+            }
+            for name, (count, errors, histogram) in sorted(self.commands.items())
+        }
+
+# Shared statistics recorded by every `CommandHandler`
+command_stats = CommandStats()
@@ -0,0 +1,140 @@
+"""
+Queue-Based Logging.
+
+This module moves the root logger's handlers (the rotating log file and the console
+handler from `logging.conf`) behind a `QueueListener`, so that logging a record only
+puts it on a bounded queue and the file I/O and rotation happen on the listener's
+thread instead of in the command loop.
+
+When the queue is full, the `drop` overflow policy discards the new record and counts
+it, so a slow disk never stalls a command; the `block` policy waits for room instead,
+so no record is lost. `stop_queue_logging` writes out every queued record, reports the
+dropped ones and puts the original handlers back on the root logger. It is called by
+the `exit` command, by `App.configure_logging` before reconfiguring, and at interpreter
+exit.
+"""
+import atexit
+import logging
+import logging.handlers
+import queue
+
+OVERFLOW_POLICIES = ("drop", "block")
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    A `QueueHandler` that applies an overflow policy when its queue is full.
+
+    Attributes:
+    -----------
+    overflow : str
+        'drop' to discard records while the queue is full, 'block' to wait for room.
+    dropped : int
+        The number of records discarded so far.
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow: str = "drop"):
+        """
+        Initializes the handler.
+
+        Parameters:
+        -----------
+        log_queue (queue.Queue): The bounded queue records are put on.
+        overflow (str): The overflow policy, 'drop' or 'block'.
+
+        Raises:
+        -------
+        ValueError: If the overflow policy is unknown.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown log queue overflow policy: {overflow}")
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        """Put a record on the queue, or apply the overflow policy if it is full."""
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class DrainingQueueListener(logging.handlers.QueueListener):
+    """A `QueueListener` whose stop signal waits for room in a full queue instead of failing."""
+
+    def enqueue_sentinel(self):
+        """Put the stop signal behind every queued record, waiting if the queue is full."""
+        self.queue.put(self._sentinel)
+
+_listener = None  # The running QueueListener, if queue logging is on
+_handler = None  # The BoundedQueueHandler installed on the root logger
+_handlers = []  # The root handlers moved behind the listener
+
+def start_queue_logging(max_size: int, overflow: str = "drop") -> BoundedQueueHandler:
+    """
+    Move the root logger's handlers behind a bounded queue and a listener thread.
+
+    Any queue logging already running is stopped first.
+
+    Parameters:
+    -----------
+    max_size (int): The largest number of records waiting in the queue.
+    overflow (str): The overflow policy, 'drop' or 'block'.
+
+    Returns:
+    --------
+    BoundedQueueHandler: The handler now installed on the root logger.
+
+    Raises:
+    -------
+    ValueError: If `max_size` is not positive or the overflow policy is unknown.
+    """
+    global _listener, _handler, _handlers
+    if max_size <= 0:
+        raise ValueError(f"Log queue size must be positive, got {max_size}")
+    stop_queue_logging()
+    root = logging.getLogger()
+    handler = BoundedQueueHandler(queue.Queue(max_size), overflow)
+    _handlers = root.handlers[:]
+    _listener = DrainingQueueListener(handler.queue, *_handlers, respect_handler_level=True)
+    _listener.start()
+    _handler = handler
+    root.handlers = [handler]
+    logging.info(f"Queue logging started (queue size {max_size}, overflow policy '{overflow}').")
+    return handler
+
+def stop_queue_logging() -> int:
+    """
+    Write out every queued record and put the original handlers back on the root logger.
+
+    Does nothing if queue logging is not running.
+
+    Returns:
+    --------
+    int: The number of records dropped while the queue was full.
+    """
+    global _listener, _handler, _handlers
+    if _listener is None:
+        return 0
+    root = logging.getLogger()
+    _listener.stop()  # Processes everything still queued, then joins the thread
+    if _handler in root.handlers:
+        root.removeHandler(_handler)
+        for handler in _handlers:
+            root.addHandler(handler)
+    dropped = _handler.dropped
+    _listener = _handler = None
+    _handlers = []
+    for handler in root.handlers:
+        handler.flush()
+    if dropped:
+        logging.warning(f"{dropped} log records were dropped while the log queue was full.")
+    return dropped
+
+def queue_logging_active() -> bool:
+    """Return True if queue logging is running."""
+    return _listener is not None
+
+atexit.register(stop_queue_logging)
@@ -10,6 +10,7 @@ from app.commands import CLI
 
 # Import Calculator to perform arithmetic operations
 from calculator import Calculator  
+from calculator.numeric import parse_number  # Parses with the active numeric backend
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -34,7 +35,7 @@ class addCommand(CLI):
         Functionality:
         --------------
         - Validates that exactly two arguments are provided.
-        - Converts the arguments to floats.
+        - Converts the arguments to numbers of the active numeric backend.
         - Performs addition using `Calculator.add(a, b)`.
         - Displays the result.
         
@@ -46,14 +47,15 @@ class addCommand(CLI):
         if len(args) != 2:
             logging.warning("Invalid number of arguments passed to add command.")
             print("Usage: add <a> <b>")
-            return
+            return False
 
         try:
-            a = float(args[0])  # Convert first argument to float
-            b = float(args[1])  # Convert second argument to float
+            a = parse_number(args[0])  # Convert first argument to a number
+            b = parse_number(args[1])  # Convert second argument to a number
             result = Calculator.add(a, b)  # Perform addition using Calculator
             logging.info(f"Addition operation performed: {a} + {b} = {result}")
             print(f"The result of {int(a)} + {int(b)} is equal to {result}")
         except ValueError:
             logging.error(f"Invalid number input: {args[0]} or {args[1]} is not a valid number.")
-            print(f"Invalid number input: {args[0]} or {args[1]} is not a valid number.")
\ No newline at end of file
+            print(f"Invalid number input: {args[0]} or {args[1]} is not a valid number.")
+            return False
\ No newline at end of file
@@ -11,6 +11,7 @@ from app.commands import CLI
 
 # Import Calculator to perform arithmetic operations
 from calculator import Calculator  
+from calculator.numeric import parse_number  # Parses with the active numeric backend
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -35,7 +36,7 @@ class divideCommand(CLI):
         Functionality:
         --------------
         - Validates that exactly two arguments are provided.
-        - Converts the arguments to floats.
+        - Converts the arguments to numbers of the active numeric backend.
         - Checks for division by zero.
         - Performs division using `Calculator.divide(a, b)`.
         - Displays the result.
@@ -49,15 +50,15 @@ class divideCommand(CLI):
         if len(args) != 2:
             logger.warning("Invalid number of arguments passed to divide command.")
             print("Usage: divide <a> <b>")
-            return
+            return False
 
         try:
-            a, b = float(args[0]), float(args[1])  # Convert inputs to floats
+            a, b = parse_number(args[0]), parse_number(args[1])  # Convert inputs to numbers
 
             if b == 0:
                 logger.error("Attempted division by zero.")
                 print("An error occurred: Cannot divide by zero.")
-                return
+                return False
 
             result = Calculator.divide(a, b)  # Perform division using Calculator
             logger.info(f"Division operation performed: {a} / {b} = {result}")
@@ -65,4 +66,5 @@ class divideCommand(CLI):
 
         except ValueError:
             logger.error(f"Invalid number input: {args[0]} or {args[1]} is not a valid number.")
-            print(f"Invalid number input: {args[0]} or {args[1]} is not a valid number.")
\ No newline at end of file
+            print(f"Invalid number input: {args[0]} or {args[1]} is not a valid number.")
+            return False
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Eval Command.
+
+This module defines the `evalCommand` class, which implements the `execute` method
+to evaluate whole arithmetic expressions in the command-line interface.
+"""
+import logging
+# Import CLI as the base class for commands
+from app.commands import CLI  
+
+# Import Calculator to evaluate expressions
+from calculator import Calculator  
+from calculator.numeric import parse_number  # Parses with the active numeric backend
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+USAGE = "Usage: eval <expression> [name=value ...]"
+
+def parse_eval_args(args) -> tuple:
+    """
+    Split the arguments of `eval` into the expression and its variables.
+
+    Arguments of the form `name=value` are variables; the others, joined with spaces,
+    form the expression, so it may be typed with or without spaces.
+
+    Parameters:
+    -----------
+    args (list): The arguments after `eval`.
+
+    Returns:
+    --------
+    tuple: The expression text and a dict of variable values.
+
+    Raises:
+    -------
+    ValueError: If a variable value is not a number.
+    """
+    parts, variables = [], {}
+    for arg in args:
+        name, separator, value = arg.partition("=")
+        if separator and name.isidentifier():
+            try:
+                variables[name] = parse_number(value)
+            except ValueError:
+                raise ValueError(f"Invalid value for variable {name}: {value}") from None
+        else:
+            parts.append(arg)
+    return " ".join(parts), variables
+
+class evalCommand(CLI):
+    """
+    Command class to evaluate arithmetic expressions.
+
+    This class inherits from `CLI` and implements the `execute` method
+    to evaluate an expression using `Calculator.evaluate`.
+    """
+
+    def execute(self, args):
+        """
+        Executes the eval command.
+
+        Parameters:
+        -----------
+        args (list): List of arguments passed from the command-line input.
+                     Expected format: ["(2", "+", "x)", "*", "4", "x=3"]
+
+        Functionality:
+        --------------
+        - Splits the arguments into the expression and `name=value` variables.
+        - Evaluates the expression using `Calculator.evaluate`, which records it as one history entry.
+        - Displays the result.
+
+        Error Handling:
+        ---------------
+        - Prints a usage message if no expression is given.
+        - Prints the error for invalid expressions, missing variables and division by zero.
+        """
+        try:
+            expression, variables = parse_eval_args(args)
+            if not expression:
+                logger.warning("No expression passed to eval command.")
+                print(USAGE)
+                return False
+            result = Calculator.evaluate(expression, variables)
+            logger.info(f"Expression evaluated: {expression} = {result}")
+            print(f"The result of {expression} is equal to {result}")
+        except (ValueError, ZeroDivisionError) as e:
+            logger.error(f"Error evaluating expression {' '.join(args)}: {e}")
+            print(f"Error: {e}")
+            return False
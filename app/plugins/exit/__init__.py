@@ -8,6 +8,7 @@ to terminate the application.
 # Import CLI as the base class for commands
 import logging
 from app.commands import CLI  
+from app.log_queue import stop_queue_logging
 
 # Import sys to allow program termination
 import sys  
@@ -29,6 +30,7 @@ class exitCommand(CLI):
 
         Functionality:
         --------------
+        - Flushes queued log records, if queue logging is on.
         - Prints an exit message to the console.
         - Terminates the program using `sys.exit()`.
 
@@ -37,5 +39,6 @@ class exitCommand(CLI):
         args (list): List of arguments (not used in this command).
         """
         logger.info("Exit command executed. Application is terminating.")
+        stop_queue_logging()  # Write out queued log records before terminating
         print("Exiting...")  # Inform the user that the application is closing
         sys.exit("Exiting...")  # Terminate the program
\ No newline at end of file
@@ -1,49 +1,257 @@
+import json
 import logging
+import sys
+from itertools import chain
 from app.commands import CLI
-from calculator.calculations import Calculations
+from calculator.calculations import Calculations, HISTORY_COLUMNS
+from calculator.history_reader import HistoryReader
 
 logger = logging.getLogger(__name__)
 
+SHOW_USAGE = "Usage: history show [op] [--file] [--limit N] [--offset N] [--tail N] [--format text|csv|jsonl]"
+SHOW_FORMATS = ("text", "csv", "jsonl")
+WRITE_BATCH_LINES = 1000  # Lines collected before each write to stdout
+
+def parse_show_options(args) -> dict:
+    """
+    Parse the arguments of `history show`.
+
+    Parameters:
+    -----------
+    args (list): The arguments after `show`.
+
+    Returns:
+    --------
+    dict: The operation, file, limit, offset, tail and format options.
+
+    Raises:
+    -------
+    ValueError: If an option is unknown or its value is invalid.
+    """
+    options = {"operation": None, "file": False, "limit": None, "offset": 0, "tail": None, "format": "text"}
+    args = iter(arg.lower() for arg in args)
+    for arg in args:
+        if arg == "--file":
+            options["file"] = True
+        elif arg in ("--limit", "--offset", "--tail"):
+            value = next(args, "")
+            if not value.isdigit():
+                raise ValueError(f"{arg} needs a non-negative integer")
+            options[arg[2:]] = int(value)
+        elif arg == "--format":
+            value = next(args, "")
+            if value not in SHOW_FORMATS:
+                raise ValueError(f"--format must be one of: {', '.join(SHOW_FORMATS)}")
+            options["format"] = value
+        elif arg.startswith("--"):
+            raise ValueError(f"Unknown option: {arg}")
+        elif options["operation"] is None:
+            options["operation"] = arg
+        else:
+            raise ValueError(f"Unexpected argument: {arg}")
+    return options
+
+def write_lines(lines, out=None):
+    """
+    Write lines through one buffered writer, `WRITE_BATCH_LINES` lines per write.
+
+    Parameters:
+    -----------
+    lines (Iterable[str]): The lines to write, without line endings.
+    out (TextIO, optional): Where to write. Defaults to stdout.
+    """
+    out = out or sys.stdout
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= WRITE_BATCH_LINES:
+            out.write("\n".join(batch) + "\n")
+            batch.clear()
+    if batch:
+        out.write("\n".join(batch) + "\n")
+    out.flush()
+
+def _memory_entries(operation, offset, limit, tail):
+    """
+    Yield (number, a, b, operation, result, error) for the selected in-memory history entries.
+
+    Entries are numbered by their position in the whole history, also when only one
+    operation is shown, so the numbers match those of `history show --file`.
+    """
+    history = Calculations.get_history() if operation is None else Calculations.find_by_operation(operation)
+    selected = range(len(history))
+    if tail is not None:
+        selected = selected[max(len(selected) - tail, 0):]
+    selected = selected[offset:] if limit is None else selected[offset:offset + limit]
+    for i in selected:
+        calc = history[i]
+        yield calc.position + 1, calc.a, calc.b, calc.operation.__name__, calc.result, calc.error
+
+def _file_entries(operation, offset, limit, tail):
+    """Yield (number, a, b, operation, result, error) for the selected history file entries."""
+    reader = HistoryReader()
+    if tail is not None:
+        rows = reader.tail(tail, operation)
+        rows = rows[offset:] if limit is None else rows[offset:offset + limit]
+    else:
+        rows = reader.rows(operation, offset, limit)
+    for row in rows:
+        yield row.position + 1, row.a, row.b, row.operation, row.result, None
+
+def _format_text(entry) -> str:
+    """Format one entry for display."""
+    number, a, b, operation, result, error = entry
+    if error is not None:
+        return f"{number}. {a} {operation} {b} failed: {error}"
+    return f"{number}. {a} {operation} {b} equal to {result}"
+
+def _format_csv(entry) -> str:
+    """Format one entry as a row of the CSV history format; a failed entry has no result."""
+    _, a, b, operation, result, error = entry
+    return f"{a},{b},{operation},{'' if error is not None else result}"
+
+def _format_jsonl(entry) -> str:
+    """Format one entry as a JSON object on one line; exact Decimal and Fraction values are strings."""
+    number, a, b, operation, result, error = entry
+    return json.dumps({
+        "entry": number, "a": a, "b": b, "operation": operation,
+        "result": None if error is not None else result, "error": None if error is None else str(error),
+    }, default=str)
+
 class historyCommand(CLI):
     """
     Command class to manage calculation history.
     
     Supports:
-    - Viewing history (`history show`)
+    - Viewing history (`history show`), optionally of one operation (`history show <op>`),
+      paged with `--limit/--offset/--tail` and as `--format csv` or `--format jsonl`
+    - Viewing the history file without loading it (`history show --file [op]`)
+    - Counting the entries in the history file (`history count [op]`)
+    - Showing counts and result sum/min/max/mean per operation (`history stats`)
     - Saving history (`history save`)
     - Loading history (`history load`)
     - Clearing history (`history clear`)
+    - Compacting the history file (`history compact`)
+    - Converting the history file to CSV or binary (`history convert <file>`)
     """
 
     def execute(self, args):
         """Executes the history command with the given arguments."""
         if not args:
-            print("Usage: history <show|save|load|clear>")
+            print("Usage: history <show|count|stats|save|load|clear|compact|convert>")
             return
 
         action = args[0].lower()
 
         if action == "show":
-            self.show_history()
+            try:
+                options = parse_show_options(args[1:])
+            except ValueError as e:
+                print(f"❌ {e}")
+                print(SHOW_USAGE)
+                return
+            self.show_history(options["operation"], options["offset"], options["limit"], options["tail"],
+                              options["format"], options["file"])
+        elif action == "count":
+            self.count_history(args[1].lower() if len(args) > 1 else None)
+        elif action == "stats":
+            self.stats_history()
         elif action == "save":
             self.save_history()
         elif action == "load":
             self.load_history()
         elif action == "clear":
             self.clear_history()
+        elif action == "compact":
+            self.compact_history()
+        elif action == "convert":
+            if len(args) < 2:
+                print("Usage: history convert <file.csv|file.npy>")
+                return
+            self.convert_history(args[1])
+        else:
+            print("Invalid history command. Use: history <show|count|stats|save|load|clear|compact|convert>")
+
+    def show_history(self, operation=None, offset=0, limit=None, tail=None, output_format="text", from_file=False):
+        """
+        Displays calculation history from the stored results, without recomputing.
+
+        Entries are produced by a generator and written through one buffered writer,
+        so showing a page of a large history costs only that page.
+
+        Parameters:
+        -----------
+        operation (str, optional): Only show entries of this operation (e.g., 'add').
+        offset (int): The number of entries to skip.
+        limit (int, optional): The largest number of entries to show.
+        tail (int, optional): Only consider the last `tail` entries.
+        output_format (str): 'text', or 'csv'/'jsonl' for machine-readable output.
+        from_file (bool): Read the history file instead of the in-memory history.
+        """
+        source = _file_entries if from_file else _memory_entries
+        entries = source(operation, offset, limit, tail)
+        try:
+            first = next(entries, None)
+        except FileNotFoundError:
+            print("📜 No history file found.")
+            return
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+
+        if output_format == "text":
+            if first is None:
+                print("📜 No history available." if operation is None else f"📜 No {operation} history available.")
+                return
+            title = "History File" if from_file else "Calculation History"
+            header = [f"\n📜 {title}:" if operation is None else f"\n📜 {title} ({operation}):"]
+            formatter = _format_text
+        elif output_format == "csv":
+            header, formatter = [",".join(HISTORY_COLUMNS)], _format_csv
         else:
-            print("Invalid history command. Use: history <show|save|load|clear>")
+            header, formatter = [], _format_jsonl
+
+        rows = map(formatter, chain([first], entries)) if first is not None else []
+        write_lines(chain(header, rows))
+
+    def count_history(self, operation=None):
+        """
+        Counts the entries of the history file, or only those of one operation.
 
-    def show_history(self):
-        """Displays calculation history."""
-        history = Calculations.get_history()
-        if not history:
-            print("📜 No history available.")
+        Parameters:
+        -----------
+        operation (str, optional): The operation to count (e.g., 'divide').
+        """
+        try:
+            count = HistoryReader().count(operation)
+        except FileNotFoundError:
+            print("📜 No history file found.")
             return
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+        print(f"📜 {count} {operation + ' ' if operation else ''}entries in the history file.")
 
-        print("\n📜 Calculation History:")
-        for i, calc in enumerate(history, start=1):
-            print(f"{i}. {calc.a} {calc.operation.__name__} {calc.b} equal to {calc.perform()}")
+    def stats_history(self):
+        """
+        Displays the entry count and the sum, min, max and mean of the results, per
+        operation and in total, from the running aggregates of the in-memory history.
+        """
+        stats = Calculations.get_stats()
+        if not stats["total"]["count"]:
+            print("📊 No history available.")
+            return
+        lines = [f"\n📊 History Statistics ({stats['total']['count']} entries):"]
+        rows = list(stats["operations"].items()) + [("total", stats["total"])]
+        width = max(len(name) for name, _ in rows)
+        for name, row in rows:
+            line = f"{name.ljust(width)} : count {row['count']}"
+            if row["mean"] is not None:
+                line += f", sum {row['sum']}, min {row['min']}, max {row['max']}, mean {row['mean']}"
+            if row["errors"]:
+                line += f", errors {row['errors']}"
+            lines.append(line)
+        write_lines(lines)
 
     def save_history(self):
         """Saves history to a CSV file."""
@@ -58,4 +266,14 @@ class historyCommand(CLI):
     def clear_history(self):
         """Clears the history."""
         Calculations.clear_history()
-        print("🗑️ History cleared.")
\ No newline at end of file
+        print("🗑️ History cleared.")
+
+    def compact_history(self):
+        """Compacts the history file written in journal mode."""
+        Calculations.compact_history()
+        print("✅ History file compacted.")
+
+    def convert_history(self, target):
+        """Converts the history file to the format given by the target file extension."""
+        Calculations.convert_history(target)
+        print(f"✅ History file converted to {target}.")
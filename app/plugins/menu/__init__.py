@@ -7,11 +7,14 @@ to display the available commands in the application.
 
 # Import CLI as the base class for commands
 import logging
+import sys
 from app.commands import CLI  
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+_BUILT_IN_OPERATIONS = ("add", "subtract", "multiply", "divide")  # Listed above with their own plugins
+
 class menuCommand(CLI):
     """
     Command class to display the available commands in the application.
@@ -38,8 +41,26 @@ class menuCommand(CLI):
         print("- subtract <a> <b>  : Perform subtraction")
         print("- multiply <a> <b>  : Perform multiplication")
         print("- divide <a> <b>    : Perform division")
+        print("- eval <expr> [x=1] : Evaluate an expression, e.g. eval (2 + x) * 4 / 7 x=3")
         print("- history show      : View calculation history")
+        print("- history show <op> : View history of one operation")
+        print("    show options    : --file (read the history file) --limit N --offset N --tail N --format text|csv|jsonl")
+        print("- history count [op]: Count the entries in the history file")
+        print("- history stats     : Show counts and result sum/min/max/mean per operation")
         print("- history save      : Save history to file")
         print("- history load      : Load history from file")
         print("- history clear     : Clear history")
-        print("- exit              : Exit the application")
\ No newline at end of file
+        print("- history compact   : Compact the history file")
+        print("- history convert   : Convert the history file (history convert <file.csv|file.npy>)")
+        print("- stats [reset]     : Show (or reset) command counts and latencies")
+        print("- exit              : Exit the application")
+        for operation in self._extra_operations():
+            print(f"- {operation} <a> <b>".ljust(20) + f": Perform {operation} (registered operation)")
+
+    @staticmethod
+    def _extra_operations() -> list:
+        """Return the names of the operations registered beyond the built-in ones, if any."""
+        operations = sys.modules.get("calculator.operations")
+        if operations is None:
+            return []
+        return [operation.name for operation in operations.registry if operation.name not in _BUILT_IN_OPERATIONS]
\ No newline at end of file
@@ -11,6 +11,7 @@ from app.commands import CLI
 
 # Import Calculator to perform arithmetic operations
 from calculator import Calculator  
+from calculator.numeric import parse_number  # Parses with the active numeric backend
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -35,7 +36,7 @@ class multiplyCommand(CLI):
         Functionality:
         --------------
         - Validates that exactly two arguments are provided.
-        - Converts the arguments to floats.
+        - Converts the arguments to numbers of the active numeric backend.
         - Performs multiplication using `Calculator.multiply(a, b)`.
         - Displays the result.
 
@@ -47,15 +48,16 @@ class multiplyCommand(CLI):
         if len(args) != 2:
             logger.warning("Invalid number of arguments passed to multiply command.")
             print("Usage: multiply <a> <b>")
-            return
+            return False
 
         try:
-            a = float(args[0])  # Convert first argument to float
-            b = float(args[1])  # Convert second argument to float
+            a = parse_number(args[0])  # Convert first argument to a number
+            b = parse_number(args[1])  # Convert second argument to a number
             result = Calculator.multiply(a, b)  # Perform multiplication using Calculator
             logger.info(f"Multiplication operation performed: {a} x {b} = {result}")
             print(f"The result of {int(a)} x {int(b)} is equal to {result}")
 
         except ValueError:
             logger.error(f"Invalid number input: {args[0]} or {args[1]} is not a valid number.")
-            print(f"Invalid number input: {args[0]} or {args[1]} is not a valid number.")
\ No newline at end of file
+            print(f"Invalid number input: {args[0]} or {args[1]} is not a valid number.")
+            return False
\ No newline at end of file
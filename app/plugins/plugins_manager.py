@@ -1,56 +1,139 @@
-import importlib
+import json
 import logging
 import os
+import sys
 from app.commands import CommandHandler
 
 PLUGIN_FOLDER = "app.plugins"
+PLUGIN_PATH = os.path.dirname(__file__)  # Path to the plugins directory
+
+# Cached plugin manifest, rebuilt whenever a plugin directory's mtime changes. It is kept
+# in __pycache__ so that writing it does not change the plugins directory's own mtime.
+MANIFEST_PATH = os.path.join(PLUGIN_PATH, "__pycache__", "plugin_manifest.json")
+MANIFEST_VERSION = 1
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+def _directory_mtimes(folders) -> dict:
+    """
+    Return the modification times of the plugins directory and the given plugin folders.
+
+    Adding or removing a plugin changes the plugins directory's mtime; adding or removing
+    a plugin's `__init__.py` changes that plugin folder's mtime.
+    """
+    mtimes = {".": os.stat(PLUGIN_PATH).st_mtime_ns}
+    for folder in folders:
+        try:
+            mtimes[folder] = os.stat(os.path.join(PLUGIN_PATH, folder)).st_mtime_ns
+        except OSError:
+            mtimes[folder] = None  # The plugin folder was removed
+    return mtimes
+
+def build_manifest() -> dict:
+    """
+    Scan the plugins directory and build a manifest of the available plugins.
+
+    Each subdirectory containing an `__init__.py` file is a plugin. Its command class
+    name is expected to follow the pattern `<plugin_name>Command` (e.g., `addCommand`
+    for the `add` plugin). Modules are not imported.
+
+    Returns:
+    --------
+    dict
+        The manifest: its version, the directory mtimes it was built from, and the
+        module path and class name of each plugin command.
+    """
+    plugins = {}
+    for folder in sorted(os.listdir(PLUGIN_PATH)):
+        plugin_dir = os.path.join(PLUGIN_PATH, folder)
+
+        # Ensure the folder is a directory and contains an __init__.py file (valid Python package)
+        if os.path.isdir(plugin_dir) and "__init__.py" in os.listdir(plugin_dir):
+            plugins[folder] = {
+                "module": f"{PLUGIN_FOLDER}.{folder}",  # Convert folder name to module path
+                "class": f"{folder}Command",  # e.g., "addCommand" for "add" folder
+            }
+    return {"version": MANIFEST_VERSION, "mtimes": _directory_mtimes(plugins), "plugins": plugins}
+
+def load_manifest() -> dict:
+    """
+    Return the plugin manifest, from the cache file when it is still valid.
+
+    The cached manifest is valid when its version matches and none of the directory
+    mtimes it recorded have changed. Otherwise the plugins directory is scanned again
+    and the cache file rewritten.
+
+    Returns:
+    --------
+    dict
+        The plugin manifest (see `build_manifest`).
+    """
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+        folders = [folder for folder in manifest["mtimes"] if folder != "."]
+        if manifest.get("version") == MANIFEST_VERSION and manifest["mtimes"] == _directory_mtimes(folders):
+            logger.debug("Using cached plugin manifest.")
+            return manifest
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing or unreadable cache; rebuild it below
+
+    try:
+        os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+    except OSError:
+        pass  # Reported when the manifest cannot be written below
+    manifest = build_manifest()
+    try:
+        with open(MANIFEST_PATH, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+        logger.info(f"Plugin manifest rebuilt with {len(manifest['plugins'])} plugins.")
+    except OSError as e:
+        logger.warning(f"⚠ Warning: could not write plugin manifest {MANIFEST_PATH}: {e}")
+    return manifest
+
+def operation_command(command_name: str):
+    """
+    Return a command for a registered operation that has no plugin of its own.
+
+    The calculator is not imported here: operations can only have been registered
+    once it is, so an unknown name before then is simply not a command.
+
+    Parameters:
+    -----------
+    command_name (str): The command name, looked up as an operation name.
+
+    Returns:
+    --------
+    OperationCommand or None: The command, or None if no such operation is registered.
+    """
+    operations = sys.modules.get("calculator.operations")
+    if operations is None or command_name not in operations.registry:
+        return None
+    from app.commands.operation import OperationCommand  # Imports the calculator, which is loaded already
+    return OperationCommand(command_name)
+
 def load_plugins():
     """
-    Dynamically load all plugins from subdirectories within the plugins folder.
+    Register all plugins from the plugins folder without importing them.
 
-    This function scans the plugins directory for subdirectories. Each subdirectory is
-    treated as a plugin module and must contain an `__init__.py` file to be considered valid.
-    The function attempts to dynamically import each plugin and register its corresponding command
-    class with the `CommandHandler`. The class name is expected to follow the pattern 
-    `<plugin_name>Command` (e.g., `addCommand` for the `add` plugin).
+    The plugins are read from the cached plugin manifest (see `load_manifest`). Each
+    command is registered with the `CommandHandler` as a lazy command: its module is
+    imported and its `<plugin_name>Command` class instantiated on first dispatch, so
+    startup cost does not grow with the number of plugins.
+
+    Operations registered in `calculator.operations.registry` that have no plugin of
+    their own are dispatched through the handler's fallback (see `operation_command`).
 
     Returns:
     --------
     CommandHandler
-        The command handler instance populated with the dynamically loaded commands from the plugins.
+        The command handler instance populated with the plugin commands.
     """
     command_handler = CommandHandler()  # Initialize a new CommandHandler instance
-    plugin_path = os.path.dirname(__file__)  # Get the path to the plugins directory
 
-    # Iterate over the items in the plugins directory
-    for folder in os.listdir(plugin_path):
-        plugin_dir = os.path.join(plugin_path, folder)
-        
-        # Ensure the folder is a directory and contains an __init__.py file (valid Python package)
-        if os.path.isdir(plugin_dir) and "__init__.py" in os.listdir(plugin_dir):
-            module_name = f"{PLUGIN_FOLDER}.{folder}"  # Convert folder name to module path
-            
-            try:
-                # Dynamically import the plugin module
-                module = importlib.import_module(module_name)
-                
-                # Construct the expected command class name based on the folder name
-                command_class_name = f"{folder}Command"  # e.g., "addCommand" for "add" folder
-                
-                # Get the command class dynamically from the module
-                command_class = getattr(module, command_class_name, None)
-
-                # Register the command class if found
-                if command_class:
-                    command_handler.register_command(folder, command_class())  # Register the command
-                    logger.info(f"Successfully loaded plugin: {module_name} -> {command_class_name}")
-                else:
-                    logger.warning(f"⚠ Warning: {command_class_name} not found in {module_name}")
-            except Exception as e:
-                logger.error(f"❌ Error loading plugin {module_name}: {e}")
-
-    return command_handler  # Return the populated command handler
\ No newline at end of file
+    for command_name, plugin in load_manifest()["plugins"].items():
+        command_handler.register_lazy_command(command_name, plugin["module"], plugin["class"])
+    command_handler.fallback = operation_command
+
+    return command_handler  # Return the populated command handler
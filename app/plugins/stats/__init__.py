@@ -0,0 +1,49 @@
+"""
+Stats Command.
+
+This module defines the `statsCommand` class, which prints the per-command counters,
+error counts and latency percentiles recorded by the command handler, or resets them.
+"""
+
+# Import CLI as the base class for commands
+import logging
+from app.commands import CLI, command_stats
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+class statsCommand(CLI):
+    """
+    Command class to display or reset command statistics.
+
+    Supports:
+    - Viewing statistics (`stats`)
+    - Resetting statistics (`stats reset`)
+    """
+
+    def execute(self, args):
+        """
+        Executes the stats command.
+
+        Parameters:
+        -----------
+        args (list): Empty to show the statistics, or ['reset'] to clear them.
+        """
+        if args and args[0].lower() == "reset":
+            command_stats.reset()
+            print("📊 Command statistics reset.")
+            return
+        if args:
+            print("Usage: stats [reset]")
+            return
+
+        summary = command_stats.summary()
+        if not summary:
+            print("📊 No commands recorded yet.")
+            return
+        logger.info(f"Displaying statistics for {len(summary)} commands.")
+        lines = ["📊 Command Statistics:", f"{'command':<10} {'count':>7} {'errors':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"]
+        for name, stats in summary.items():
+            lines.append(f"{name:<10} {stats['count']:>7} {stats['errors']:>7} "
+                         f"{stats['p50_ms']:>9.3f} {stats['p95_ms']:>9.3f} {stats['p99_ms']:>9.3f}")
+        print("\n".join(lines))
@@ -0,0 +1,7 @@
+"""
+Benchmarks Package.
+
+This package contains standalone benchmark scripts for the calculator. Each module
+exposes a `run()` function returning its measurements as a dictionary and can be
+executed directly, e.g. `python -m benchmarks.bench_batch`.
+"""
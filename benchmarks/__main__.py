@@ -0,0 +1,93 @@
+"""
+Benchmark Runner.
+
+Runs the benchmark modules and prints one JSON document with their results and the
+environment they ran in, so that runs can be saved and compared over time.
+
+Run with:
+    python -m benchmarks [name ...] [--output FILE]
+
+Names may be given with or without the `bench_` prefix; all benchmarks run if none
+are given.
+"""
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+import numpy as np
+
+BENCHMARKS = (
+    "bench_calculator",
+    "bench_logging",
+    "bench_result_cache",
+    "bench_numeric_backends",
+    "bench_batch",
+    "bench_parallel_batch",
+    "bench_history_memory",
+    "bench_history_save",
+    "bench_history_load",
+    "bench_history_format",
+    "bench_history_threads",
+    "bench_history_stats",
+    "bench_startup",
+    "bench_repl",
+)
+
+def _git_commit():
+    """Return the current git commit, or None outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None) -> dict:
+    """
+    Run the selected benchmarks and emit their results as JSON.
+
+    Parameters:
+    -----------
+    argv (list, optional): Command-line arguments; defaults to `sys.argv[1:]`.
+
+    Returns:
+    --------
+    dict: The report, with a `meta` and a `results` section.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the calculator benchmarks.")
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    names = [name if name.startswith("bench_") else f"bench_{name}" for name in args.names] or list(BENCHMARKS)
+    unknown = sorted(set(names) - set(BENCHMARKS))
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = {}
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        results[name] = importlib.import_module(f"benchmarks.{name}").run()
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+    return report
+
+if __name__ == "__main__":
+    main()
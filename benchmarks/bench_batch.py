@@ -0,0 +1,68 @@
+"""
+Batch Evaluation Benchmark.
+
+Compares `Calculator.evaluate_batch` with a Python loop calling `Calculator.add`
+once per operand pair. Logging is disabled while timing so that the numbers reflect
+the calculation and history cost rather than log handler I/O.
+
+Run with:
+    python -m benchmarks.bench_batch
+"""
+import json
+import logging
+import time
+
+import numpy as np
+
+from calculator import Calculator
+from calculator.calculations import Calculations
+
+def _time(func, repeat: int = 3) -> float:
+    """Return the best wall-clock time of `repeat` calls to `func`, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        Calculations.history.clear()  # Keep history growth out of the measurement
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(sizes=(1_000, 10_000, 100_000)) -> dict:
+    """
+    Time the per-call loop against the batch API for each size.
+
+    Parameters:
+    -----------
+    sizes (Iterable[int]): Numbers of operand pairs to evaluate.
+
+    Returns:
+    --------
+    dict: Per-size timings in seconds and the batch speedup.
+    """
+    rng = np.random.default_rng(0)
+    results = {}
+    logging.disable(logging.CRITICAL)
+    try:
+        for size in sizes:
+            a = rng.uniform(-1e6, 1e6, size)
+            b = rng.uniform(-1e6, 1e6, size)
+            a_list, b_list = a.tolist(), b.tolist()
+
+            def loop():
+                for x, y in zip(a_list, b_list):
+                    Calculator.add(x, y)
+
+            loop_seconds = _time(loop)
+            batch_seconds = _time(lambda: Calculator.evaluate_batch("add", a, b))
+            results[size] = {
+                "loop_seconds": loop_seconds,
+                "batch_seconds": batch_seconds,
+                "speedup": loop_seconds / batch_seconds,
+            }
+    finally:
+        logging.disable(logging.NOTSET)
+        Calculations.history.clear()
+    return results
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,68 @@
+"""
+Calculator Latency Benchmark.
+
+Measures the per-call latency of `Calculator.add`, `subtract`, `multiply` and
+`divide` with `Decimal` operands, including the history entry each call records.
+Logging is disabled by default, so the numbers reflect the calculation and history
+cost rather than log handler I/O.
+
+Run with:
+    python -m benchmarks.bench_calculator
+"""
+import json
+import logging
+import statistics
+import time
+from decimal import Decimal
+
+from calculator import Calculator
+from calculator.calculations import Calculations
+from calculator.log_guards import refresh_log_guards
+
+OPERATION_NAMES = ("add", "subtract", "multiply", "divide")
+
+def _per_call_ns(func, a, b, calls: int) -> float:
+    """Return the mean latency of `calls` calls to `func(a, b)`, in nanoseconds."""
+    Calculations.history.clear()  # Keep history growth out of the measurement
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        func(a, b)
+    return (time.perf_counter_ns() - start) / calls
+
+def run(calls: int = 10_000, repeat: int = 5, log_level: int = None) -> dict:
+    """
+    Time each Calculator operation.
+
+    Parameters:
+    -----------
+    calls (int): Calls per timing sample.
+    repeat (int): Number of timing samples per operation.
+    log_level (int, optional): A logging level to run at; logging is disabled if None.
+
+    Returns:
+    --------
+    dict: Per-operation best and median latency in nanoseconds per call.
+    """
+    a, b = Decimal("12.5"), Decimal("3.25")
+    results = {}
+    root = logging.getLogger()
+    saved_level = root.level
+    if log_level is None:
+        logging.disable(logging.CRITICAL)
+    else:
+        root.setLevel(log_level)
+    refresh_log_guards()
+    try:
+        for name in OPERATION_NAMES:
+            func = getattr(Calculator, name)
+            samples = [_per_call_ns(func, a, b, calls) for _ in range(repeat)]
+            results[name] = {"best_ns": min(samples), "median_ns": statistics.median(samples)}
+    finally:
+        logging.disable(logging.NOTSET)
+        root.setLevel(saved_level)
+        refresh_log_guards()
+        Calculations.history.clear()
+    return results
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,74 @@
+"""
+History Format Benchmark.
+
+Compares saving and loading the history as CSV and as a binary `.npy` history file,
+for histories of different sizes.
+
+Run with:
+    python -m benchmarks.bench_history_format
+"""
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+import numpy as np
+
+from calculator.config import history_config
+from calculator.calculations import Calculations
+from calculator.operations import OPERATIONS
+
+def _time(func) -> float:
+    """Return the wall-clock time of one call to `func`, in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def _fill_history(size: int):
+    """Replace the history with `size` random entries."""
+    rng = np.random.default_rng(0)
+    a, b = rng.uniform(-1e6, 1e6, size), rng.uniform(1, 1e6, size)
+    Calculations.history.clear()
+    Calculations.history.extend(rng.integers(0, len(OPERATIONS), size).astype(np.int8), a, b, a + b)
+
+def run(sizes=(1_000, 10_000, 100_000, 1_000_000)) -> dict:
+    """
+    Time a save and a load of each history size in each format.
+
+    Parameters:
+    -----------
+    sizes (Iterable[int]): Numbers of history entries.
+
+    Returns:
+    --------
+    dict: Per-size save and load times in seconds, and file sizes in bytes, per format.
+    """
+    results = {}
+    saved_file, saved_mode = history_config.history_file, history_config.history_mode
+    logging.disable(logging.CRITICAL)
+    try:
+        with tempfile.TemporaryDirectory() as directory, redirect_stdout(StringIO()):
+            history_config.history_mode = "rewrite"
+            for size in sizes:
+                results[size] = {}
+                for extension in ("csv", "npy"):
+                    history_config.history_file = os.path.join(directory, f"history.{extension}")
+                    _fill_history(size)
+                    save = _time(Calculations.save_history)
+                    load = _time(Calculations.load_history)
+                    results[size][extension] = {
+                        "save": save, "load": load, "bytes": os.path.getsize(history_config.history_file)
+                    }
+                results[size]["save_speedup"] = results[size]["csv"]["save"] / results[size]["npy"]["save"]
+                results[size]["load_speedup"] = results[size]["csv"]["load"] / results[size]["npy"]["load"]
+    finally:
+        history_config.history_file, history_config.history_mode = saved_file, saved_mode
+        Calculations.history.clear()
+        logging.disable(logging.NOTSET)
+    return results
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,100 @@
+"""
+History Load Benchmark.
+
+Compares `Calculations.load_history`, whole-file and chunked, with the previous
+loader that walked the CSV with `DataFrame.iterrows()`, built a `Decimal` per cell
+and mapped each operation name through an if/elif chain.
+
+Run with:
+    python -m benchmarks.bench_history_load
+"""
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import redirect_stdout
+from decimal import Decimal
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+from calculator.config import history_config
+from calculator.calculation import Calculation
+from calculator.calculations import Calculations
+from calculator.operations import add, subtract, multiply, divide, OPERATIONS
+
+def _load_iterrows(history_file: str) -> list:
+    """The previous row-by-row loader, kept here as the baseline."""
+    history = []
+    for _, row in pd.read_csv(history_file).iterrows():
+        operand1 = Decimal(row["Operand1"])
+        operand2 = Decimal(row["Operand2"])
+        operation_name = row["Operation"]
+        if operation_name == "add":
+            operation = add
+        elif operation_name == "subtract":
+            operation = subtract
+        elif operation_name == "multiply":
+            operation = multiply
+        elif operation_name == "divide":
+            operation = divide
+        else:
+            continue
+        history.append(Calculation(operand1, operand2, operation))
+    return history
+
+def _write_history(history_file: str, size: int):
+    """Write a random history file of `size` rows."""
+    rng = np.random.default_rng(0)
+    a, b = rng.uniform(-1e6, 1e6, size), rng.uniform(1, 1e6, size)
+    names = np.array([operation.__name__ for operation in OPERATIONS])
+    pd.DataFrame({
+        "Operand1": a, "Operand2": b, "Operation": names[rng.integers(0, len(names), size)], "Result": a + b
+    }).to_csv(history_file, index=False)
+
+def _time(func) -> float:
+    """Return the wall-clock time of one call to `func`, in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def run(sizes=(10_000, 100_000), iterrows_limit: int = 100_000, chunksize: int = 100_000) -> dict:
+    """
+    Time each loader for each history file size.
+
+    Parameters:
+    -----------
+    sizes (Iterable[int]): Numbers of rows in the history file.
+    iterrows_limit (int): The largest size the slow iterrows baseline is run for.
+    chunksize (int): Rows per chunk for the chunked loader.
+
+    Returns:
+    --------
+    dict: Per-size load times in seconds.
+    """
+    results = {}
+    saved_file = history_config.history_file
+    logging.disable(logging.CRITICAL)
+    try:
+        with tempfile.TemporaryDirectory() as directory, redirect_stdout(StringIO()):
+            history_config.history_file = os.path.join(directory, "history.csv")
+            for size in sizes:
+                _write_history(history_config.history_file, size)
+                timings = {
+                    "vectorized": _time(Calculations.load_history),
+                    "chunked": _time(lambda: Calculations.load_history(chunksize=chunksize)),
+                }
+                if size <= iterrows_limit:
+                    timings["iterrows"] = _time(lambda: _load_iterrows(history_config.history_file))
+                    timings["speedup"] = timings["iterrows"] / timings["vectorized"]
+                results[size] = timings
+    finally:
+        history_config.history_file = saved_file
+        Calculations.history.clear()
+        logging.disable(logging.NOTSET)
+    return results
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
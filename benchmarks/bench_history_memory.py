@@ -0,0 +1,73 @@
+"""
+History Memory Benchmark.
+
+Reports the bytes per history entry of the columnar `HistoryStore` against a Python
+list of `Calculation` objects, as `Calculations.history` used to be. Memory is
+measured with `tracemalloc`, so it includes the operand objects held by each
+`Calculation`.
+
+Run with:
+    python -m benchmarks.bench_history_memory
+"""
+import json
+import logging
+import tracemalloc
+from decimal import Decimal
+
+import numpy as np
+
+from calculator.calculation import Calculation
+from calculator.history_store import HistoryStore
+from calculator.operations import add, OP_CODES
+
+def _measure(build) -> int:
+    """Return the number of bytes still allocated by the object `build()` returns."""
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    kept = build()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return end - start
+
+def run(sizes=(10_000, 100_000, 1_000_000)) -> dict:
+    """
+    Measure bytes per entry for each history layout and size.
+
+    Parameters:
+    -----------
+    sizes (Iterable[int]): Numbers of history entries to build.
+
+    Returns:
+    --------
+    dict: Per-size bytes per entry for each layout.
+    """
+    results = {}
+    logging.disable(logging.CRITICAL)
+    try:
+        for size in sizes:
+            operands = np.random.default_rng(0).uniform(-1e6, 1e6, size)
+            floats = operands.tolist()
+
+            def float_list():
+                return [Calculation(x * 1.0, x * 2.0, add) for x in floats]  # Fresh float objects per entry
+
+            def decimal_list():
+                return [Calculation(Decimal(x), Decimal(x), add) for x in floats]
+
+            def columnar():
+                store = HistoryStore()
+                store.extend(OP_CODES["add"], operands, operands, operands + operands)
+                return store
+
+            results[size] = {
+                "list_of_float_calculations": _measure(float_list) / size,
+                "list_of_decimal_calculations": _measure(decimal_list) / size,
+                "columnar_store": _measure(columnar) / size,
+            }
+    finally:
+        logging.disable(logging.NOTSET)
+    return results
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,73 @@
+"""
+History Save Benchmark.
+
+Measures the cost of saving history after 10 new operations, for histories of
+different sizes, in the default 'rewrite' mode and in 'journal' mode. A journal save
+should cost about the same as saving a 10-row history, whatever the history size.
+
+Run with:
+    python -m benchmarks.bench_history_save
+"""
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+import numpy as np
+
+from calculator.config import history_config
+from calculator.calculations import Calculations
+from calculator.operations import OP_CODES
+
+NEW_OPERATIONS = 10  # Entries added between the two saves
+
+def _time_save(size: int, mode: str, history_file: str) -> float:
+    """Save a `size`-row history, add NEW_OPERATIONS entries, and time the second save."""
+    history_config.history_mode = mode
+    Calculations.history.clear()
+    if os.path.exists(history_file):
+        os.remove(history_file)
+    operands = np.arange(size, dtype=np.float64)
+    Calculations.history.extend(OP_CODES["add"], operands, operands, operands + operands)
+    Calculations.save_history()
+
+    extra = np.ones(NEW_OPERATIONS)
+    Calculations.history.extend(OP_CODES["multiply"], extra, extra, extra)
+    start = time.perf_counter()
+    Calculations.save_history()
+    return time.perf_counter() - start
+
+def run(sizes=(10, 100_000, 1_000_000)) -> dict:
+    """
+    Time the second save for each size and persistence mode.
+
+    Parameters:
+    -----------
+    sizes (Iterable[int]): History sizes before the new operations are added.
+
+    Returns:
+    --------
+    dict: Per-size save time in seconds for each mode.
+    """
+    results = {}
+    saved_file, saved_mode = history_config.history_file, history_config.history_mode
+    logging.disable(logging.CRITICAL)
+    try:
+        with tempfile.TemporaryDirectory() as directory, redirect_stdout(StringIO()):
+            history_config.history_file = os.path.join(directory, "history.csv")
+            for size in sizes:
+                results[size] = {
+                    mode: _time_save(size, mode, history_config.history_file)
+                    for mode in ("rewrite", "journal")
+                }
+    finally:
+        history_config.history_file, history_config.history_mode = saved_file, saved_mode
+        Calculations.history.clear()
+        logging.disable(logging.NOTSET)
+    return results
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
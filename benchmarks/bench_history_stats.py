@@ -0,0 +1,87 @@
+"""
+History Statistics Benchmark.
+
+Compares `Calculations.get_stats`, which summarizes running aggregates, with the
+previous way of getting the same numbers: iterating `Calculations.history` and
+calling `perform()` on every entry. Also times the per-call cost of `Calculator.add`,
+whose entries now update the aggregates as they are merged into the store. Logging
+is disabled.
+
+Run with:
+    python -m benchmarks.bench_history_stats
+"""
+import json
+import logging
+import time
+
+import numpy as np
+
+from calculator import Calculator
+from calculator.calculations import Calculations
+from calculator.log_guards import refresh_log_guards
+from calculator.operations import OPERATIONS
+
+def _scan_stats() -> dict:
+    """The previous approach, kept here as the baseline: one pass over every entry."""
+    counts, results = {}, []
+    for calculation in Calculations.history:
+        name = calculation.operation.__name__
+        counts[name] = counts.get(name, 0) + 1
+        results.append(calculation.perform())
+    return {"counts": counts, "sum": sum(results), "min": min(results), "max": max(results),
+            "mean": sum(results) / len(results)}
+
+def _best_ms(func, repeat: int) -> float:
+    """Return the best wall-clock time of `repeat` calls to `func`, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+def _add_ns(calls: int) -> float:
+    """Return the mean latency of `Calculator.add`, including merging its entries into the store."""
+    Calculations.history.clear()
+    start = time.perf_counter_ns()
+    for i in range(calls):
+        Calculator.add(i, 0.5)
+    len(Calculations.history)  # Merge the pending appends, which updates the aggregates
+    return (time.perf_counter_ns() - start) / calls
+
+def run(sizes=(1_000, 100_000), repeat: int = 3, calls: int = 20_000) -> dict:
+    """
+    Time history statistics by aggregates and by scanning, per history size.
+
+    Parameters:
+    -----------
+    sizes (tuple): History sizes to summarize.
+    repeat (int): Timing samples per measurement; the best one is kept.
+    calls (int): Calls timed for the `Calculator.add` latency.
+
+    Returns:
+    --------
+    dict: Per history size, the aggregate and scan times in milliseconds, and the `add` latency.
+    """
+    results = {}
+    rng = np.random.default_rng(0)
+    logging.disable(logging.CRITICAL)
+    refresh_log_guards()
+    try:
+        for size in sizes:
+            Calculations.history.clear()
+            a, b = rng.uniform(-1e6, 1e6, size), rng.uniform(1, 1e6, size)
+            Calculations.history.extend(rng.integers(0, len(OPERATIONS), size).astype(np.int8), a, b, a + b)
+            results[f"{size}_entries"] = {
+                "aggregates_ms": _best_ms(Calculations.get_stats, repeat),
+                "scan_ms": _best_ms(_scan_stats, repeat),
+            }
+        results["add_ns"] = _add_ns(calls)
+    finally:
+        logging.disable(logging.NOTSET)
+        refresh_log_guards()
+        Calculations.history.clear()
+    return results
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,74 @@
+"""
+Concurrent History Benchmark.
+
+Measures history append throughput with several threads appending at once, for the
+sharded `HistoryStore` (each thread appends to its own buffer, merged on read) and
+for a single global lock taken around every append, as a thread-safe store would
+need without shards. The time includes the final merge, so both layouts end with
+every entry in the columns.
+
+Run with:
+    python -m benchmarks.bench_history_threads
+"""
+import json
+import logging
+import threading
+import time
+
+from calculator.history_store import HistoryStore
+from calculator.operations import OP_CODES
+
+class GlobalLockStore(HistoryStore):
+    """A `HistoryStore` that writes every append to the columns under the store lock."""
+
+    def append(self, op_code: int, a, b, result, error=None, expression=None):
+        with self.lock:
+            self._write_entry(op_code, float(a), float(b), float(result), error, expression)
+
+def _entries_per_second(store: HistoryStore, threads: int, appends: int) -> float:
+    """Return the appends per second of `threads` threads appending `appends` entries each."""
+    op_code = OP_CODES["add"]
+    start_barrier = threading.Barrier(threads + 1)
+
+    def worker(offset):
+        start_barrier.wait()
+        for i in range(appends):
+            store.append(op_code, offset + i, 1.0, offset + i + 1.0)
+
+    workers = [threading.Thread(target=worker, args=(n * appends,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    start_barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    assert len(store) == threads * appends  # Merges the sharded appends
+    return threads * appends / (time.perf_counter() - started)
+
+def run(appends: int = 50_000, thread_counts=(1, 2, 4, 8)) -> dict:
+    """
+    Time concurrent appends with sharded buffers and with a global lock.
+
+    Parameters:
+    -----------
+    appends (int): Appends per thread.
+    thread_counts (Iterable[int]): Numbers of appending threads.
+
+    Returns:
+    --------
+    dict: Per thread count, the appends per second of each layout.
+    """
+    results = {}
+    logging.disable(logging.CRITICAL)
+    try:
+        for threads in thread_counts:
+            results[f"{threads}_threads"] = {
+                "sharded_per_second": _entries_per_second(HistoryStore(memory_limit=0), threads, appends),
+                "global_lock_per_second": _entries_per_second(GlobalLockStore(memory_limit=0), threads, appends),
+            }
+    finally:
+        logging.disable(logging.NOTSET)
+    return results
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,107 @@
+"""
+Hot-Path Logging Benchmark.
+
+Measures the per-call latency of `Calculator.add`, `subtract`, `multiply` and `divide`
+with logging off, at INFO (the level `logging.conf` sets) and at DEBUG. Emitted
+records are formatted by a handler that discards them, so the numbers include record
+creation and formatting but not log file I/O.
+
+For comparison, `eager_add` repeats the logging `Calculator.add` did before the
+level guards: f-string messages built on every call, whatever the level.
+
+Run with:
+    python -m benchmarks.bench_logging
+"""
+import json
+import logging
+import statistics
+import time
+from decimal import Decimal
+
+from calculator import Calculator
+from calculator.calculation import Calculation
+from calculator.calculations import Calculations
+from calculator.log_guards import refresh_log_guards
+from calculator.operations import add
+
+OPERATION_NAMES = ("add", "subtract", "multiply", "divide")
+LEVELS = {"off": None, "info": logging.INFO, "debug": logging.DEBUG}
+
+logger = logging.getLogger("calculator")
+operations_logger = logging.getLogger("calculator.operations")
+calculation_logger = logging.getLogger("calculator.calculation")
+
+class _DiscardHandler(logging.Handler):
+    """A handler that formats each record and throws it away."""
+
+    def emit(self, record):
+        self.format(record)
+
+def eager_add(a, b):
+    """`Calculator.add` with the unguarded f-string logging it used before."""
+    logger.info(f"Performing operation: add({a}, {b})")
+    calculation_logger.debug(f"Creating Calculation instance with a={a}, b={b}, operation=add")
+    calculation = Calculation(a, b, add)
+    calculation_logger.debug(f"Performing calculation: {a} add {b}")
+    result = a + b
+    operations_logger.debug(f"Performed addition: {a} + {b} = {result}")
+    calculation.result = result
+    calculation_logger.debug(f"Calculation result: {result}")
+    Calculations.add_calculation(calculation)
+    logger.info(f"Operation successful: add({a}, {b}) = {result}")
+    return result
+
+def _per_call_ns(func, a, b, calls: int) -> float:
+    """Return the mean latency of `calls` calls to `func(a, b)`, in nanoseconds."""
+    Calculations.history.clear()  # Keep history growth out of the measurement
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        func(a, b)
+    return (time.perf_counter_ns() - start) / calls
+
+def _set_level(level):
+    """Run logging at `level`, or switch it off if None, and decide the guards again."""
+    if level is None:
+        logging.disable(logging.CRITICAL)
+    else:
+        logging.disable(logging.NOTSET)
+        logging.getLogger().setLevel(level)
+    refresh_log_guards()
+
+def run(calls: int = 10_000, repeat: int = 5) -> dict:
+    """
+    Time each Calculator operation at each logging level.
+
+    Parameters:
+    -----------
+    calls (int): Calls per timing sample.
+    repeat (int): Number of timing samples per operation and level.
+
+    Returns:
+    --------
+    dict: Per level, the best and median latency of each operation in nanoseconds per call.
+    """
+    a, b = Decimal("12.5"), Decimal("3.25")
+    funcs = {name: getattr(Calculator, name) for name in OPERATION_NAMES}
+    funcs["eager_add"] = eager_add
+    root = logging.getLogger()
+    saved_level, saved_handlers = root.level, root.handlers[:]
+    root.handlers = [_DiscardHandler()]
+    results = {}
+    try:
+        for level_name, level in LEVELS.items():
+            _set_level(level)
+            results[level_name] = {}
+            for name, func in funcs.items():
+                samples = [_per_call_ns(func, a, b, calls) for _ in range(repeat)]
+                results[level_name][name] = {"best_ns": min(samples), "median_ns": statistics.median(samples)}
+    finally:
+        root.handlers = saved_handlers
+        logging.disable(logging.NOTSET)
+        root.setLevel(saved_level)
+        refresh_log_guards()
+        Calculations.history.clear()
+    return results
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
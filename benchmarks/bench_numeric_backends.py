@@ -0,0 +1,93 @@
+"""
+Numeric Backend Benchmark.
+
+Measures, for the `float`, `decimal` and `fraction` numeric backends, the cost of
+parsing an operand, of `Calculator.add` and `Calculator.divide` calls (including the
+history entry each records), and of saving and loading a CSV history of the results.
+Logging is disabled, so the numbers reflect the calculation and history cost rather
+than log handler I/O.
+
+Run with:
+    python -m benchmarks.bench_numeric_backends
+"""
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+from calculator import Calculator
+from calculator.calculations import Calculations
+from calculator.config import history_config
+from calculator.log_guards import refresh_log_guards
+from calculator.numeric import BACKENDS, parse_number, use_backend
+
+def _per_call_ns(func, calls: int, repeat: int) -> float:
+    """Return the best mean latency of `calls` calls to `func(i)` over `repeat` samples, in nanoseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        Calculations.history.clear()  # Keep history growth out of the measurement
+        start = time.perf_counter_ns()
+        for i in range(calls):
+            func(i)
+        best = min(best, (time.perf_counter_ns() - start) / calls)
+    return best
+
+def _history_ms(backend: str, entries: int) -> tuple:
+    """Return the (save, load) milliseconds of a CSV history of `entries` divisions."""
+    Calculations.history.clear()
+    for i in range(entries):
+        Calculator.divide(i + 1, 7)
+    with redirect_stdout(StringIO()):
+        start = time.perf_counter()
+        Calculations.save_history()
+        saved = time.perf_counter()
+        Calculations.load_history()
+        loaded = time.perf_counter()
+    assert len(Calculations.history) == entries, f"{backend} history did not load back"
+    return (saved - start) * 1e3, (loaded - saved) * 1e3
+
+def run(calls: int = 20_000, repeat: int = 3, entries: int = 20_000) -> dict:
+    """
+    Time parsing, operations and history persistence with each backend.
+
+    Parameters:
+    -----------
+    calls (int): Calls per timing sample.
+    repeat (int): Number of timing samples; the best is kept.
+    entries (int): The number of history entries saved and loaded.
+
+    Returns:
+    --------
+    dict: Per backend, the parse, add and divide latency in nanoseconds per call, and
+    the history save and load time in milliseconds.
+    """
+    results = {}
+    saved_file = history_config.history_file
+    logging.disable(logging.CRITICAL)
+    refresh_log_guards()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            history_config.history_file = os.path.join(directory, "history.csv")
+            _history_ms("float", 10)  # Warm up: the first save and load import pandas
+            for name in BACKENDS:
+                with use_backend(name):
+                    save_ms, load_ms = _history_ms(name, entries)
+                    results[name] = {
+                        "parse_ns": _per_call_ns(lambda i: parse_number("1234.5678"), calls, repeat),
+                        "add_ns": _per_call_ns(lambda i: Calculator.add(i, 0.25), calls, repeat),
+                        "divide_ns": _per_call_ns(lambda i: Calculator.divide(i, 7), calls, repeat),
+                        "save_ms": save_ms,
+                        "load_ms": load_ms,
+                    }
+    finally:
+        history_config.history_file = saved_file
+        logging.disable(logging.NOTSET)
+        refresh_log_guards()
+        Calculations.history.clear()
+    return results
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
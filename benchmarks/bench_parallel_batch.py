@@ -0,0 +1,67 @@
+"""
+Parallel Batch Benchmark.
+
+Measures the throughput of `main.run_parallel_batch` for 1, 2, 4 and one-per-CPU
+worker processes against the single-process `main.run_batch`, on the same JSON-lines
+input. Logging is disabled while timing, and the parallel runs keep the workers'
+history, as `run_parallel_batch` does by default.
+
+Run with:
+    python -m benchmarks.bench_parallel_batch
+"""
+import contextlib
+import io
+import json
+import logging
+import os
+import time
+
+import main
+from calculator.calculations import Calculations
+
+OPERATIONS = ("add", "subtract", "multiply", "divide")
+
+def _requests(rows: int) -> str:
+    """Return `rows` JSON-lines requests cycling through the operations."""
+    return "".join(json.dumps({"a": i, "b": i % 97 + 1, "operation": OPERATIONS[i % 4]}) + "\n"
+                   for i in range(rows))
+
+def _rows_per_second(func, text: str) -> float:
+    """Return the rows per second of one `func(stream, output)` run over `text`."""
+    Calculations.history.clear()
+    started = time.perf_counter()
+    with contextlib.redirect_stderr(io.StringIO()):  # Drop the run's own summary line
+        rows = func(io.StringIO(text), io.StringIO())
+    return rows / (time.perf_counter() - started)
+
+def run(rows: int = 200_000, worker_counts=(1, 2, 4, None)) -> dict:
+    """
+    Time the sequential and the parallel batch runners.
+
+    Parameters:
+    -----------
+    rows (int): The number of requests.
+    worker_counts (Iterable[int]): Numbers of worker processes; None means one per CPU.
+
+    Returns:
+    --------
+    dict: The sequential rows per second, and per worker count the rows per second
+    and speedup over the sequential runner.
+    """
+    text = _requests(rows)
+    results = {"cpu_count": os.cpu_count()}
+    logging.disable(logging.CRITICAL)
+    try:
+        sequential = _rows_per_second(main.run_batch, text)
+        results["sequential"] = {"rows_per_second": sequential}
+        for workers in worker_counts:
+            count = workers or os.cpu_count() or 1
+            rate = _rows_per_second(lambda stream, output: main.run_parallel_batch(stream, output, workers=count), text)
+            results[f"{count}_workers"] = {"rows_per_second": rate, "speedup": rate / sequential}
+    finally:
+        logging.disable(logging.NOTSET)
+        Calculations.history.clear()
+    return results
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,89 @@
+"""
+REPL Throughput Benchmark.
+
+Measures commands per second through `App.start`, with `input()` fed from a scripted
+list of commands, and through `App.run_script` reading the same commands from a
+stream. Command output is captured rather than written to the terminal, and log
+records are formatted but discarded instead of written to the `logs/` files that
+`App.configure_logging` would set up.
+
+Run with:
+    python -m benchmarks.bench_repl
+"""
+import json
+import logging
+import time
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from itertools import cycle, islice
+from unittest.mock import patch
+
+from app import App
+from benchmarks.bench_logging import _DiscardHandler
+from calculator.calculations import Calculations
+from calculator.log_guards import refresh_log_guards
+
+SCRIPT = ("add 1 2", "multiply 3 4", "subtract 5 1", "divide 8 2")
+
+def _time(func) -> float:
+    """Return the wall-clock time of one call to `func`, in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def _configure_logging(app: App):
+    """Stand in for `App.configure_logging`, keeping the root handlers the benchmark installed."""
+    app.logger = logging.getLogger("app")
+
+def run(commands: int = 10_000, log_level: int = None) -> dict:
+    """
+    Time the interactive loop and script mode over the same commands.
+
+    Parameters:
+    -----------
+    commands (int): Number of commands to run, cycling through `SCRIPT`.
+    log_level (int, optional): A logging level to run at; logging is disabled if None.
+
+    Returns:
+    --------
+    dict: Elapsed seconds and commands per second for each mode.
+    """
+    lines = list(islice(cycle(SCRIPT), commands))
+    root = logging.getLogger()
+    saved_level, saved_handlers = root.level, root.handlers[:]
+    root.handlers = [_DiscardHandler()]
+    with patch.object(App, "configure_logging", _configure_logging):
+        app = App()
+    if log_level is None:
+        logging.disable(logging.CRITICAL)
+    else:
+        root.setLevel(log_level)
+    refresh_log_guards()
+
+    def interactive():
+        with patch("builtins.input", side_effect=lines + ["exit"]), redirect_stdout(StringIO()):
+            try:
+                app.start()
+            except SystemExit:
+                pass  # The exit plugin ends the loop
+
+    def script():
+        with redirect_stderr(StringIO()):
+            app.run_script(StringIO("\n".join(lines) + "\n"), StringIO())
+
+    results = {}
+    try:
+        for mode, func in (("start", interactive), ("run_script", script)):
+            Calculations.history.clear()
+            seconds = _time(func)
+            results[mode] = {"seconds": seconds, "commands_per_second": commands / seconds}
+    finally:
+        root.handlers = saved_handlers
+        logging.disable(logging.NOTSET)
+        root.setLevel(saved_level)
+        refresh_log_guards()
+        Calculations.history.clear()
+    return results
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
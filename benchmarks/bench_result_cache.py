@@ -0,0 +1,66 @@
+"""
+Result Cache Benchmark.
+
+Measures the per-call latency of `Calculator.add` over a workload that cycles through
+a fixed number of distinct operand pairs, with the result cache off and on. With
+fewer distinct pairs than cache entries every call after the first pass is a hit;
+with more, the least recently used pairs are evicted before they repeat and every
+call misses, which shows the cost of the lookup itself. Logging is disabled.
+
+Run with:
+    python -m benchmarks.bench_result_cache
+"""
+import json
+import logging
+import time
+from decimal import Decimal
+
+from calculator import Calculator
+from calculator.calculations import Calculations
+from calculator.log_guards import refresh_log_guards
+
+CACHE_SIZE = 1024
+
+def _per_call_ns(operands, calls: int) -> float:
+    """Return the mean latency of `Calculator.add` over `calls` calls cycling through `operands`."""
+    Calculations.history.clear()  # Keep history growth out of the measurement
+    count = len(operands)
+    start = time.perf_counter_ns()
+    for i in range(calls):
+        a, b = operands[i % count]
+        Calculator.add(a, b)
+    return (time.perf_counter_ns() - start) / calls
+
+def run(calls: int = 50_000, distinct=(16, CACHE_SIZE // 2, CACHE_SIZE * 4)) -> dict:
+    """
+    Time `Calculator.add` with and without the result cache.
+
+    Parameters:
+    -----------
+    calls (int): Calls per timing sample.
+    distinct (tuple): Numbers of distinct operand pairs to cycle through.
+
+    Returns:
+    --------
+    dict: Per number of distinct pairs, the latency without and with the cache and the cache counters.
+    """
+    results = {}
+    logging.disable(logging.CRITICAL)
+    refresh_log_guards()
+    try:
+        for count in distinct:
+            operands = [(Decimal(i), Decimal("0.5")) for i in range(count)]
+            Calculator.disable_result_cache()
+            uncached = _per_call_ns(operands, calls)
+            cache = Calculator.enable_result_cache(CACHE_SIZE)
+            cached = _per_call_ns(operands, calls)
+            results[f"{count}_pairs"] = {"uncached_ns": uncached, "cached_ns": cached, **cache.stats()}
+    finally:
+        Calculator.disable_result_cache()
+        logging.disable(logging.NOTSET)
+        refresh_log_guards()
+        Calculations.history.clear()
+    return results
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,79 @@
+"""
+Plugin Startup Benchmark.
+
+Measures `load_plugins` with and without a valid cached plugin manifest, and the
+cost of the first dispatch of a command, which imports its plugin module.
+
+Run with:
+    python -m benchmarks.bench_startup
+"""
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+from app.plugins import plugins_manager
+
+def _time_ms(func) -> float:
+    """Return the wall-clock time of one call to `func`, in milliseconds."""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+def _drop_manifest():
+    """Remove the cached plugin manifest, so the next load scans the plugins directory."""
+    try:
+        os.remove(plugins_manager.MANIFEST_PATH)
+    except OSError:
+        pass
+
+def _first_dispatch():
+    """Load the plugins and dispatch 'add' once, with its plugin module not yet imported."""
+    module = sys.modules.pop("app.plugins.add", None)
+    try:
+        handler = plugins_manager.load_plugins()
+        with redirect_stdout(StringIO()):
+            handler.commands["add"].execute(["1", "2"])
+    finally:
+        if module is not None:  # Keep the module (and its classes) that other code already imported
+            sys.modules["app.plugins.add"] = module
+            setattr(sys.modules["app.plugins"], "add", module)
+
+def _summary(samples) -> dict:
+    """Return the best and median of timing samples."""
+    return {"best_ms": min(samples), "median_ms": statistics.median(samples)}
+
+def run(repeat: int = 20) -> dict:
+    """
+    Time plugin loading with a cold and a warm manifest cache.
+
+    Parameters:
+    -----------
+    repeat (int): Number of timing samples per case.
+
+    Returns:
+    --------
+    dict: Best and median times in milliseconds per case.
+    """
+    logging.disable(logging.CRITICAL)
+    try:
+        cold = []
+        for _ in range(repeat):
+            _drop_manifest()
+            cold.append(_time_ms(plugins_manager.load_plugins))
+        warm = [_time_ms(plugins_manager.load_plugins) for _ in range(repeat)]
+        first_dispatch = [_time_ms(_first_dispatch) for _ in range(repeat)]
+    finally:
+        logging.disable(logging.NOTSET)
+    return {
+        "load_plugins_cold": _summary(cold),
+        "load_plugins_cached": _summary(warm),
+        "load_plugins_and_first_dispatch": _summary(first_dispatch),
+    }
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -6,17 +6,27 @@ is performed using the `Calculation` class to ensure modularity and maintainabil
 """
 
 # Import necessary modules and classes
-from decimal import Decimal  # For high-precision arithmetic
+from decimal import Decimal, localcontext  # For high-precision arithmetic
 import logging
-from typing import Callable  # For type hinting callable objects
+from typing import Callable, Union  # For type hinting callable objects
+
+import numpy as np  # For vectorized batch evaluation
 
 # Import arithmetic operations and calculation management classes
 from calculator.calculations import Calculations  # Manages history of calculations
-from calculator.operations import add, subtract, multiply, divide  # Arithmetic operations
-from calculator.calculation import Calculation  # Represents a single calculation
+from calculator.operations import add, subtract, multiply, divide, registry  # Arithmetic operations and the registry
+from calculator.calculation import Calculation, BatchCalculation, ExpressionCalculation  # Represents a single calculation, a batch or an expression
+from calculator.expression import compile_expression  # Compiles and caches arithmetic expressions
+from calculator.result_cache import ResultCache, result_key  # Optional LRU cache of operation results
+from calculator.numeric import get_backend  # Float, Decimal or Fraction operands
+
+from calculator.log_guards import log_guard, refresh_log_guards  # Re-exported: call it after changing log levels
 
 # Configure logger
 logger = logging.getLogger(__name__)
+log = log_guard(logger)  # Level guards decided once, not on every call
+
+_MISSING = object()  # Marks a result cache miss
 
 class Calculator:
     """
@@ -30,41 +40,125 @@ class Calculator:
 
     Each operation is performed using the `Calculation` class, ensuring modularity 
     and maintainability. All calculations are stored in history using `Calculations`.
+
+    Operands are converted to the numeric backend of the call (`backend=`), or else
+    the active one (see `calculator.numeric`). The default `float` backend uses them
+    as given; `decimal` and `fraction` convert them and compute exactly, or in the
+    backend's decimal context.
+
+    Attributes:
+    -----------
+    result_cache : ResultCache or None
+        The LRU cache of operation results, or None while caching is off (the default).
     """
 
+    result_cache = None
+
     @staticmethod
-    def _perform_operation(a: Decimal, b: Decimal, operation: Callable[[Decimal, Decimal], Decimal]) -> Decimal:
+    def enable_result_cache(maxsize: int = 4096) -> ResultCache:
+        """
+        Cache the results of `add`, `subtract`, `multiply` and `divide` calls.
+
+        A cached call still adds an entry to history, but does not build a
+        `Calculation` or perform the operation again. Enabling the cache again
+        replaces it with an empty one.
+
+        Parameters:
+        -----------
+        maxsize (int): The largest number of results kept; the least recently used are evicted first.
+
+        Returns:
+        --------
+        ResultCache: The new cache, whose counters report hits, misses and evictions.
+        """
+        Calculator.result_cache = ResultCache(maxsize)
+        logger.info(f"Result cache enabled with {maxsize} entries.")
+        return Calculator.result_cache
+
+    @staticmethod
+    def disable_result_cache():
+        """Stop caching results and drop the cache."""
+        Calculator.result_cache = None
+        logger.info("Result cache disabled.")
+
+    @staticmethod
+    def _perform_operation(a: Decimal, b: Decimal, operation: Callable[[Decimal, Decimal], Decimal],
+                           backend=None) -> Decimal:
+        """
+        Convert the operands to the numeric backend, then perform the operation.
+
+        Parameters:
+        -----------
+        a (Decimal): The first operand.
+        b (Decimal): The second operand.
+        operation (Callable[[Decimal, Decimal], Decimal]): The function representing the operation.
+        backend (str or NumericBackend, optional): The numeric backend. Defaults to the active backend.
+
+        Returns:
+        --------
+        Decimal: The result of the operation.
+        """
+        backend = get_backend(backend)
+        if backend.exact:
+            a, b = backend.convert(a), backend.convert(b)
+            if backend.context is not None:
+                with localcontext(backend.context):
+                    return Calculator._calculate(a, b, operation, True)
+            return Calculator._calculate(a, b, operation, True)
+        return Calculator._calculate(a, b, operation, False)
+
+    @staticmethod
+    def _calculate(a: Decimal, b: Decimal, operation: Callable[[Decimal, Decimal], Decimal],
+                   exact: bool = None) -> Decimal:
         """
         Create and perform a calculation, then return the result.
 
         This method:
         1. Creates a `Calculation` object.
-        2. Adds it to the history using `Calculations`.
-        3. Executes the operation and returns the result.
+        2. Executes the operation once, capturing the result or error on the calculation.
+        3. Adds it to the history using `Calculations` and returns the result.
+
+        When the result cache is enabled, a cached result is recorded in history and
+        returned without building a `Calculation`; only successful results are cached.
 
         Parameters:
         -----------
         a (Decimal): The first operand.
         b (Decimal): The second operand.
         operation (Callable[[Decimal, Decimal], Decimal]): The function representing the operation.
+        exact (bool, optional): Whether the call's backend is exact, so history keeps the
+            exact values. Defaults to the active backend's.
 
         Returns:
         --------
         Decimal: The result of the operation.
         """
-        logger.info(f"Performing operation: {operation.__name__}({a}, {b})")
+        cache = Calculator.result_cache
+        if cache is not None:
+            key = result_key(operation, a, b)
+            result = cache.get(key, _MISSING)
+            if result is not _MISSING:
+                Calculations.add_result(operation, a, b, result, exact)
+                return result
+        if log.info:
+            logger.info("Performing operation: %s(%s, %s)", operation.__name__, a, b)
         try:
             calculation = Calculation.create(a, b, operation)
-            Calculations.add_calculation(calculation)
-            result = calculation.perform()
-            logger.info(f"Operation successful: {operation.__name__}({a}, {b}) = {result}")
+            try:
+                result = calculation.perform()
+            finally:
+                Calculations.add_calculation(calculation, exact)  # Recorded with its result or error
+            if log.info:
+                logger.info("Operation successful: %s(%s, %s) = %s", operation.__name__, a, b, result)
+            if cache is not None:
+                cache.put(key, result)
             return result
         except Exception as e:
-            logger.error(f"Error performing {operation.__name__}({a}, {b}): {e}")
+            logger.error("Error performing %s(%s, %s): %s", operation.__name__, a, b, e)
             raise
 
     @staticmethod
-    def add(a: Decimal, b: Decimal) -> Decimal:
+    def add(a: Decimal, b: Decimal, backend=None) -> Decimal:
         """
         Perform addition of two numbers.
 
@@ -72,15 +166,16 @@ class Calculator:
         -----------
         a (Decimal): The first number to add.
         b (Decimal): The second number to add.
+        backend (str or NumericBackend, optional): The numeric backend of this call.
 
         Returns:
         --------
         Decimal: The result of adding `a` and `b`.
         """
-        return Calculator._perform_operation(a, b, add)
+        return Calculator._perform_operation(a, b, add, backend)
 
     @staticmethod
-    def subtract(a: Decimal, b: Decimal) -> Decimal:
+    def subtract(a: Decimal, b: Decimal, backend=None) -> Decimal:
         """
         Perform subtraction of two numbers.
 
@@ -88,15 +183,16 @@ class Calculator:
         -----------
         a (Decimal): The number to subtract from.
         b (Decimal): The number to subtract.
+        backend (str or NumericBackend, optional): The numeric backend of this call.
 
         Returns:
         --------
         Decimal: The result of subtracting `b` from `a`.
         """
-        return Calculator._perform_operation(a, b, subtract)
+        return Calculator._perform_operation(a, b, subtract, backend)
 
     @staticmethod
-    def multiply(a: Decimal, b: Decimal) -> Decimal:
+    def multiply(a: Decimal, b: Decimal, backend=None) -> Decimal:
         """
         Perform multiplication of two numbers.
 
@@ -104,15 +200,16 @@ class Calculator:
         -----------
         a (Decimal): The first number to multiply.
         b (Decimal): The second number to multiply.
+        backend (str or NumericBackend, optional): The numeric backend of this call.
 
         Returns:
         --------
         Decimal: The result of multiplying `a` and `b`.
         """
-        return Calculator._perform_operation(a, b, multiply)
+        return Calculator._perform_operation(a, b, multiply, backend)
 
     @staticmethod
-    def divide(a: Decimal, b: Decimal) -> Decimal:
+    def divide(a: Decimal, b: Decimal, backend=None) -> Decimal:
         """
         Perform division of two numbers.
 
@@ -120,6 +217,7 @@ class Calculator:
         -----------
         a (Decimal): The numerator (dividend).
         b (Decimal): The denominator (divisor).
+        backend (str or NumericBackend, optional): The numeric backend of this call.
 
         Returns:
         --------
@@ -132,4 +230,152 @@ class Calculator:
         if b == Decimal('0'):
             logger.error("Attempted division by zero.")
             raise ZeroDivisionError("Cannot divide by zero.")
-        return Calculator._perform_operation(a, b, divide)
\ No newline at end of file
+        return Calculator._perform_operation(a, b, divide, backend)
+
+    @staticmethod
+    def calculate(operation: str, a: Decimal, b: Decimal, backend=None) -> Decimal:
+        """
+        Perform a registered operation by name.
+
+        The operation is looked up in `calculator.operations.registry` with one dictionary
+        lookup, so operations registered at runtime (e.g. by plugins) are dispatched the
+        same way as the built-in ones. Division keeps the zero check of `divide`.
+
+        Parameters:
+        -----------
+        operation (str): The operation name (e.g. 'add').
+        a (Decimal): The first operand.
+        b (Decimal): The second operand.
+        backend (str or NumericBackend, optional): The numeric backend of this call.
+
+        Returns:
+        --------
+        Decimal: The result of the operation.
+
+        Raises:
+        -------
+        ValueError: If the operation is unknown.
+        ZeroDivisionError: If the operation divides by zero.
+        """
+        entry = registry.get(operation)
+        if entry is None:
+            logger.error(f"Unknown operation: {operation}")
+            raise ValueError(f"Unknown operation: {operation}")
+        if entry.function is divide:
+            return Calculator.divide(a, b, backend)
+        return Calculator._perform_operation(a, b, entry.function, backend)
+
+    @staticmethod
+    def evaluate(expression: str, variables: dict = None, backend=None):
+        """
+        Evaluate an arithmetic expression and record it as one history entry.
+
+        The expression is compiled once per distinct text (see
+        `calculator.expression.compile_expression`); its inner operations run through
+        `calculator.operations`, and its outermost operation is recorded as one
+        `ExpressionCalculation` carrying the expression text. An expression whose
+        inner operands fail to evaluate is not recorded.
+
+        Parameters:
+        -----------
+        expression (str): The expression, e.g. '(2 + 3) * x / 7'.
+        variables (dict, optional): The value of each variable the expression uses.
+        backend (str or NumericBackend, optional): The numeric backend of this call.
+
+        Returns:
+        --------
+        int or float: The value of the expression.
+
+        Raises:
+        -------
+        ValueError: If the expression is invalid or a variable has no value.
+        ZeroDivisionError: If the expression divides by zero.
+        """
+        compiled = compile_expression(expression)
+        backend = get_backend(backend)
+        if backend.context is not None:
+            with localcontext(backend.context):
+                return Calculator._evaluate(compiled, variables, backend)
+        return Calculator._evaluate(compiled, variables, backend)
+
+    @staticmethod
+    def _evaluate(compiled, variables: dict, backend):
+        """Evaluate a compiled expression with a numeric backend and record it in history."""
+        a, b = compiled.operands(variables, backend)
+        if log.info:
+            logger.info("Evaluating expression: %s", compiled.text)
+        calculation = ExpressionCalculation(a, b, compiled.operation, compiled.text)
+        try:
+            result = calculation.perform()
+        finally:
+            Calculations.add_calculation(calculation, backend.exact)  # Recorded with its result or error
+        if log.info:
+            logger.info("Expression evaluated: %s = %s", compiled.text, result)
+        return result
+
+    @staticmethod
+    def evaluate_batch(operation: Union[str, Callable], a, b) -> np.ma.MaskedArray:
+        """
+        Apply one operation to arrays of operands in a single vectorized pass.
+
+        Unlike the per-call methods, no `Calculation` is built per operand pair: the
+        whole batch is computed with NumPy and handed to history as one
+        `BatchCalculation`, which is appended in bulk. Division by zero does not raise;
+        the affected elements are masked in the returned array and left out of history.
+        Registered operations without a NumPy ufunc are called once per element, and
+        the elements they raise an arithmetic or value error for are masked the same way.
+
+        Parameters:
+        -----------
+        operation (str or Callable): The name (e.g. 'add') or function of a registered operation.
+        a (array_like): The first operands.
+        b (array_like): The second operands, broadcastable against `a`.
+
+        Returns:
+        --------
+        numpy.ma.MaskedArray: The element-wise results, masked where no result exists.
+
+        Raises:
+        -------
+        ValueError: If the operation is unknown.
+        """
+        entry = registry.get(operation if isinstance(operation, str) else getattr(operation, "__name__", None))
+        if entry is None or (not isinstance(operation, str) and entry.function is not operation):
+            logger.error(f"Unknown batch operation: {operation}")
+            raise ValueError(f"Unknown operation: {operation}")
+        operation = entry.function
+
+        a, b = np.broadcast_arrays(np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))
+        logger.info(f"Performing batch operation: {operation.__name__} over {a.size} operand pairs")
+
+        failure = "division by zero"
+        if operation is divide:
+            mask = b == 0
+            values = np.divide(a, b, out=np.zeros(a.shape), where=~mask)
+        elif entry.ufunc is not None:
+            mask = np.zeros(a.shape, dtype=bool)
+            values = entry.ufunc(a, b)
+        else:
+            values, mask = Calculator._apply_elementwise(operation, a, b)
+            failure = f"a failed {operation.__name__}"
+
+        valid = ~mask
+        if mask.any():
+            logger.error(f"Attempted {failure} in {int(mask.sum())} of {a.size} batch elements.")
+            Calculations.add_calculation(BatchCalculation(a[valid], b[valid], operation, values[valid]))
+        else:
+            Calculations.add_calculation(BatchCalculation(a.ravel(), b.ravel(), operation, values.ravel()))
+        return np.ma.masked_array(values, mask=mask)
+
+    @staticmethod
+    def _apply_elementwise(operation: Callable, a: np.ndarray, b: np.ndarray) -> tuple:
+        """Call an operation without a ufunc on every operand pair, masking the pairs it fails for."""
+        values = np.zeros(a.shape)
+        mask = np.zeros(a.shape, dtype=bool)
+        flat_values, flat_mask = values.reshape(-1), mask.reshape(-1)
+        for index, (x, y) in enumerate(zip(a.ravel().tolist(), b.ravel().tolist())):
+            try:
+                flat_values[index] = operation(x, y)
+            except (ArithmeticError, ValueError):
+                flat_mask[index] = True
+        return values, mask
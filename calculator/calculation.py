@@ -18,9 +18,11 @@ from typing import Callable
 
 # Import arithmetic operations from the calculator module
 from calculator.operations import add, subtract, multiply, divide  
+from calculator.log_guards import log_guard
 
 # Configure logger
 logger = logging.getLogger(__name__)
+log = log_guard(logger)  # Level guards decided once, not on every call
 
 class Calculation:
     """
@@ -37,8 +39,18 @@ class Calculation:
         The second operand (input number).
     operation : Callable[[Decimal, Decimal], Decimal]
         A function that performs an arithmetic operation on two Decimal values.
+    result : Decimal or None
+        The result captured by the last `perform()` call, or None if not performed yet.
+    error : Exception or None
+        The error raised by the last `perform()` call, or None if it succeeded.
+    expression : str or None
+        The expression this calculation is the last step of, or None (see `ExpressionCalculation`).
     """
 
+    __slots__ = ("a", "b", "operation", "result", "error")
+
+    expression = None  # Set per instance only by `ExpressionCalculation`
+
     def __init__(self, a: Decimal, b: Decimal, operation: Callable[[Decimal, Decimal], Decimal]):
         """
         Initializes a Calculation instance with two operands and an operation function.
@@ -52,7 +64,10 @@ class Calculation:
         self.a = a
         self.b = b
         self.operation = operation
-        logger.debug(f"Initialized Calculation with a={a}, b={b}, operation={operation.__name__}")
+        self.result = None
+        self.error = None
+        if log.debug:
+            logger.debug("Initialized Calculation with a=%s, b=%s, operation=%s", a, b, operation.__name__)
 
     @staticmethod    
     def create(a: Decimal, b: Decimal, operation: Callable[[Decimal, Decimal], Decimal]) -> "Calculation":
@@ -72,7 +87,8 @@ class Calculation:
         --------
         Calculation: A new `Calculation` instance with the provided parameters.
         """
-        logger.debug(f"Creating Calculation instance with a={a}, b={b}, operation={operation.__name__}")
+        if log.debug:
+            logger.debug("Creating Calculation instance with a=%s, b=%s, operation=%s", a, b, operation.__name__)
         return Calculation(a, b, operation)
 
     def perform(self) -> Decimal:
@@ -80,16 +96,28 @@ class Calculation:
         Perform the stored calculation using the given operation.
 
         This method applies the stored operation (addition, subtraction, multiplication, or division)
-        to the operands `a` and `b`, and returns the result.
+        to the operands `a` and `b`, and returns the result. The outcome is captured in
+        `result` or `error`, so history can read it later without performing again.
 
         Returns:
         --------
         Decimal: The result of applying the operation to `a` and `b`.
+
+        Raises:
+        -------
+        Exception: Any error raised by the operation, after it has been captured in `error`.
         """
-        logger.debug(f"Performing calculation: {self.a} {self.operation.__name__} {self.b}")
-        result = self.operation(self.a, self.b)
-        logger.debug(f"Calculation result: {result}")
-        return result
+        if log.debug:
+            logger.debug("Performing calculation: %s %s %s", self.a, self.operation.__name__, self.b)
+        try:
+            self.result = self.operation(self.a, self.b)
+        except Exception as e:
+            self.result, self.error = None, e
+            raise
+        self.error = None
+        if log.debug:
+            logger.debug("Calculation result: %s", self.result)
+        return self.result
 
     def __repr__(self) -> str:
         """
@@ -102,4 +130,107 @@ class Calculation:
         --------
         str: A string representing the `Calculation` object.
         """
-        return f"Calculation({self.a}, {self.b}, {self.operation.__name__})"
\ No newline at end of file
+        return f"Calculation({self.a}, {self.b}, {self.operation.__name__})"
+
+class ExpressionCalculation(Calculation):
+    """
+    A calculation that is the outermost operation of an arithmetic expression.
+
+    `Calculator.evaluate` reduces an expression such as `(2 + 3) * 4 / 7` to the
+    operands of its outermost operation (`20 / 7`) and records it as this single
+    calculation, with the expression text kept alongside.
+
+    Attributes:
+    -----------
+    expression : str
+        The source text of the expression.
+    """
+
+    __slots__ = ("expression",)
+
+    def __init__(self, a: Decimal, b: Decimal, operation: Callable[[Decimal, Decimal], Decimal], expression: str):
+        """
+        Initializes an ExpressionCalculation instance.
+
+        Parameters:
+        -----------
+        a (Decimal): The value of the outermost operation's first operand.
+        b (Decimal): The value of the outermost operation's second operand.
+        operation (Callable[[Decimal, Decimal], Decimal]): The outermost operation.
+        expression (str): The source text of the expression.
+        """
+        super().__init__(a, b, operation)
+        self.expression = expression
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the ExpressionCalculation object.
+
+        Returns:
+        --------
+        str: A string showing the expression text.
+        """
+        return f"ExpressionCalculation({self.expression!r})"
+
+class BatchCalculation:
+    """
+    A class to represent one arithmetic operation applied to arrays of operands.
+
+    A batch is produced by `Calculator.evaluate_batch` and handed to history as a
+    single entry, which the history store appends in bulk, so recording a million
+    operand pairs costs one array copy instead of one `Calculation` per pair. Only the
+    rows that produced a result are kept; rows masked out by the batch (e.g. division
+    by zero) are not recorded.
+
+    Attributes:
+    -----------
+    a : numpy.ndarray
+        The first operands of the batch.
+    b : numpy.ndarray
+        The second operands of the batch.
+    operation : Callable[[Decimal, Decimal], Decimal]
+        The operation function that was applied element-wise.
+    result : numpy.ndarray
+        The element-wise results, aligned with `a` and `b`.
+    """
+
+    def __init__(self, a, b, operation: Callable[[Decimal, Decimal], Decimal], result):
+        """
+        Initializes a BatchCalculation instance with operand and result arrays.
+
+        Parameters:
+        -----------
+        a (numpy.ndarray): The first operands.
+        b (numpy.ndarray): The second operands.
+        operation (Callable[[Decimal, Decimal], Decimal]): The operation that was applied.
+        result (numpy.ndarray): The element-wise results.
+        """
+        self.a = a
+        self.b = b
+        self.operation = operation
+        self.result = result
+        logger.debug(f"Initialized BatchCalculation with {len(result)} rows, operation={operation.__name__}")
+
+    def perform(self):
+        """
+        Return the already computed results of the batch.
+
+        Returns:
+        --------
+        numpy.ndarray: The element-wise results of the batch.
+        """
+        return self.result
+
+    def __len__(self) -> int:
+        """Return the number of rows recorded in the batch."""
+        return len(self.result)
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the BatchCalculation object.
+
+        Returns:
+        --------
+        str: A string showing the number of rows and the operation name.
+        """
+        return f"BatchCalculation({len(self)} x {self.operation.__name__})"
\ No newline at end of file
@@ -3,29 +3,40 @@ Calculations Module.
 
 This module defines the `Calculations` class, which manages a history of arithmetic
 calculations, allowing users to add, retrieve, clear, and filter calculations based on the operation.
+
+History is persisted as CSV, or in the binary format of `calculator.history_file` when
+the history file name ends in `.npy`. Exact `Decimal` and `Fraction` values are written
+to CSV as their text (e.g. `0.1` or `1/3`) and read back with the active numeric
+backend. Every other CSV read path (loading with the `float` backend, streaming,
+counting, converting and compacting) reads such text as the nearest float, so a file
+saved under an exact backend stays readable; the binary format holds 64-bit floats only.
 """
 
 # Import logging
 import logging
+import os
+from fractions import Fraction
 
-import pandas as pd
-
-# Importing Decimal for precise floating-point arithmetic to avoid rounding errors.
-from decimal import Decimal  
+# Importing List for typing lists of history entries.
+from typing import List  
 
-# Importing Callable for function type hinting and List for handling history storage.
-from typing import Callable, List  
+import numpy as np
 
 # Importing the Calculation class to manage individual arithmetic operations.
-from calculator.operations import add, subtract, multiply, divide  
-from calculator.calculation import Calculation  
+from calculator.operations import OPERATIONS, OP_CODES  
+from calculator.calculation import Calculation, BatchCalculation  
+from calculator.history_store import HistoryStore, CalculationView  
+from calculator.history_file import is_binary, open_records, record_columns, write_records  
+from calculator.config import history_config  
+from calculator.numeric import get_backend
+from calculator.log_guards import log_guard
 
 # Configure logger
 logger = logging.getLogger(__name__)
+log = log_guard(logger)  # Level guards decided once, not on every call
 
-from app import App
-
-HISTORY_FILE = App().get_environment_variable('HISTORY_FILE')
+HISTORY_COLUMNS = ["Operand1", "Operand2", "Operation", "Result"]
+HISTORY_DTYPES = {"Operand1": np.float64, "Operand2": np.float64, "Operation": str, "Result": np.float64}
 
 class Calculations:
     """
@@ -37,36 +48,106 @@ class Calculations:
 
     Attributes:
     -----------
-    history : List[Calculation]
-        A class-level list that stores past Calculation instances.
+    history : HistoryStore
+        A class-level columnar store of past calculations. Entries are read back
+        as `CalculationView` objects.
     """
 
-    # Initialize the history list to store performed calculations
-    history: List[Calculation] = []  # Stores all performed calculations
+    # Initialize the columnar store that keeps performed calculations
+    history: HistoryStore = HistoryStore()  # Stores all performed calculations
+
+    # Number of history entries already written to the history file, and the store
+    # generation they belong to; journal saves append everything after them
+    _persisted: int = 0
+    _persisted_generation: int = 0
 
     @classmethod
-    def add_calculation(cls, calculation: Calculation):
+    def add_calculation(cls, calculation: Calculation, exact: bool = None):
         """
         Add a new calculation to the history.
 
+        The result or error captured on the calculation is stored with it, so history
+        never has to perform it again. A `BatchCalculation` is appended in bulk, one
+        row per operand pair.
+
+        Parameters:
+        -----------
+        calculation (Calculation or BatchCalculation): The calculation to be stored in history.
+        exact (bool, optional): Whether the calculation ran on an exact backend, so its
+            exact values are kept. Defaults to the active backend's.
+        """
+        op_code = OP_CODES[calculation.operation.__name__]
+        if isinstance(calculation, BatchCalculation):
+            cls.history.extend(op_code, calculation.a, calculation.b, calculation.result)
+            logger.debug(f"Added batch calculation: {calculation}")
+            return
+
+        if calculation.result is None and calculation.error is None:
+            try:
+                calculation.perform()  # Not performed yet; capture its outcome once
+            except Exception:  # The error is kept on the calculation
+                pass
+        error = calculation.error
+        result = np.nan if error is not None else calculation.result
+        cls.history.append(op_code, calculation.a, calculation.b, result, error, calculation.expression, exact)  # Add the calculation to the store
+        if log.debug:
+            logger.debug("Added calculation: %s", calculation)
+
+    @classmethod
+    def add_result(cls, operation, a, b, result, exact: bool = None):
+        """
+        Add a successful calculation whose result is already known.
+
+        Used by `Calculator` for results served from its result cache, which are
+        recorded without building a `Calculation`.
+
         Parameters:
         -----------
-        calculation (Calculation): The calculation instance to be stored in history.
+        operation (Callable): The operation function.
+        a: The first operand.
+        b: The second operand.
+        result: The result of the operation.
+        exact (bool, optional): Whether the result came from an exact backend. Defaults
+            to the active backend's.
         """
-        cls.history.append(calculation)  # Add the calculation to the history list
-        logger.debug(f"Added calculation: {calculation}")
+        cls.history.append(OP_CODES[operation.__name__], a, b, result, exact=exact)
+        if log.debug:
+            logger.debug("Added cached result: %s(%s, %s) = %s", operation.__name__, a, b, result)
 
     @classmethod
-    def get_history(cls) -> List[Calculation]:
+    def get_history(cls) -> HistoryStore:
         """
         Retrieve the entire history of calculations.
 
+        When `history_memory_limit` is set, the oldest entries are held in an on-disk
+        spill segment and paged in on access; `resident_count` and `spilled_count` on
+        the returned store tell how many entries are in memory and on disk.
+
         Returns:
         --------
-        List[Calculation]: A list of all Calculation instances stored in history.
+        HistoryStore: The history store, a sequence of `CalculationView` entries.
         """
         logger.debug(f"Retrieving full history. Total calculations: {len(cls.history)}")
-        return cls.history  # Return the full history list
+        return cls.history  # Return the full history store
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        """
+        Summarize the history: entry counts, and sum/min/max/mean of the results.
+
+        The summary is built from running aggregates that the history store updates on
+        every write (including bulk loads and batches), so it costs the same whatever
+        the history size. Failed entries count as errors and are left out of the result
+        aggregates; exact values are aggregated as their floats.
+
+        Returns:
+        --------
+        dict: The 'total' aggregates and the aggregates of each operation ('operations'),
+        as described in `calculator.history_stats.HistoryAggregates.summary`.
+        """
+        stats = cls.history.summary()
+        logger.debug(f"History statistics: {stats['total']}")
+        return stats
 
     @classmethod
     def clear_history(cls):
@@ -75,20 +156,27 @@ class Calculations:
 
         This removes all stored Calculation instances, resetting the history.
         """
-        cls.history.clear()  # Clear the entire history list
-        df = pd.DataFrame(columns=["Operand1", "Operand2", "Operation", "Result"])
-        df.to_csv(HISTORY_FILE, index=False)
+        import pandas as pd  # Imported on first use to keep `import calculator` cheap
+
+        with cls.history.lock:
+            cls.history.clear()  # Clear the entire history list
+            if is_binary(history_config.history_file):
+                write_records(history_config.history_file, [], count=0)
+            else:
+                df = pd.DataFrame(columns=HISTORY_COLUMNS)
+                df.to_csv(history_config.history_file, index=False)
+            cls._mark_persisted()
         logger.debug("Cleared the calculation history.")
         print("History cleared.")
 
     @classmethod
-    def get_latest(cls) -> Calculation:
+    def get_latest(cls) -> CalculationView:
         """
         Get the latest calculation from history.
 
         Returns:
         --------
-        Calculation: The most recent calculation from history.
+        CalculationView: The most recent calculation from history.
         None: If there is no calculation in history.
         """
         if cls.history:
@@ -98,70 +186,385 @@ class Calculations:
         return None  # Return None if the history is empty
 
     @classmethod
-    def find_by_operation(cls, operation_name: str) -> List[Calculation]:
+    def find_by_operation(cls, operation_name: str) -> List[CalculationView]:
         """
         Find and return a list of calculations by operation name.
 
+        The matching positions are read from the history store's per-operation index,
+        which `add_calculation`, `load_history` and `clear_history` keep up to date, so
+        the cost depends on the number of matches rather than on the history size.
+
         Parameters:
         -----------
         operation_name (str): The name of the operation function (e.g., 'add', 'subtract').
 
         Returns:
         --------
-        List[Calculation]: A list of calculations that match the given operation name.
+        List[CalculationView]: A list of calculations that match the given operation name.
         """
-        matching_calculations = [calc for calc in cls.history if calc.operation.__name__ == operation_name]
+        op_code = OP_CODES.get(operation_name)
+        positions = cls.history.positions(op_code) if op_code is not None else []
+        matching_calculations = [CalculationView(cls.history, int(position)) for position in positions]
         logger.debug(f"Found {len(matching_calculations)} calculations for operation: {operation_name}")
         return matching_calculations
     
+    @classmethod
+    def _mark_persisted(cls):
+        """Record that every entry currently in history is in the history file."""
+        cls._persisted = len(cls.history)
+        cls._persisted_generation = cls.history.generation
+
+    @classmethod
+    def _history_frame(cls, start: int = 0, stop: int = None) -> "pandas.DataFrame":
+        """Build a DataFrame of the history entries in `[start, stop)`, with exact values as text."""
+        frame = cls._columns_frame(*cls.history.columns(start, stop))  # Pages in spilled entries
+        _, _, exact = cls.history.side_tables(start, stop)
+        if exact:
+            rows = [(offset, values) for offset, values in enumerate(map(exact.get, range(start, start + len(frame))))
+                    if values is not None]
+            if rows:
+                frame = frame.astype({"Operand1": object, "Operand2": object, "Result": object})
+                offsets, values = zip(*rows)
+                frame.iloc[list(offsets), [0, 1, 3]] = [[str(value) for value in entry] for entry in values]
+        return frame
+
+    @staticmethod
+    def _columns_frame(op_code, operand1, operand2, result) -> "pandas.DataFrame":
+        """Build a history DataFrame from store columns."""
+        import pandas as pd
+
+        operation_names = np.array([operation.__name__ for operation in OPERATIONS])
+        return pd.DataFrame({
+            "Operand1": operand1,
+            "Operand2": operand2,
+            "Operation": operation_names[op_code],  # Save operation name as string
+            "Result": result
+        })
+
     @classmethod
     def save_history(cls):
-        """Save the calculation history to a CSV file."""
-        if cls.history:
-            data = [{
-                "Operand1": calc.a,
-                "Operand2": calc.b,
-                "Operation": calc.operation.__name__,  # Save operation name as string
-                "Result": calc.perform()
-            } for calc in cls.history]
+        """
+        Save the calculation history to a CSV file.
+
+        In the default 'rewrite' mode the whole file is rewritten. In 'journal' mode
+        (`history_mode='journal'`, or `HISTORY_MODE=journal`) only the entries added since the last save are
+        appended, so the cost depends on what changed rather than on the history size.
+        A binary (`.npy`) history file is always rewritten, one page of records at a time.
+
+        The history store's lock is held while saving, so the file holds exactly the
+        entries added before the save started; other threads keep appending meanwhile.
+        """
+        with cls.history.lock:
+            if is_binary(history_config.history_file):
+                if cls.history:
+                    cls._write_binary(history_config.history_file)
+                    print("History saved.")
+            elif history_config.history_mode == "journal":
+                cls._append_journal()
+                print("History saved.")
+            elif cls.history:
+                df = cls._history_frame()
+                df.to_csv(history_config.history_file, index=False)
+                cls._mark_persisted()
+                print("History saved.")
+
+    @classmethod
+    def _write_binary(cls, history_file: str):
+        """Write the whole history to a binary history file, paging in spilled entries."""
+        size, page = len(cls.history), HistoryStore.PAGE_SIZE
+        pages = (cls.history.columns(start, start + page) for start in range(0, size, page))
+        write_records(history_file, pages, count=size)
+        cls._mark_persisted()
+        logger.info(f"Saved {size} entries to binary history file {history_file}.")
+
+    @classmethod
+    def _append_journal(cls):
+        """
+        Append the unsaved history entries to the history file.
+
+        Entries are written in batches of `history_batch_size`, and the file is synced
+        to disk according to `history_fsync`. A header is written if the file is new,
+        and a partial last line left by an interrupted write is dropped first.
+        """
+        if cls._persisted_generation != cls.history.generation:
+            cls._persisted, cls._persisted_generation = 0, cls.history.generation  # History was cleared since
+        start, stop = cls._persisted, len(cls.history)
+        if start == stop:
+            logger.debug("Journal is up to date; nothing to append.")
+            return
+
+        cls._repair_journal_tail()
+        history_file, batch_size, fsync = (
+            history_config.history_file, history_config.history_batch_size, history_config.history_fsync
+        )
+        write_header = not os.path.exists(history_file) or os.path.getsize(history_file) == 0
+        with open(history_file, "a", newline="") as journal:
+            if write_header:
+                journal.write(",".join(HISTORY_COLUMNS) + "\n")
+            for batch_start in range(start, stop, batch_size):
+                batch_stop = min(batch_start + batch_size, stop)
+                cls._history_frame(batch_start, batch_stop).to_csv(journal, header=False, index=False)
+                if fsync == "batch":
+                    journal.flush()
+                    os.fsync(journal.fileno())
+                cls._persisted = batch_stop
+            if fsync == "save":
+                journal.flush()
+                os.fsync(journal.fileno())
+        logger.info(f"Appended {stop - start} entries to history journal {history_file}.")
 
-            df = pd.DataFrame(data)
-            df.to_csv(HISTORY_FILE, index=False)
-            print("History saved.")
+    @staticmethod
+    def _repair_journal_tail():
+        """Truncate a partial last line left in the history file by an interrupted append."""
+        history_file = history_config.history_file
+        if not os.path.exists(history_file):
+            return
+        with open(history_file, "rb+") as journal:
+            end = journal.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            tail_start = max(end - 65536, 0)
+            journal.seek(tail_start)
+            tail = journal.read()
+            if tail.endswith(b"\n"):
+                return
+            last_newline = tail.rfind(b"\n")
+            journal.truncate(tail_start + last_newline + 1 if last_newline >= 0 else 0)
+            logger.warning("Dropped a partial last line from the history journal.")
 
     @classmethod
-    def load_history(cls):
-        """Load calculation history from a CSV file."""
+    def compact_history(cls):
+        """
+        Compact the history file.
+
+        Unsaved entries are appended first. The file is then rewritten with one clean
+        header and only well-formed rows with a known operation, into a temporary file
+        that is synced and atomically swapped in. Binary history files are never
+        appended to, so they are always compact.
+        """
+        import pandas as pd
+
+        history_file = history_config.history_file
+        if is_binary(history_file):
+            print("History compacted.")
+            return
+        cls._append_journal()
+        if not os.path.exists(history_file):
+            print("No history file found.")
+            return
+
+        cls._repair_journal_tail()
+        # Rows are validated by their numbers but written back as their original text,
+        # so exact values such as `1/3` survive compaction
+        df = pd.read_csv(history_file, on_bad_lines="skip", dtype=str, keep_default_na=False).fillna("")
+        operand1, operand2, result = (cls._parse_floats(df[column], errors="coerce")
+                                      for column in ("Operand1", "Operand2", "Result"))
+        valid = df["Operation"].isin(OP_CODES.keys()).to_numpy() & ~np.isnan(operand1) & ~np.isnan(operand2)
+        df.loc[np.isnan(result), "Result"] = ""  # A result that is not a number is a failed entry
+        df = df.loc[valid, HISTORY_COLUMNS]
+
+        temp_file = f"{history_file}.tmp"
+        with open(temp_file, "w", newline="") as compacted:
+            df.to_csv(compacted, index=False)
+            compacted.flush()
+            os.fsync(compacted.fileno())
+        os.replace(temp_file, history_file)
+        logger.info(f"Compacted history file {history_file}: {len(df)} rows kept, {int((~valid).sum())} dropped.")
+        print("History compacted.")
+
+    @staticmethod
+    def _read_history_file(chunksize: int = None, history_file: str = None, exact: bool = False):
+        """
+        Open a CSV history file with explicit column dtypes, optionally as a chunk iterator.
+
+        With `exact`, every column is read as text, for an exact numeric backend to parse.
+        """
+        import pandas as pd
+
+        if exact:
+            return pd.read_csv(history_file or history_config.history_file, dtype=str, keep_default_na=False,
+                               chunksize=chunksize)
+        return pd.read_csv(history_file or history_config.history_file, dtype=HISTORY_DTYPES, chunksize=chunksize)
+
+    @classmethod
+    def _open_history_chunks(cls, history_file: str, chunksize: int = None, backend=None):
+        """
+        Open a CSV or binary history file and return an iterator of column chunks.
+
+        The file is opened before this returns, so a missing file raises
+        `FileNotFoundError` here rather than on first iteration.
+
+        Parameters:
+        -----------
+        history_file (str): The file to read.
+        chunksize (int, optional): The number of rows per chunk.
+        backend (NumericBackend, optional): An exact numeric backend to parse a CSV file's values with.
+
+        Returns:
+        --------
+        Iterator[tuple]: (op_code, operand1, operand2, result) arrays, the whole file at once if `chunksize` is None.
+        With an exact backend, each CSV chunk also has the list of exact (a, b, result) values.
+        """
+        if is_binary(history_file):
+            records = open_records(history_file)
+            step = chunksize or max(len(records), 1)
+            return (record_columns(records[start:start + step]) for start in range(0, len(records), step))
+        if backend is not None and backend.exact:
+            reader = cls._read_history_file(chunksize, history_file, exact=True)
+            return (cls._history_columns(df, backend) for df in (reader if chunksize else [reader]))
+        try:
+            reader = cls._read_history_file(chunksize, history_file)
+        except ValueError:  # The file holds exact text such as `1/3`
+            reader = None
+        return cls._float_chunks(history_file, chunksize, reader)
+
+    @classmethod
+    def _float_chunks(cls, history_file: str, chunksize: int = None, reader=None):
+        """
+        Yield the float columns of a CSV history file, one chunk at a time.
+
+        The file is parsed with float dtypes while it can be. At the first value that is
+        not a plain float, such as the `1/3` an exact backend saves, the rest of the file
+        is read again as text, from the first row not yielded yet, and converted with
+        `_parse_floats`.
+
+        Parameters:
+        -----------
+        history_file (str): The file to read.
+        chunksize (int, optional): The number of rows per chunk; the whole file at once if None.
+        reader (optional): The file opened with float dtypes, or None to read it as text from the start.
+        """
+        import pandas as pd
+
+        done = 0
+        if reader is not None:
+            try:
+                for df in (reader if chunksize else [reader]):
+                    yield cls._history_columns(df)
+                    done += len(df)
+                return
+            except ValueError:
+                logger.debug(f"History file {history_file} holds exact values; reading it as text from row {done}.")
+        reader = pd.read_csv(history_file, dtype=str, keep_default_na=False, chunksize=chunksize,
+                             skiprows=range(1, done + 1))
+        for df in (reader if chunksize else [reader]):
+            numbers = {column: cls._parse_floats(df[column]) for column in ("Operand1", "Operand2", "Result")}
+            yield cls._history_columns(df.assign(**numbers))
+
+    @staticmethod
+    def _parse_floats(column: "pandas.Series", errors: str = "raise") -> np.ndarray:
+        """
+        Convert a text column of a history file to floats.
+
+        Plain numbers are converted in one vectorized pass; exact text such as `1/3` or
+        `0.33333333333333333333` is converted one value at a time through `Fraction`, to
+        the nearest float. Empty cells (the result of a failed entry) are NaN.
+
+        Parameters:
+        -----------
+        column (pandas.Series): The text values.
+        errors (str): 'raise' to raise ValueError for text that is not a number, or
+            'coerce' to make it NaN.
+
+        Returns:
+        --------
+        numpy.ndarray: The float values.
+        """
+        import pandas as pd
+
+        text = column.fillna("").astype(str).str.strip()
+        values = pd.to_numeric(text, errors="coerce").to_numpy(dtype=np.float64, copy=True)
+        pending = np.flatnonzero(np.isnan(values) & (text != "").to_numpy())
+        for index, value in zip(pending.tolist(), text.to_numpy()[pending].tolist()):
+            try:
+                number = float(Fraction(value))
+            except (ValueError, ZeroDivisionError):
+                if errors == "raise" and value.lower() != "nan":
+                    raise ValueError(f"could not convert string to float: {value!r}") from None
+                continue
+            values[index] = number
+        return values
+
+    @staticmethod
+    def _history_columns(df: "pandas.DataFrame", backend=None):
+        """
+        Convert a history DataFrame into store columns.
+
+        Operation names are mapped to op codes for the whole column at once; rows with
+        an unknown operation are skipped. With an exact numeric backend, the text
+        values are parsed one by one, and a row without a result has no exact values.
+
+        Returns:
+        --------
+        tuple: The (op_code, operand1, operand2, result) arrays, and with a backend, the
+        list of exact (a, b, result) values or None per row.
+        """
+        op_codes = df["Operation"].map(OP_CODES)
+        known = op_codes.notna().to_numpy()
+        if not known.all():
+            unknown = sorted(set(df["Operation"][~known].astype(str)))
+            logger.warning(f"Skipped {int((~known).sum())} rows with unknown operations in history file: {unknown}")
+        if backend is None:
+            return (
+                op_codes[known].to_numpy(dtype=np.int8),
+                df["Operand1"][known].to_numpy(dtype=np.float64),
+                df["Operand2"][known].to_numpy(dtype=np.float64),
+                df["Result"][known].to_numpy(dtype=np.float64),
+            )
+        parse = backend.parse
+        exact = [(parse(a), parse(b), parse(result)) if result else None
+                 for a, b, result in zip(df["Operand1"][known], df["Operand2"][known], df["Result"][known])]
+        return (
+            op_codes[known].to_numpy(dtype=np.int8),
+            np.array([float(values[0]) if values else float(a) for values, a in zip(exact, df["Operand1"][known])]),
+            np.array([float(values[1]) if values else float(b) for values, b in zip(exact, df["Operand2"][known])]),
+            np.array([float(values[2]) if values else np.nan for values in exact]),
+            exact,
+        )
+
+    @classmethod
+    def stream_history(cls, chunksize: int = 100000, history_file: str = None):
+        """
+        Stream the history file as column chunks without loading it into history.
+
+        Parameters:
+        -----------
+        chunksize (int): The number of rows read per chunk.
+        history_file (str, optional): The file to read. Defaults to the configured history file.
+
+        Returns:
+        --------
+        Iterator[tuple]: One (op_code, operand1, operand2, result) tuple of arrays per chunk.
+        """
+        yield from cls._open_history_chunks(history_file or history_config.history_file, chunksize)
+
+    @classmethod
+    def load_history(cls, chunksize: int = None):
+        """
+        Load calculation history from a CSV or binary history file.
+
+        Columns are parsed with explicit dtypes, or memory-mapped from a binary file, and
+        appended to the history store in bulk. With `chunksize`, the file is read that
+        many rows at a time, so parsing memory stays bounded however large the file is.
+        With an exact numeric backend active, the values of a CSV file are parsed with
+        it instead and kept exactly.
+
+        Parameters:
+        -----------
+        chunksize (int, optional): The number of rows read per chunk; the whole file at once if None.
+        """
         try:
-            df = pd.read_csv(HISTORY_FILE)
+            chunks = cls._open_history_chunks(history_config.history_file, chunksize, get_backend())
             
-            # Clear the current history before loading from the file
-            cls.history.clear()
-
-            # Iterate over each row in the dataframe
-            for _, row in df.iterrows():
-                # Fetch operands and operation from CSV
-                operand1 = Decimal(row["Operand1"])
-                operand2 = Decimal(row["Operand2"])
-                operation_name = row["Operation"]
-
-                # Map operation name to the corresponding operation function
-                if operation_name == "add":
-                    operation = add
-                elif operation_name == "subtract":
-                    operation = subtract
-                elif operation_name == "multiply":
-                    operation = multiply
-                elif operation_name == "divide":
-                    operation = divide
-                else:
-                    logger.warning(f"Unknown operation '{operation_name}' in history file.")
-                    continue  # Skip if the operation is not recognized
-
-                # Create the Calculation instance and add it to the history
-                calculation = Calculation(operand1, operand2, operation)
-                cls.history.append(calculation)
+            with cls.history.lock:
+                # Clear the current history before loading from the file
+                cls.history.clear()
+
+                # Append each chunk of rows to the store in bulk
+                for columns in chunks:
+                    cls.history.extend(*columns)
 
+                cls._mark_persisted()
             print("History loaded successfully.")
             logger.info(f"History loaded. Total calculations: {len(cls.history)}")
 
@@ -170,4 +573,38 @@ class Calculations:
             logger.warning("History file not found.")
         except Exception as e:
             print(f"Error loading history: {e}")
-            logger.error(f"Error loading history: {e}")
\ No newline at end of file
+            logger.error(f"Error loading history: {e}")
+
+    @classmethod
+    def convert_history(cls, target: str, source: str = None, chunksize: int = 100000) -> int:
+        """
+        Convert a history file between the CSV and binary formats.
+
+        The formats are chosen by file extension, so this also copies a file to the
+        same format. The source is streamed `chunksize` rows at a time and the history
+        in memory is not touched.
+
+        Parameters:
+        -----------
+        target (str): The file to write.
+        source (str, optional): The file to read. Defaults to the configured history file.
+        chunksize (int): The number of rows read and written at a time.
+
+        Returns:
+        --------
+        int: The number of entries written.
+        """
+        source = source or history_config.history_file
+        chunks = cls._open_history_chunks(source, chunksize)
+        if is_binary(target):
+            count = write_records(target, chunks)
+        else:
+            count = 0
+            with open(target, "w", newline="") as csv_file:
+                csv_file.write(",".join(HISTORY_COLUMNS) + "\n")
+                for columns in chunks:
+                    cls._columns_frame(*columns).to_csv(csv_file, header=False, index=False)
+                    count += len(columns[0])
+        logger.info(f"Converted history file {source} to {target}: {count} entries.")
+        print(f"History converted: {count} entries written to {target}.")
+        return count
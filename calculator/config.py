@@ -0,0 +1,106 @@
+"""
+Configuration Module.
+
+This module defines the `HistoryConfig` class, which holds the settings used to
+persist calculation history and the numbers it holds, and the shared
+`history_config` instance.
+
+Settings are resolved lazily: each one is read from the environment (including a
+`.env` file) the first time it is used, unless it was injected earlier with
+`history_config.configure(...)`. Importing the calculator therefore does not read
+the environment, configure logging or load the application's plugins.
+"""
+
+# Import logging
+import logging
+import os
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+class HistoryConfig:
+    """
+    History persistence and numeric settings, resolved on first use.
+
+    Attributes:
+    -----------
+    history_file : str or None
+        The history file path (`HISTORY_FILE`).
+    history_mode : str
+        'rewrite' saves the whole history every time; 'journal' appends only new entries (`HISTORY_MODE`).
+    history_fsync : str
+        When journal saves fsync: after every 'batch', once per 'save', or 'never' (`HISTORY_FSYNC`).
+    history_batch_size : int
+        The number of entries written per journal batch (`HISTORY_BATCH_SIZE`).
+    history_memory_limit : int
+        The number of entries kept in memory before the oldest spill to disk; 0 means no limit (`HISTORY_MEMORY_LIMIT`).
+    history_spill_file : str or None
+        The file spilled entries are written to; a temporary file if unset (`HISTORY_SPILL_FILE`).
+    numeric_backend : str
+        The session numeric backend: 'float', 'decimal' or 'fraction' (`NUMERIC_BACKEND`).
+    decimal_precision : int
+        The precision of the 'decimal' numeric backend (`DECIMAL_PRECISION`).
+    """
+
+    # Setting name -> (environment variable, default value, type)
+    SETTINGS = {
+        "history_file": ("HISTORY_FILE", None, str),
+        "history_mode": ("HISTORY_MODE", "rewrite", str),
+        "history_fsync": ("HISTORY_FSYNC", "save", str),
+        "history_batch_size": ("HISTORY_BATCH_SIZE", 10000, int),
+        "history_memory_limit": ("HISTORY_MEMORY_LIMIT", 0, int),
+        "history_spill_file": ("HISTORY_SPILL_FILE", None, str),
+        "numeric_backend": ("NUMERIC_BACKEND", "float", str),
+        "decimal_precision": ("DECIMAL_PRECISION", 28, int),
+    }
+
+    _dotenv_loaded = False  # The .env file is read at most once per process
+
+    def __getattr__(self, name: str):
+        """
+        Resolve a setting from the environment the first time it is read.
+
+        The resolved value is cached on the instance, so later reads are plain
+        attribute lookups.
+
+        Raises:
+        -------
+        AttributeError: If `name` is not a known setting.
+        """
+        if name not in self.SETTINGS:
+            raise AttributeError(name)
+        env_var, default, cast = self.SETTINGS[name]
+        if not HistoryConfig._dotenv_loaded:
+            from dotenv import load_dotenv  # Imported on first use only
+            load_dotenv()
+            HistoryConfig._dotenv_loaded = True
+        raw = os.environ.get(env_var)
+        value = cast(raw) if raw else default
+        setattr(self, name, value)
+        logger.debug(f"Resolved history setting {name}={value!r} from {env_var}.")
+        return value
+
+    def configure(self, **settings):
+        """
+        Inject settings directly, overriding the environment.
+
+        Parameters:
+        -----------
+        **settings: Setting names and values, e.g. `history_file="history.csv"`.
+
+        Raises:
+        -------
+        TypeError: If a setting name is unknown.
+        """
+        for name, value in settings.items():
+            if name not in self.SETTINGS:
+                raise TypeError(f"Unknown history setting: {name}")
+            setattr(self, name, value)
+
+    def reset(self):
+        """Forget resolved and injected settings, so they are resolved again on next use."""
+        for name in self.SETTINGS:
+            self.__dict__.pop(name, None)
+
+# Shared settings used by `Calculations`
+history_config = HistoryConfig()
@@ -0,0 +1,213 @@
+"""
+Expression Module.
+
+This module compiles arithmetic expressions such as `(a + 3) * 4 / 7` into
+`CompiledExpression` objects that evaluate them with the functions of
+`calculator.operations`.
+
+An expression is parsed with Python's `ast` module and checked against a small
+grammar: numbers, variable names, parentheses, unary `+`/`-` and the binary
+operators `+`, `-`, `*` and `/`. Every binary operator is rewritten into a call to
+`add`, `subtract`, `multiply` or `divide` (unary minus into `subtract(0, x)`) and
+the result compiled to a Python code object, so evaluating a compiled expression
+does not parse or walk the tree again. `compile_expression` caches compiled
+expressions by their text, so a formula evaluated repeatedly with different
+variables is only parsed once.
+
+Number literals are compiled as references to the expression's constants, so that
+an exact numeric backend (see `calculator.numeric`) evaluates `0.1` as
+`Decimal('0.1')` or `Fraction(1, 10)` without compiling the expression again.
+"""
+
+# Import logging
+import ast
+import logging
+from functools import lru_cache
+
+from calculator.operations import add, subtract, multiply, divide
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+EXPRESSION_CACHE_SIZE = 1024  # Number of compiled expressions kept, by text
+
+# Binary operator nodes and the operation each one is compiled to
+_BINARY_OPERATIONS = {ast.Add: add, ast.Sub: subtract, ast.Mult: multiply, ast.Div: divide}
+
+# The globals compiled expressions run with: the operations, and no builtins. Variable
+# names starting with an underscore are rejected, so they cannot shadow these.
+_NAMESPACE = {"__builtins__": {}}
+_NAMESPACE.update({f"_{operation.__name__}": operation for operation in _BINARY_OPERATIONS.values()})
+
+class _OperationCalls(ast.NodeTransformer):
+    """Rewrite a checked expression tree into calls to the operation functions."""
+
+    def __init__(self):
+        self.names = set()
+        self.constants = []
+
+    def visit_BinOp(self, node):
+        operation = _BINARY_OPERATIONS.get(type(node.op))
+        if operation is None:
+            raise ValueError(f"Unsupported operator in expression: {type(node.op).__name__}")
+        return self._call(operation, self.visit(node.left), self.visit(node.right))
+
+    def visit_UnaryOp(self, node):
+        operand = self.visit(node.operand)
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        if not isinstance(node.op, ast.USub):
+            raise ValueError(f"Unsupported operator in expression: {type(node.op).__name__}")
+        return self._call(subtract, ast.Constant(0), operand)
+
+    def visit_Constant(self, node):
+        if type(node.value) not in (int, float):
+            raise ValueError(f"Unsupported value in expression: {node.value!r}")
+        self.constants.append(node.value)
+        return ast.Name(f"_k{len(self.constants) - 1}", ast.Load())
+
+    def visit_Name(self, node):
+        if node.id.startswith("_"):
+            raise ValueError(f"Invalid variable name: {node.id}")
+        self.names.add(node.id)
+        return node
+
+    def generic_visit(self, node):
+        if not isinstance(node, ast.Expression):
+            raise ValueError(f"Unsupported syntax in expression: {type(node).__name__}")
+        return super().generic_visit(node)
+
+    @staticmethod
+    def _call(operation, left, right) -> ast.Call:
+        return ast.Call(func=ast.Name(f"_{operation.__name__}", ast.Load()), args=[left, right], keywords=[])
+
+class CompiledExpression:
+    """
+    An arithmetic expression compiled for repeated evaluation.
+
+    The outermost operation is kept apart from its two operands, so that callers can
+    record the whole expression as one calculation: `operands()` evaluates both sides
+    and `operation` combines them.
+
+    Attributes:
+    -----------
+    text : str
+        The source text of the expression.
+    operation : Callable
+        The outermost operation of the expression.
+    names : frozenset
+        The variable names the expression uses.
+    constants : tuple
+        The number literals of the expression, in order.
+    """
+
+    __slots__ = ("text", "operation", "names", "constants", "_left", "_right", "_namespaces")
+
+    def __init__(self, text: str, operation, names: frozenset, left, right, constants: tuple = ()):
+        """
+        Initializes a compiled expression.
+
+        Parameters:
+        -----------
+        text (str): The source text of the expression.
+        operation (Callable): The outermost operation.
+        names (frozenset): The variable names the expression uses.
+        left (types.CodeType): The compiled first operand of the outermost operation.
+        right (types.CodeType): The compiled second operand of the outermost operation.
+        constants (tuple): The number literals the compiled operands refer to.
+        """
+        self.text = text
+        self.operation = operation
+        self.names = names
+        self.constants = constants
+        self._left = left
+        self._right = right
+        self._namespaces = {None: self._namespace(constants)}  # Globals per exact backend
+
+    @staticmethod
+    def _namespace(constants) -> dict:
+        """Return the globals that bind the constants of an expression."""
+        namespace = dict(_NAMESPACE)
+        namespace.update((f"_k{index}", value) for index, value in enumerate(constants))
+        return namespace
+
+    def operands(self, variables: dict = None, backend=None) -> tuple:
+        """
+        Evaluate the two operands of the outermost operation.
+
+        Parameters:
+        -----------
+        variables (dict, optional): The value of each variable the expression uses.
+        backend (NumericBackend, optional): An exact numeric backend that the constants
+            and variables are converted to. Used as given if None.
+
+        Returns:
+        --------
+        tuple: The (a, b) operands.
+
+        Raises:
+        -------
+        ValueError: If a variable has no value.
+        ZeroDivisionError: If a division inside an operand divides by zero.
+        """
+        variables = variables or {}
+        if not self.names <= variables.keys():
+            missing = ", ".join(sorted(self.names - variables.keys()))
+            raise ValueError(f"No value for variable(s): {missing}")
+        if backend is not None and backend.exact:
+            namespace = self._namespaces.get(backend)
+            if namespace is None:
+                namespace = self._namespaces[backend] = self._namespace(map(backend.convert, self.constants))
+            variables = {name: backend.convert(value) for name, value in variables.items()}
+        else:
+            namespace = self._namespaces[None]
+        return eval(self._left, namespace, variables), eval(self._right, namespace, variables)  # pylint: disable=eval-used
+
+    def evaluate(self, variables: dict = None):
+        """
+        Evaluate the whole expression.
+
+        Parameters:
+        -----------
+        variables (dict, optional): The value of each variable the expression uses.
+
+        Returns:
+        --------
+        int or float: The value of the expression.
+        """
+        return self.operation(*self.operands(variables))
+
+    def __repr__(self) -> str:
+        """Return a string representation of the compiled expression."""
+        return f"CompiledExpression({self.text!r})"
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(text: str) -> CompiledExpression:
+    """
+    Parse and compile an arithmetic expression, or return it from the cache.
+
+    Parameters:
+    -----------
+    text (str): The expression, e.g. '(2 + 3) * x'.
+
+    Returns:
+    --------
+    CompiledExpression: The compiled expression.
+
+    Raises:
+    -------
+    ValueError: If the text is not a supported arithmetic expression, or has no operator.
+    """
+    try:
+        tree = ast.parse(text.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression: {text}") from e
+    calls = _OperationCalls()
+    body = calls.visit(tree).body
+    if not isinstance(body, ast.Call):
+        raise ValueError(f"Expression has no operation: {text}")
+    operation = _NAMESPACE[body.func.id]
+    left, right = (compile(ast.fix_missing_locations(ast.Expression(operand)), "<expression>", "eval")
+                   for operand in body.args)
+    logger.debug(f"Compiled expression: {text}")
+    return CompiledExpression(text, operation, frozenset(calls.names), left, right, tuple(calls.constants))
@@ -0,0 +1,155 @@
+"""
+History File Module.
+
+This module reads and writes the binary history file format. A binary history file is
+a NumPy `.npy` file holding one fixed-size record per entry (`RECORD_DTYPE`): the op
+code, then the two operands and the result as 64-bit floats. The `.npy` header stores
+the record layout and the number of entries, so the file is written and read with
+plain memory copies, and can be memory-mapped, instead of formatting and parsing text.
+
+Op codes are positions in `calculator.operations.OPERATIONS`, the op-code order of the
+operation registry; rows with an op code outside that table are skipped when read.
+Operations registered at runtime get their op codes in registration order, so a binary
+file that holds them reads back correctly only once they are registered again in the
+same order. CSV history files store operation names and have no such constraint.
+"""
+
+# Import logging
+import logging
+import os
+import shutil
+
+# Import NumPy for the record arrays and the .npy format
+import numpy as np
+
+from calculator.operations import OPERATIONS
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+BINARY_EXTENSION = ".npy"  # History files with this extension use the binary format
+
+# One history entry: 25 bytes, little-endian, no padding
+RECORD_DTYPE = np.dtype([
+    ("op_code", np.int8),
+    ("operand1", "<f8"),
+    ("operand2", "<f8"),
+    ("result", "<f8"),
+])
+
+def is_binary(path) -> bool:
+    """Return True if the history file at `path` uses the binary format, by its extension."""
+    return str(path).lower().endswith(BINARY_EXTENSION)
+
+def to_records(op_code, operand1, operand2, result) -> np.ndarray:
+    """
+    Pack history columns into an array of records.
+
+    Parameters:
+    -----------
+    op_code (array_like): The op codes.
+    operand1 (array_like): The first operands.
+    operand2 (array_like): The second operands.
+    result (array_like): The results.
+
+    Returns:
+    --------
+    numpy.ndarray: The records, with dtype `RECORD_DTYPE`.
+    """
+    records = np.empty(len(op_code), dtype=RECORD_DTYPE)
+    records["op_code"] = op_code
+    records["operand1"] = operand1
+    records["operand2"] = operand2
+    records["result"] = result
+    return records
+
+def record_columns(records: np.ndarray) -> tuple:
+    """
+    Unpack records into history columns, skipping rows with an unknown op code.
+
+    Parameters:
+    -----------
+    records (numpy.ndarray): Records with dtype `RECORD_DTYPE`.
+
+    Returns:
+    --------
+    tuple: The (op_code, operand1, operand2, result) arrays.
+    """
+    op_code = records["op_code"]
+    known = (op_code >= 0) & (op_code < len(OPERATIONS))
+    if not known.all():
+        logger.warning(f"Skipped {int((~known).sum())} rows with unknown op codes in history file.")
+        records = records[known]
+    return records["op_code"], records["operand1"], records["operand2"], records["result"]
+
+def open_records(path) -> np.ndarray:
+    """
+    Memory-map a binary history file.
+
+    Parameters:
+    -----------
+    path (str): The history file path.
+
+    Returns:
+    --------
+    numpy.ndarray: A read-only array of records backed by the file.
+
+    Raises:
+    -------
+    FileNotFoundError: If the file does not exist.
+    ValueError: If the file is not a binary history file.
+    """
+    records = np.load(path, mmap_mode="r", allow_pickle=False)
+    if records.dtype != RECORD_DTYPE or records.ndim != 1:
+        raise ValueError(f"{path} is not a binary history file (dtype {records.dtype}, shape {records.shape})")
+    return records
+
+def _write_header(file, count: int):
+    """Write a .npy header for `count` records."""
+    header = {"descr": np.lib.format.dtype_to_descr(RECORD_DTYPE), "fortran_order": False, "shape": (count,)}
+    np.lib.format.write_array_header_1_0(file, header)
+
+def write_records(path, pages, count: int = None) -> int:
+    """
+    Write history columns to a binary history file.
+
+    The columns are written one page at a time, so memory stays bounded by the page
+    size. When `count` is not known up front (e.g. when converting a CSV file), the
+    records are first streamed to a temporary file next to `path` and copied behind
+    the header once the count is known.
+
+    Parameters:
+    -----------
+    path (str): The history file path.
+    pages (Iterable[tuple]): (op_code, operand1, operand2, result) column chunks, oldest first.
+    count (int, optional): The total number of entries in `pages`, if known.
+
+    Returns:
+    --------
+    int: The number of entries written.
+    """
+    if count is not None:
+        written = 0
+        with open(path, "wb") as history_file:
+            _write_header(history_file, count)
+            for page in pages:
+                to_records(*page).tofile(history_file)
+                written += len(page[0])
+        if written != count:
+            raise ValueError(f"Expected {count} history entries, got {written}")
+        return written
+
+    temp_file = f"{path}.tmp"
+    written = 0
+    try:
+        with open(temp_file, "wb") as raw:
+            for page in pages:
+                to_records(*page).tofile(raw)
+                written += len(page[0])
+        with open(path, "wb") as history_file, open(temp_file, "rb") as raw:
+            _write_header(history_file, written)
+            shutil.copyfileobj(raw, history_file, 1 << 20)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+    return written
@@ -0,0 +1,170 @@
+"""
+History Reader Module.
+
+This module defines the `HistoryReader` class, which answers read-only queries (count,
+filter by operation, paging and tail) straight off a persisted history file, without
+loading it into `Calculations.history` or building `Calculation` objects.
+
+A binary (`.npy`) history file is memory-mapped and scanned one page of records at a
+time, so resident memory stays flat whatever the file size. A CSV history file is
+streamed in chunks of the same size instead.
+"""
+
+# Import logging
+import logging
+from collections import deque, namedtuple
+
+import numpy as np
+
+from calculator.calculations import Calculations
+from calculator.config import history_config
+from calculator.history_file import is_binary, open_records, record_columns
+from calculator.history_store import HistoryStore
+from calculator.operations import OPERATIONS, OP_CODES
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# One entry of a history file: its position, operands, operation name and result
+HistoryRow = namedtuple("HistoryRow", ["position", "a", "b", "operation", "result"])
+
+def _operation_names() -> np.ndarray:
+    """Return the registered operation names in op-code order, including runtime ones."""
+    return np.array([operation.__name__ for operation in OPERATIONS])
+
+class HistoryReader:
+    """
+    Read-only queries over a persisted history file.
+
+    Positions count the entries of the file that `Calculations.load_history` would
+    load, from 0, so they match the entry numbers of the loaded history.
+
+    Attributes:
+    -----------
+    history_file : str
+        The history file being read.
+    page_size : int
+        The number of entries scanned at a time.
+    """
+
+    def __init__(self, history_file: str = None, page_size: int = HistoryStore.PAGE_SIZE):
+        """
+        Initializes a reader over a history file.
+
+        Parameters:
+        -----------
+        history_file (str, optional): The file to read. Defaults to the configured history file.
+        page_size (int): The number of entries scanned at a time.
+        """
+        self.history_file = history_file or history_config.history_file
+        self.page_size = page_size
+
+    def _pages(self):
+        """Yield (op_code, operand1, operand2, result) pages of the whole file."""
+        if is_binary(self.history_file):
+            records = open_records(self.history_file)
+            for start in range(0, len(records), self.page_size):
+                yield record_columns(records[start:start + self.page_size])
+        else:
+            yield from Calculations.stream_history(self.page_size, self.history_file)
+
+    def _matching_pages(self, operation: str = None):
+        """
+        Yield (positions, op_code, operand1, operand2, result) pages of the matching entries.
+
+        Raises:
+        -------
+        ValueError: If the operation is unknown.
+        """
+        op_code = None
+        if operation is not None:
+            if operation not in OP_CODES:
+                raise ValueError(f"Unknown operation: {operation}")
+            op_code = OP_CODES[operation]
+        position = 0
+        for columns in self._pages():
+            positions = np.arange(position, position + len(columns[0]))
+            position += len(positions)
+            if op_code is not None:
+                mask = columns[0] == op_code
+                positions, columns = positions[mask], tuple(column[mask] for column in columns)
+            if len(positions):
+                yield (positions, *columns)
+
+    @staticmethod
+    def _page_rows(page):
+        """Turn one page of columns into `HistoryRow` tuples."""
+        positions, op_code, operand1, operand2, result = page
+        return map(HistoryRow, positions.tolist(), operand1.tolist(), operand2.tolist(),
+                   _operation_names()[op_code].tolist(), result.tolist())
+
+    def count(self, operation: str = None) -> int:
+        """
+        Count the entries in the file, or only those of one operation.
+
+        Parameters:
+        -----------
+        operation (str, optional): The operation name (e.g., 'divide').
+
+        Returns:
+        --------
+        int: The number of matching entries.
+        """
+        total = sum(len(page[0]) for page in self._matching_pages(operation))
+        logger.debug(f"Counted {total} {operation or 'total'} entries in {self.history_file}.")
+        return total
+
+    def rows(self, operation: str = None, offset: int = 0, limit: int = None):
+        """
+        Yield the matching entries, oldest first.
+
+        Parameters:
+        -----------
+        operation (str, optional): Only yield entries of this operation.
+        offset (int): The number of matching entries to skip.
+        limit (int, optional): The largest number of entries to yield.
+
+        Returns:
+        --------
+        Iterator[HistoryRow]: The matching entries.
+        """
+        for page in self._matching_pages(operation):
+            if offset >= len(page[0]):
+                offset -= len(page[0])  # Skip whole pages without building rows
+                continue
+            stop = offset + limit if limit is not None else None
+            page = tuple(column[offset:stop] for column in page)
+            offset = 0
+            yield from self._page_rows(page)
+            if limit is not None:
+                limit -= len(page[0])
+                if limit <= 0:
+                    return
+
+    def tail(self, count: int, operation: str = None) -> list:
+        """
+        Return the last `count` matching entries, oldest first.
+
+        Only the last pages are kept while scanning, so memory is bounded by `count`
+        plus one page.
+
+        Parameters:
+        -----------
+        count (int): The number of entries to return.
+        operation (str, optional): Only return entries of this operation.
+
+        Returns:
+        --------
+        List[HistoryRow]: The last matching entries.
+        """
+        if count <= 0:
+            return []
+        kept, kept_size = deque(), 0
+        for page in self._matching_pages(operation):
+            page = tuple(np.array(column[-count:]) for column in page)  # Copy off the memory map
+            kept.append(page)
+            kept_size += len(page[0])
+            while kept_size - len(kept[0][0]) >= count:
+                kept_size -= len(kept.popleft()[0])
+        rows = [row for page in kept for row in self._page_rows(page)]
+        return rows[-count:]
@@ -0,0 +1,140 @@
+"""
+History Statistics Module.
+
+This module defines the `HistoryAggregates` class: running per-operation aggregates of
+the calculation history (entry count, and the count, sum, min and max of the results),
+which the `HistoryStore` updates on every write. Summaries are built from them in
+O(number of operations), so `history stats` answers in the same time whatever the
+history size.
+
+Aggregates are computed from the float result column. Failed entries, whose result
+is NaN, are counted as entries and errors but left out of the result aggregates.
+"""
+
+# Import logging
+import logging
+import math
+
+import numpy as np
+
+from calculator.operations import OPERATIONS
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+class HistoryAggregates:
+    """
+    Running aggregates of history entries, per op code.
+
+    Attributes:
+    -----------
+    counts : list
+        The number of entries per op code.
+    result_counts : list
+        The number of entries with a result (not NaN) per op code.
+    sums : list
+        The sum of the results per op code.
+    mins : list
+        The smallest result per op code (inf while there is none).
+    maxs : list
+        The largest result per op code (-inf while there is none).
+    """
+
+    def __init__(self):
+        """Initializes empty aggregates."""
+        self.reset()
+
+    def reset(self):
+        """Forget all entries."""
+        self.counts = []
+        self.result_counts = []
+        self.sums = []
+        self.mins = []
+        self.maxs = []
+
+    def _grow(self, op_code: int):
+        """Make room for the aggregates of an op code."""
+        missing = op_code + 1 - len(self.counts)
+        self.counts.extend([0] * missing)
+        self.result_counts.extend([0] * missing)
+        self.sums.extend([0.0] * missing)
+        self.mins.extend([math.inf] * missing)
+        self.maxs.extend([-math.inf] * missing)
+
+    def add(self, op_code: int, result: float):
+        """
+        Add one entry in O(1).
+
+        Parameters:
+        -----------
+        op_code (int): The op code of the entry.
+        result (float): The result of the entry, NaN if it failed.
+        """
+        if op_code >= len(self.counts):
+            self._grow(op_code)
+        self.counts[op_code] += 1
+        if result == result:  # NaN is not equal to itself
+            self.result_counts[op_code] += 1
+            self.sums[op_code] += result
+            if result < self.mins[op_code]:
+                self.mins[op_code] = result
+            if result > self.maxs[op_code]:
+                self.maxs[op_code] = result
+
+    def add_many(self, op_code, results: np.ndarray):
+        """
+        Add many entries with one vectorized pass per op code.
+
+        Parameters:
+        -----------
+        op_code (int or numpy.ndarray): One op code for all entries, or one per entry.
+        results (numpy.ndarray): The float results of the entries.
+        """
+        if np.ndim(op_code) == 0:
+            self._add_group(int(op_code), results)
+            return
+        for code in np.unique(op_code).tolist():
+            self._add_group(code, results[op_code == code])
+
+    def _add_group(self, op_code: int, results: np.ndarray):
+        """Add entries that share one op code."""
+        if op_code >= len(self.counts):
+            self._grow(op_code)
+        self.counts[op_code] += len(results)
+        values = results[~np.isnan(results)]
+        if len(values):
+            self.result_counts[op_code] += len(values)
+            self.sums[op_code] += float(values.sum())
+            self.mins[op_code] = min(self.mins[op_code], float(values.min()))
+            self.maxs[op_code] = max(self.maxs[op_code], float(values.max()))
+
+    @staticmethod
+    def _describe(count: int, result_count: int, total: float, smallest: float, largest: float) -> dict:
+        """Summarize the aggregates of one operation, or of all of them."""
+        return {
+            "count": count,
+            "errors": count - result_count,
+            "sum": total,
+            "min": smallest if result_count else None,
+            "max": largest if result_count else None,
+            "mean": total / result_count if result_count else None,
+        }
+
+    def summary(self) -> dict:
+        """
+        Summarize the aggregates, per operation and in total.
+
+        Returns:
+        --------
+        dict: The count, errors, sum, min, max and mean of the results of all entries
+        ('total'), and of every operation with entries ('operations', by name).
+        Min, max and mean are None when no entry has a result.
+        """
+        operations = {
+            OPERATIONS[code].__name__: self._describe(count, self.result_counts[code], self.sums[code],
+                                                      self.mins[code], self.maxs[code])
+            for code, count in enumerate(self.counts) if count
+        }
+        total = self._describe(sum(self.counts), sum(self.result_counts), sum(self.sums),
+                               min(self.mins, default=math.inf), max(self.maxs, default=-math.inf))
+        return {"total": total, "operations": operations}
@@ -0,0 +1,786 @@
+"""
+History Store Module.
+
+This module defines the `HistoryStore` class, a columnar, array-backed container for
+calculation history, and the `CalculationView` class used to read single entries back
+out of it.
+
+Instead of keeping one `Calculation` object per entry, the store keeps four NumPy
+columns: the two operands, the result and a one-byte op code. An entry costs 25 bytes
+of column space, and bulk appends (e.g. from `Calculator.evaluate_batch`) are plain
+array copies. Operands and results are stored as 64-bit floats; while an exact numeric
+backend is active (see `calculator.numeric`), the `Decimal` or `Fraction` values of
+each entry are kept next to them, and read back instead of the floats. The store also keeps
+a per-operation index of entry positions, so the entries of one operation are found
+without scanning the whole history.
+
+The number of entries kept in memory can be capped (`history_memory_limit`). Past the
+cap, the oldest entries are spilled to an on-disk segment of fixed-size records (the
+`RECORD_DTYPE` layout of binary history files, without a header) and read back from
+it, a page at a time, through a memory map. The errors, expressions and exact values of
+spilled entries go with them, pickled into a side segment next to it (`<spill>.side`),
+with an index of (position, offset, length) records (`<spill>.side-index`) that is
+binary-searched through a memory map, so nothing of a spilled entry stays in memory.
+
+Every write also updates running per-operation aggregates of the results (see
+`calculator.history_stats`), so counts and sum/min/max/mean need no scan of the history.
+
+The store is safe to share between threads. Appends do not take a lock: each thread
+appends to its own buffer (a shard), and the shards are merged into the columns, in
+the order the entries were appended, before anything reads the store, or when a shard
+fills up. Reads, bulk writes and merges are serialized by the store's `lock`, which
+callers can also hold to read a consistent snapshot (e.g. while saving) without
+stopping other threads from appending.
+"""
+
+# Import logging
+import heapq
+import itertools
+import logging
+import math
+import os
+import pickle
+import tempfile
+import threading
+import weakref
+from collections import deque
+from decimal import Decimal
+from fractions import Fraction
+from functools import wraps
+
+# Import NumPy for the column arrays
+import numpy as np
+
+# Import the operations table to map op codes back to operation functions
+from calculator.operations import OPERATIONS
+from calculator.config import history_config
+from calculator.history_file import RECORD_DTYPE, to_records
+from calculator.history_stats import HistoryAggregates
+from calculator.numeric import get_backend
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+_EXACT_TYPES = frozenset((Decimal, Fraction))  # Results whose values an exact backend keeps besides their floats
+
+def _to_float(value) -> float:
+    """Convert a number to a float column value, as ±inf if it is beyond the float range."""
+    try:
+        return float(value)
+    except OverflowError:
+        return math.inf if value > 0 else -math.inf
+
+def _remove_files(*paths: str):
+    """Delete temporary spill segments, ignoring files that are already gone."""
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def _dump_side(error, expression, exact) -> bytes:
+    """Pickle the side values of one spilled entry; an error that cannot be pickled back is kept as its text."""
+    if error is not None:
+        try:
+            data = pickle.dumps((error, expression, exact))
+            pickle.loads(data)  # e.g. an exception whose __init__ does not take its args
+            return data
+        except Exception:  # pylint: disable=broad-except
+            error = RuntimeError(f"{type(error).__name__}: {error}")
+    return pickle.dumps((error, expression, exact))
+
+def _synchronized(method):
+    """Run a `HistoryStore` method under the store lock, after merging the appends pending in shards."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            if self._pending:
+                self._merge_shards()
+            return method(self, *args, **kwargs)
+    return wrapper
+
+class CalculationView:
+    """
+    A lightweight, read-only view of one entry in a `HistoryStore`.
+
+    The view holds only a reference to the store and the entry position; the operands,
+    result and operation are read from the columns (or the spill segment) on access.
+    It exposes the same attributes as `Calculation` (`a`, `b`, `operation`, `perform()`),
+    so code that reads history does not need to know how it is stored. A view stays
+    valid until the store is cleared.
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "HistoryStore", index: int):
+        """
+        Initializes a view over one store entry.
+
+        Parameters:
+        -----------
+        store (HistoryStore): The store holding the entry.
+        index (int): The position of the entry in the store.
+        """
+        self._store = store
+        self._index = index
+
+    @property
+    def a(self) -> float:
+        """The first operand of the entry, exact if it was recorded exactly."""
+        exact = self._store._side(2, self._index)
+        return exact[0] if exact is not None else float(self._store._read("operand1", self._index))
+
+    @property
+    def b(self) -> float:
+        """The second operand of the entry, exact if it was recorded exactly."""
+        exact = self._store._side(2, self._index)
+        return exact[1] if exact is not None else float(self._store._read("operand2", self._index))
+
+    @property
+    def result(self) -> float:
+        """The stored result of the entry, exact if it was recorded exactly."""
+        exact = self._store._side(2, self._index)
+        return exact[2] if exact is not None else float(self._store._read("result", self._index))
+
+    @property
+    def position(self) -> int:
+        """The position of the entry in the store, counted from 0 like history file entries."""
+        return self._index
+
+    @property
+    def error(self):
+        """The error raised by the entry, or None if it succeeded."""
+        return self._store._side(0, self._index)
+
+    @property
+    def expression(self):
+        """The expression the entry was recorded for, or None for a single operation."""
+        return self._store._side(1, self._index)
+
+    @property
+    def operation(self):
+        """The operation function of the entry."""
+        return OPERATIONS[self._store._read("op_code", self._index)]
+
+    def perform(self) -> float:
+        """
+        Return the stored result of the entry.
+
+        Returns:
+        --------
+        float: The result recorded when the entry was added.
+        """
+        return self.result
+
+    def __eq__(self, other) -> bool:
+        """Compare operands and operation with another calculation-like object."""
+        try:
+            return (self.a == other.a and self.b == other.b
+                    and self.operation.__name__ == other.operation.__name__)
+        except AttributeError:
+            return NotImplemented
+
+    __hash__ = None  # Views are compared by value and are not hashable
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation matching `Calculation.__repr__`.
+
+        Returns:
+        --------
+        str: A string representing the viewed entry.
+        """
+        return f"Calculation({self.a}, {self.b}, {self.operation.__name__})"
+
+class HistoryStore:
+    """
+    A columnar, array-backed store of calculation history.
+
+    The store behaves like a read-only sequence of `CalculationView` objects and adds
+    `append`, `extend` and `clear` for writing. Columns grow by doubling, so appends are
+    amortized O(1). Every write also updates the per-operation position index read by
+    `positions`.
+
+    With a memory limit, the columns never grow past the limit: when they are full, the
+    older resident entries are appended to the spill segment and dropped from memory,
+    keeping the newest half of the limit resident. Positions keep counting from the
+    first entry added, so spilling is invisible to readers.
+
+    `append` only puts the entry in the calling thread's shard; every other public
+    method first merges the shards into the columns under `lock`. Entries of one thread
+    keep their order, and entries of different threads are merged by a global sequence
+    number taken on append.
+
+    Attributes:
+    -----------
+    operand1 : numpy.ndarray
+        The first operand of every entry (float64).
+    operand2 : numpy.ndarray
+        The second operand of every entry (float64).
+    result : numpy.ndarray
+        The result of every entry (float64).
+    op_code : numpy.ndarray
+        The op code of every entry (int8), an index into `OPERATIONS` (see `calculator.operations.registry`).
+    errors : dict
+        The errors of the resident entries that failed, keyed by position. Their result is NaN.
+    expressions : dict
+        The expression text of the resident entries recorded by `Calculator.evaluate`,
+        keyed by position.
+    exact : dict
+        The exact (a, b, result) values of the resident entries appended with a
+        `Decimal` or `Fraction` result by an exact numeric backend, keyed by position.
+        Their columns hold the nearest floats.
+
+    The three tables only hold resident entries: spilled entries move theirs to the
+    side segment. `side_tables` returns them for any range of positions.
+    aggregates : HistoryAggregates
+        Running per-operation counts and result sum/min/max of all entries, spilled
+        ones included. Read them through `summary()`, which merges pending appends first.
+    generation : int
+        Incremented on every `clear()`, so positions recorded earlier can be detected as stale.
+    lock : threading.RLock
+        Serializes reads, bulk writes and merges. Hold it to read several times from a
+        consistent store; appends from other threads keep going into their shards.
+    """
+
+    INITIAL_CAPACITY = 1024  # Number of entries allocated up front
+    PAGE_SIZE = 65536  # Number of spilled entries scanned at a time
+    SHARD_SIZE = 4096  # Appends buffered per thread before the thread merges them itself
+    SMALL_MERGE = 4  # Merges up to this many entries write them one by one instead of in bulk
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY, memory_limit: int = None):
+        """
+        Initializes an empty store.
+
+        Parameters:
+        -----------
+        capacity (int): The number of entries to allocate up front.
+        memory_limit (int, optional): The number of entries kept in memory; 0 means no
+            limit. Read from `history_config.history_memory_limit` on first write if not given.
+        """
+        self._size = 0  # Entries held in the columns
+        self._spilled = 0  # Entries held in the spill segment, all older than the resident ones
+        self._limit = memory_limit
+        self._spill_file = None
+        self._segment = None
+        self._side_count = 0  # Spilled entries with an error, expression or exact values
+        self._side_index = None
+        self.errors = {}
+        self.expressions = {}
+        self.exact = {}
+        self.aggregates = HistoryAggregates()
+        self.generation = 0
+        self.lock = threading.RLock()
+        self._local = threading.local()  # The calling thread's shard
+        self._shards = []  # (thread, shard) for every thread that appended
+        self._sequence = itertools.count()  # Orders appends across shards
+        self._pending = False  # True when a shard may hold entries not merged yet
+        self._allocate(max(capacity, 1))
+        self._reset_index()
+
+    @property
+    def memory_limit(self) -> int:
+        """The number of entries kept in memory before spilling; 0 means no limit."""
+        if self._limit is None:
+            self._limit = history_config.history_memory_limit or 0
+        return self._limit
+
+    @memory_limit.setter
+    @_synchronized
+    def memory_limit(self, limit: int):
+        self._limit = limit or 0
+        self._update_bound()
+
+    @property
+    @_synchronized
+    def resident_count(self) -> int:
+        """The number of entries held in memory."""
+        return self._size
+
+    @property
+    @_synchronized
+    def spilled_count(self) -> int:
+        """The number of entries spilled to the on-disk segment."""
+        return self._spilled
+
+    def _allocate(self, capacity: int):
+        """Allocate fresh columns of the given capacity, keeping existing entries."""
+        size = self._size
+        columns = {
+            "_operand1": np.float64,
+            "_operand2": np.float64,
+            "_result": np.float64,
+            "_op_code": np.int8,
+        }
+        for name, dtype in columns.items():
+            column = np.empty(capacity, dtype=dtype)
+            if size:
+                column[:size] = getattr(self, name)[:size]
+            setattr(self, name, column)
+        self._capacity = capacity
+        self._update_bound()
+
+    def _update_bound(self):
+        """Recompute how many entries fit before a write must grow the columns or spill."""
+        if self._limit is None:
+            self._bound = 0  # Resolve the memory limit on the next write
+        else:
+            self._bound = min(self._capacity, self._limit) if self._limit else self._capacity
+
+    def _reserve(self, count: int):
+        """Make room for `count` more entries, doubling the capacity or spilling as needed."""
+        needed = self._size + count
+        if needed <= self._bound:
+            return
+        limit = self.memory_limit
+        if limit and needed > limit and self._size:
+            self._spill(self._size - max(limit // 2 - count, 0))
+            needed = self._size + count
+        if needed > self._capacity:
+            capacity = max(self._capacity * 2, needed)
+            self._allocate(max(min(capacity, limit), needed) if limit else capacity)
+        self._update_bound()
+
+    def _spill(self, count: int):
+        """Move the `count` oldest resident entries to the spill segment."""
+        if count <= 0:
+            return
+        records = to_records(self._op_code[:count], self._operand1[:count], self._operand2[:count], self._result[:count])
+        self._segment = None  # The memory map no longer covers the whole segment
+        with open(self._spill_path(), "ab") as segment_file:
+            records.tofile(segment_file)
+        self._spill_side(self._spilled + count)
+
+        remaining = self._size - count
+        for column in (self._operand1, self._operand2, self._result, self._op_code):
+            column[:remaining] = column[count:self._size]
+        self._size = remaining
+        self._spilled += count
+
+        # The index only covers resident entries; spilled ones are found by scanning pages
+        for op_code in range(len(self._index)):
+            positions = self._resident_positions(op_code)
+            kept = positions[np.searchsorted(positions, self._spilled):]
+            self._index[op_code][:len(kept)] = kept
+            self._index_size[op_code] = len(kept)
+        logger.debug(f"Spilled {count} history entries to {self._spill_file}. "
+                     f"Resident: {self._size}, spilled: {self._spilled}")
+
+    def _spill_side(self, end: int):
+        """Move the errors, expressions and exact values of the entries before `end` to the side segment."""
+        tables = (self.errors, self.expressions, self.exact)
+        positions = sorted({position for table in tables for position in table if position < end})
+        if not positions:
+            return
+        side_path, index_path = self._side_paths()
+        index = np.empty((len(positions), 3), dtype=np.int64)
+        with open(side_path, "ab") as side_file:
+            offset = side_file.tell()
+            for row, position in enumerate(positions):
+                data = _dump_side(*(table.pop(position, None) for table in tables))
+                side_file.write(data)
+                index[row] = position, offset, len(data)
+                offset += len(data)
+        with open(index_path, "ab") as index_file:
+            index.tofile(index_file)
+        self._side_count += len(positions)
+        self._side_index = None  # The memory map no longer covers the whole index
+
+    def _spill_path(self) -> str:
+        """Return the spill segment path, creating an empty segment and side segment on first use."""
+        if self._spill_file is None:
+            configured = history_config.history_spill_file
+            if configured:
+                self._spill_file = configured
+            else:
+                handle, self._spill_file = tempfile.mkstemp(prefix="history-", suffix=".spill")
+                os.close(handle)
+                weakref.finalize(self, _remove_files, self._spill_file, *self._side_paths())
+            for path in (self._spill_file, *self._side_paths()):
+                open(path, "wb").close()  # Drop entries spilled by an earlier process
+        return self._spill_file
+
+    def _side_paths(self) -> tuple:
+        """Return the paths of the side segment and its index, next to the spill segment."""
+        return f"{self._spill_file}.side", f"{self._spill_file}.side-index"
+
+    def _segment_records(self) -> np.ndarray:
+        """Return a read-only memory map of the spilled records."""
+        if self._segment is None:
+            self._segment = np.memmap(self._spill_file, dtype=RECORD_DTYPE, mode="r", shape=(self._spilled,))
+        return self._segment
+
+    def _spilled_side(self, start: int, stop: int) -> list:
+        """Return (position, (error, expression, exact)) for the spilled entries in `[start, stop)` that have any."""
+        if not self._side_count or start >= stop:
+            return []
+        if self._side_index is None:
+            self._side_index = np.memmap(self._side_paths()[1], dtype=np.int64, mode="r", shape=(self._side_count, 3))
+        index = self._side_index
+        lo, hi = np.searchsorted(index[:, 0], [start, stop])
+        if lo == hi:
+            return []
+        rows = index[lo:hi].tolist()
+        base = rows[0][1]
+        with open(self._side_paths()[0], "rb") as side_file:
+            side_file.seek(base)
+            data = side_file.read(rows[-1][1] + rows[-1][2] - base)
+        return [(position, pickle.loads(data[offset - base:offset - base + length]))
+                for position, offset, length in rows]
+
+    @_synchronized
+    def _side(self, field: int, position: int):
+        """Return the error (0), expression (1) or exact values (2) of one entry, or None."""
+        if position >= self._spilled:
+            return (self.errors, self.expressions, self.exact)[field].get(position)
+        spilled = self._spilled_side(position, position + 1)
+        return spilled[0][1][field] if spilled else None
+
+    @_synchronized
+    def side_tables(self, start: int = 0, stop: int = None) -> tuple:
+        """
+        Return the errors, expressions and exact values of the entries in `[start, stop)`.
+
+        Resident entries are read from the `errors`, `expressions` and `exact` tables;
+        spilled entries are read back from the side segment.
+
+        Parameters:
+        -----------
+        start (int): The first position.
+        stop (int, optional): One past the last position. Defaults to the end.
+
+        Returns:
+        --------
+        tuple: The (errors, expressions, exact) dicts, keyed by position.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        tables = ({}, {}, {})
+        for position, values in self._spilled_side(start, min(stop, self._spilled)):
+            for table, value in zip(tables, values):
+                if value is not None:
+                    table[position] = value
+        for table, resident in zip(tables, (self.errors, self.expressions, self.exact)):
+            table.update((position, value) for position, value in resident.items() if start <= position < stop)
+        return tables
+
+    @_synchronized
+    def _read(self, column: str, index: int):
+        """Read one value of a column ('operand1', 'operand2', 'result' or 'op_code') at a position."""
+        if index >= self._spilled:
+            return getattr(self, f"_{column}")[index - self._spilled]
+        return self._segment_records()[column][index]
+
+    def _reset_index(self):
+        """Start an empty position index for every registered operation."""
+        self._index = [np.empty(0, dtype=np.int64) for _ in OPERATIONS]
+        self._index_size = [0] * len(OPERATIONS)
+
+    def _add_to_index(self, op_code: int, positions):
+        """Record one position, or an array of positions, under an op code."""
+        if op_code >= len(self._index):  # An operation registered after the index was started
+            missing = op_code + 1 - len(self._index)
+            self._index.extend(np.empty(0, dtype=np.int64) for _ in range(missing))
+            self._index_size.extend([0] * missing)
+        column, size = self._index[op_code], self._index_size[op_code]
+        needed = size + np.size(positions)
+        if needed > len(column):
+            grown = np.empty(max(len(column) * 2, needed, 16), dtype=np.int64)
+            grown[:size] = column[:size]
+            self._index[op_code] = column = grown
+        column[size:needed] = positions
+        self._index_size[op_code] = needed
+
+    def _resident_positions(self, op_code: int) -> np.ndarray:
+        """Return the indexed positions of the resident entries with the given op code."""
+        if op_code >= len(self._index):
+            return np.empty(0, dtype=np.int64)
+        return self._index[op_code][:self._index_size[op_code]]
+
+    @_synchronized
+    def positions(self, op_code: int) -> np.ndarray:
+        """
+        Return the positions of all entries with the given op code, oldest first.
+
+        Resident entries are read from the index in O(k) for k matches; spilled entries
+        are found by scanning the spill segment one page at a time.
+
+        Parameters:
+        -----------
+        op_code (int): The op code of the operation.
+
+        Returns:
+        --------
+        numpy.ndarray: The entry positions (int64).
+        """
+        resident = self._resident_positions(op_code)
+        if not self._spilled:
+            return resident
+        spilled_codes = self._segment_records()["op_code"]
+        pages = [start + np.flatnonzero(spilled_codes[start:start + self.PAGE_SIZE] == op_code)
+                 for start in range(0, self._spilled, self.PAGE_SIZE)]
+        return np.concatenate(pages + [resident])
+
+    @_synchronized
+    def columns(self, start: int = 0, stop: int = None) -> tuple:
+        """
+        Return the columns of the entries in `[start, stop)`.
+
+        Resident entries are returned as views of the columns; spilled entries are paged
+        in from the spill segment.
+
+        Parameters:
+        -----------
+        start (int): The first position.
+        stop (int, optional): One past the last position. Defaults to the end.
+
+        Returns:
+        --------
+        tuple: The (op_code, operand1, operand2, result) arrays.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        stop = max(start, stop)
+        parts = []
+        if start < self._spilled:
+            records = self._segment_records()[start:min(stop, self._spilled)]
+            parts.append((records["op_code"], records["operand1"], records["operand2"], records["result"]))
+        if stop > self._spilled or not parts:
+            lo, hi = max(start - self._spilled, 0), max(stop - self._spilled, 0)
+            parts.append((self._op_code[lo:hi], self._operand1[lo:hi], self._operand2[lo:hi], self._result[lo:hi]))
+        if len(parts) == 1:
+            return parts[0]
+        return tuple(np.concatenate(column) for column in zip(*parts))
+
+    @property
+    @_synchronized
+    def operand1(self) -> np.ndarray:
+        """The first operands of all entries, including spilled ones."""
+        return self._operand1[:self._size] if not self._spilled else self.columns()[1]
+
+    @property
+    @_synchronized
+    def operand2(self) -> np.ndarray:
+        """The second operands of all entries, including spilled ones."""
+        return self._operand2[:self._size] if not self._spilled else self.columns()[2]
+
+    @property
+    @_synchronized
+    def result(self) -> np.ndarray:
+        """The results of all entries, including spilled ones."""
+        return self._result[:self._size] if not self._spilled else self.columns()[3]
+
+    @property
+    @_synchronized
+    def op_code(self) -> np.ndarray:
+        """The op codes of all entries, including spilled ones."""
+        return self._op_code[:self._size] if not self._spilled else self.columns()[0]
+
+    @property
+    @_synchronized
+    def nbytes(self) -> int:
+        """The number of bytes allocated for the resident columns, including spare capacity."""
+        return self._operand1.nbytes + self._operand2.nbytes + self._result.nbytes + self._op_code.nbytes
+
+    def append(self, op_code: int, a, b, result, error=None, expression=None, exact: bool = None):
+        """
+        Append one entry to the store.
+
+        The entry goes to the calling thread's shard without taking the lock; it is
+        merged into the columns before the next read, or when the shard is full.
+
+        Parameters:
+        -----------
+        op_code (int): The op code of the operation.
+        a: The first operand.
+        b: The second operand.
+        result: The result of the operation.
+        error (Exception, optional): The error raised by the operation, if any.
+        expression (str, optional): The expression the entry is the last step of, if any.
+        exact (bool, optional): Whether the entry was calculated on an exact backend, so
+            its Decimal or Fraction values are kept. Defaults to the active backend's.
+        """
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._add_shard()
+        if type(result) in _EXACT_TYPES and (get_backend().exact if exact is None else exact):
+            exact = (a, b, result)
+        else:
+            exact = None
+        try:
+            fa, fb, fr = float(a), float(b), float(result)
+        except OverflowError:  # An exact value beyond the float range; the exact tuple keeps it
+            fa, fb, fr = _to_float(a), _to_float(b), _to_float(result)
+        shard.append((next(self._sequence), op_code, fa, fb, fr, error, expression, exact))
+        self._pending = True
+        if len(shard) >= self.SHARD_SIZE:
+            with self.lock:
+                self._merge_shards()
+
+    def _add_shard(self) -> deque:
+        """Create and register the calling thread's shard."""
+        shard = self._local.shard = deque()
+        with self.lock:
+            self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def _merge_shards(self):
+        """Move the entries of every shard into the columns, in append order. Needs the lock."""
+        self._pending = False  # Appends after this point set it again
+        batches = [[shard.popleft() for _ in range(len(shard))] for _, shard in self._shards]
+        batches = [batch for batch in batches if batch]
+        self._shards = [(thread, shard) for thread, shard in self._shards if shard or thread.is_alive()]
+        if not batches:
+            return
+        entries = batches[0] if len(batches) == 1 else list(heapq.merge(*batches))
+        if len(entries) <= self.SMALL_MERGE:
+            for entry in entries:
+                self._write_entry(*entry[1:])
+            return
+        _, op_codes, a, b, results, errors, expressions, exacts = zip(*entries)
+        first = self._spilled + self._size
+        for offset, (error, expression, exact) in enumerate(zip(errors, expressions, exacts)):
+            if error is not None:
+                self.errors[first + offset] = error
+            if expression is not None:
+                self.expressions[first + offset] = expression
+            if exact is not None:
+                self.exact[first + offset] = exact
+        # Recorded before the columns, so a batch spilled by `_extend` takes them along
+        self._extend(np.array(op_codes, dtype=np.int8), np.array(a), np.array(b), np.array(results))
+
+    def _write_entry(self, op_code: int, a: float, b: float, result: float, error, expression, exact=None):
+        """Write one entry to the columns. Needs the lock."""
+        self._reserve(1)
+        index = self._size
+        self._operand1[index] = a
+        self._operand2[index] = b
+        self._result[index] = result
+        self._op_code[index] = op_code
+        position = self._spilled + index
+        if error is not None:
+            self.errors[position] = error
+        if expression is not None:
+            self.expressions[position] = expression
+        if exact is not None:
+            self.exact[position] = exact
+        self._add_to_index(op_code, position)
+        self.aggregates.add(op_code, result)
+        self._size = index + 1
+
+    @_synchronized
+    def extend(self, op_code, a, b, result, exact=None, errors=None, expressions=None):
+        """
+        Append many entries to the store with one array copy per column.
+
+        Parameters:
+        -----------
+        op_code (int or array_like): One op code for all entries, or one per entry.
+        a (array_like): The first operands.
+        b (array_like): The second operands.
+        result (array_like): The results.
+        exact (Sequence[tuple] or dict, optional): The exact (a, b, result) values of
+            every entry, or of some entries keyed by their offset in the batch.
+        errors (dict, optional): The errors of the failed entries, keyed by offset.
+        expressions (dict, optional): The expression texts of entries, keyed by offset.
+        """
+        first = self._spilled + self._size
+        # Recorded before the columns, so a batch spilled by `_extend` takes them along
+        for table, values in ((self.exact, exact), (self.errors, errors), (self.expressions, expressions)):
+            if values:
+                items = values.items() if isinstance(values, dict) else enumerate(values)
+                table.update((first + offset, value) for offset, value in items if value is not None)
+        self._extend(op_code, a, b, result)
+
+    def _extend(self, op_code, a, b, result):
+        """Append many entries to the columns. Needs the lock."""
+        result = np.asarray(result, dtype=np.float64)
+        count = len(result)
+        self._reserve(count)
+        start, end = self._size, self._size + count
+        self._operand1[start:end] = a
+        self._operand2[start:end] = b
+        self._result[start:end] = result
+        self._op_code[start:end] = op_code
+        first = self._spilled + start
+        if np.ndim(op_code) == 0:
+            self._add_to_index(int(op_code), np.arange(first, first + count))
+            self.aggregates.add_many(op_code, result)
+        else:
+            codes = self._op_code[start:end]
+            for code in np.unique(codes).tolist():
+                matches = np.flatnonzero(codes == code)
+                if len(matches):
+                    self._add_to_index(code, matches + first)
+            self.aggregates.add_many(codes, result)
+        self._size = end
+        if self._limit and end > self._limit:  # The batch alone was larger than the limit
+            self._spill(end - self._limit // 2)
+            self._allocate(self._limit)
+        logger.debug(f"Appended {count} entries to history store. Total entries: {self._spilled + self._size}")
+
+    @_synchronized
+    def clear(self):
+        """Remove all entries, release the column and index memory and empty the spill segment."""
+        self._size = 0
+        self._spilled = 0
+        self._segment = None
+        self._side_count = 0
+        self._side_index = None
+        if self._spill_file is not None:
+            for path in (self._spill_file, *self._side_paths()):
+                open(path, "wb").close()
+        self.errors = {}
+        self.expressions = {}
+        self.exact = {}
+        self.aggregates.reset()
+        self.generation += 1
+        self._allocate(self.INITIAL_CAPACITY)
+        self._reset_index()
+
+    @_synchronized
+    def summary(self) -> dict:
+        """
+        Summarize the running aggregates of all entries, in O(number of operations).
+
+        Returns:
+        --------
+        dict: See `HistoryAggregates.summary`.
+        """
+        return self.aggregates.summary()
+
+    @_synchronized
+    def __len__(self) -> int:
+        """Return the number of entries in the store, resident and spilled."""
+        return self._spilled + self._size
+
+    @_synchronized
+    def __getitem__(self, index):
+        """
+        Return a view of one entry, or a list of views for a slice.
+
+        Parameters:
+        -----------
+        index (int or slice): The entry position(s); negative positions count from the end.
+
+        Raises:
+        -------
+        IndexError: If the position is out of range.
+        """
+        size = len(self)
+        if isinstance(index, slice):
+            return [CalculationView(self, i) for i in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("history index out of range")
+        return CalculationView(self, index)
+
+    def __iter__(self):
+        """Iterate over views of all entries, oldest first."""
+        for index in range(len(self)):
+            yield CalculationView(self, index)
+
+    @_synchronized
+    def __repr__(self) -> str:
+        """Return a short description of the store."""
+        return f"HistoryStore({len(self)} entries, {self._spilled} spilled)"
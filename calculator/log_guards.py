@@ -0,0 +1,76 @@
+"""
+Log Guards Module.
+
+This module provides level guards for logging on the arithmetic hot path
+(`calculator.operations`, `Calculation` and `Calculator._perform_operation`).
+
+A guard records once whether a logger would handle DEBUG and INFO records, so the hot
+path tests a plain attribute instead of calling `Logger.debug()`/`Logger.info()` and
+letting them discard the record. Messages use `%`-style arguments, so they are only
+formatted when a handler actually emits them.
+
+Guards are decided when they are created and again whenever `refresh_log_guards()` is
+called; `App.configure_logging` calls it after loading the logging configuration. They
+do not follow later level changes by themselves: a library user who imports
+`calculator` and then calls `logging.basicConfig(level=logging.DEBUG)`, sets a logger
+level or calls `logging.disable()` must call `refresh_log_guards()` (also exported as
+`calculator.refresh_log_guards`) for the hot path to log at the new levels.
+"""
+
+# Import logging
+import logging
+
+class LogGuard:
+    """
+    Whether one logger has DEBUG and INFO enabled, decided on `refresh()`.
+
+    Attributes:
+    -----------
+    logger : logging.Logger
+        The guarded logger.
+    debug : bool
+        True if the logger handles DEBUG records.
+    info : bool
+        True if the logger handles INFO records.
+    """
+
+    __slots__ = ("logger", "debug", "info")
+
+    def __init__(self, logger: logging.Logger):
+        """
+        Initializes a guard and decides it from the logger's current level.
+
+        Parameters:
+        -----------
+        logger (logging.Logger): The logger to guard.
+        """
+        self.logger = logger
+        self.refresh()
+
+    def refresh(self):
+        """Decide the guard again from the logger's effective level."""
+        self.debug = self.logger.isEnabledFor(logging.DEBUG)
+        self.info = self.logger.isEnabledFor(logging.INFO)
+
+_GUARDS = []  # Every guard created, so they can be refreshed together
+
+def log_guard(logger: logging.Logger) -> LogGuard:
+    """
+    Create a guard for a hot-path logger.
+
+    Parameters:
+    -----------
+    logger (logging.Logger): The logger to guard.
+
+    Returns:
+    --------
+    LogGuard: The guard, refreshed by `refresh_log_guards()`.
+    """
+    guard = LogGuard(logger)
+    _GUARDS.append(guard)
+    return guard
+
+def refresh_log_guards():
+    """Decide every hot-path guard again, after the logging configuration changed."""
+    for guard in _GUARDS:
+        guard.refresh()
@@ -0,0 +1,284 @@
+"""
+Numeric Backend Module.
+
+This module defines the numeric backends that decide what kind of number the
+calculator parses, computes and persists:
+
+- `float`: the fastest path. Input is converted with `float()`, but `Calculator` uses
+  operands as given, without converting them on every call.
+- `decimal`: `decimal.Decimal` operands, computed in the backend's own context, so its
+  precision and rounding apply whatever the caller's decimal context is.
+- `fraction`: `fractions.Fraction` operands, so every result is exact.
+
+The session backend is read from `history_config` (`NUMERIC_BACKEND` and
+`DECIMAL_PRECISION`) on first use, and can be changed with `set_backend`. A single
+call, or a block of calls, can use another backend through the `backend` argument of
+the `Calculator` methods or the `use_backend` context manager.
+
+Floats converted to an exact backend go through their shortest text form (`repr`),
+so `0.1` becomes `Decimal('0.1')` or `Fraction(1, 10)` rather than the binary value
+the float holds.
+"""
+
+# Import logging
+import contextvars
+import logging
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import lru_cache
+from decimal import Context, Decimal, InvalidOperation, ROUND_HALF_EVEN
+from fractions import Fraction
+
+from calculator.config import history_config
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+class NumericBackend(ABC):
+    """
+    The abstract base class of the numeric backends; subclasses implement `parse` and
+    `_convert_number`.
+
+    Attributes:
+    -----------
+    name : str
+        The backend name used in settings.
+    number_type : type
+        The type of the numbers the backend produces.
+    exact : bool
+        Whether `Calculator` converts operands to `number_type` before each operation,
+        and history keeps the values themselves next to their float columns.
+    context : decimal.Context or None
+        The decimal context operations run in, for the `decimal` backend.
+    """
+
+    name = None
+    number_type = None
+    exact = False
+    context = None
+
+    @abstractmethod
+    def parse(self, text: str):
+        """
+        Parse the text of a number.
+
+        Parameters:
+        -----------
+        text (str): The number, e.g. '2.5' (or '1/3' for the `fraction` backend).
+
+        Returns:
+        --------
+        The parsed number.
+
+        Raises:
+        -------
+        ValueError: If the text is not a valid number.
+        """
+
+    def convert(self, value):
+        """
+        Convert a number, or the text of one, to the backend's number type.
+
+        Parameters:
+        -----------
+        value (str, int, float, Decimal or Fraction): The value to convert.
+
+        Returns:
+        --------
+        The converted number.
+
+        Raises:
+        -------
+        ValueError: If the value is not a valid number.
+        """
+        if type(value) is self.number_type:
+            return value
+        if isinstance(value, str):
+            return self.parse(value)
+        return self._convert_number(value)
+
+    @abstractmethod
+    def _convert_number(self, value):
+        """Convert a number of another type."""
+
+    def __repr__(self) -> str:
+        """Return a string representation of the backend."""
+        return f"{type(self).__name__}()"
+
+class FloatBackend(NumericBackend):
+    """Binary floating point: the fastest backend, and the default."""
+
+    name = "float"
+    number_type = float
+
+    def parse(self, text: str) -> float:
+        return float(text)
+
+    def _convert_number(self, value) -> float:
+        return float(value)
+
+class DecimalBackend(NumericBackend):
+    """
+    Decimal floating point with a fixed precision and rounding.
+
+    Attributes:
+    -----------
+    context : decimal.Context
+        The context operations run in.
+    """
+
+    name = "decimal"
+    number_type = Decimal
+    exact = True
+
+    def __init__(self, precision: int = 28, rounding: str = ROUND_HALF_EVEN):
+        """
+        Initializes a decimal backend.
+
+        Parameters:
+        -----------
+        precision (int): The number of significant digits of results.
+        rounding (str): The `decimal` rounding mode of results.
+        """
+        self.context = Context(prec=precision, rounding=rounding)
+
+    def parse(self, text: str) -> Decimal:
+        try:
+            return Decimal(text.strip())
+        except InvalidOperation:
+            raise ValueError(f"could not convert string to Decimal: {text!r}") from None
+
+    def _convert_number(self, value) -> Decimal:
+        if isinstance(value, float):
+            return Decimal(repr(value))
+        if isinstance(value, Fraction):
+            return self.context.divide(Decimal(value.numerator), Decimal(value.denominator))
+        return Decimal(value)
+
+    def __repr__(self) -> str:
+        return f"DecimalBackend(precision={self.context.prec}, rounding={self.context.rounding!r})"
+
+class FractionBackend(NumericBackend):
+    """Exact rational numbers."""
+
+    name = "fraction"
+    number_type = Fraction
+    exact = True
+
+    def parse(self, text: str) -> Fraction:
+        try:
+            return Fraction(text.strip())
+        except ZeroDivisionError:
+            raise ValueError(f"Invalid fraction with a zero denominator: {text!r}") from None
+
+    def _convert_number(self, value) -> Fraction:
+        if isinstance(value, float):
+            return Fraction(repr(value))
+        return Fraction(value)
+
+BACKENDS = {backend.name: backend for backend in (FloatBackend, DecimalBackend, FractionBackend)}
+
+_session_backend = None  # Resolved from `history_config` on first use
+_call_backend = contextvars.ContextVar("numeric_backend", default=None)  # Set by `use_backend`
+
+def get_backend(backend=None, precision: int = None) -> NumericBackend:
+    """
+    Return a backend by name, or the active backend.
+
+    Parameters:
+    -----------
+    backend (str or NumericBackend, optional): A backend name ('float', 'decimal' or
+        'fraction') or instance. Defaults to the active backend.
+    precision (int, optional): The precision of a `decimal` backend given by name.
+        Defaults to `history_config.decimal_precision`.
+
+    Returns:
+    --------
+    NumericBackend: The backend.
+
+    Raises:
+    -------
+    ValueError: If the backend name is unknown.
+    """
+    if backend is None:
+        return _call_backend.get() or _session()
+    if isinstance(backend, NumericBackend):
+        return backend
+    if backend == "decimal":
+        precision = precision or history_config.decimal_precision
+    return _named_backend(backend, precision)
+
+@lru_cache(maxsize=None)
+def _named_backend(name: str, precision: int = None) -> NumericBackend:
+    """Create a backend by name, once per name and precision."""
+    backend_class = BACKENDS.get(name)
+    if backend_class is None:
+        raise ValueError(f"Unknown numeric backend: {name}")
+    return DecimalBackend(precision) if backend_class is DecimalBackend else backend_class()
+
+def _session() -> NumericBackend:
+    """Return the session backend, resolving it from the settings on first use."""
+    global _session_backend
+    if _session_backend is None:
+        _session_backend = get_backend(history_config.numeric_backend)
+        logger.debug(f"Numeric backend: {_session_backend!r}")
+    return _session_backend
+
+def set_backend(backend, precision: int = None) -> NumericBackend:
+    """
+    Set the session backend, used wherever no other backend is given.
+
+    Parameters:
+    -----------
+    backend (str or NumericBackend): The backend name or instance; None resolves it
+        from the settings again on next use.
+    precision (int, optional): The precision of a `decimal` backend given by name.
+
+    Returns:
+    --------
+    NumericBackend or None: The new session backend.
+    """
+    global _session_backend
+    _session_backend = get_backend(backend, precision) if backend is not None else None
+    logger.info(f"Numeric backend set to {_session_backend!r}.")
+    return _session_backend
+
+@contextmanager
+def use_backend(backend, precision: int = None):
+    """
+    Use another backend for the calls made in a `with` block, in this thread or task.
+
+    Parameters:
+    -----------
+    backend (str or NumericBackend): The backend name or instance.
+    precision (int, optional): The precision of a `decimal` backend given by name.
+
+    Returns:
+    --------
+    ContextManager[NumericBackend]: Yields the backend in use.
+    """
+    selected = get_backend(backend, precision)
+    token = _call_backend.set(selected)
+    try:
+        yield selected
+    finally:
+        _call_backend.reset(token)
+
+def parse_number(value, backend=None):
+    """
+    Convert user input to a number of the given or active backend.
+
+    Parameters:
+    -----------
+    value (str or number): The input, e.g. '2.5'.
+    backend (str or NumericBackend, optional): The backend. Defaults to the active backend.
+
+    Returns:
+    --------
+    The number.
+
+    Raises:
+    -------
+    ValueError: If the input is not a valid number.
+    """
+    return get_backend(backend).convert(value)
@@ -3,11 +3,25 @@ Operations Module.
 
 This module contains the basic arithmetic operations (addition, subtraction, multiplication, and division).
 Each operation is implemented as a function and performs the operation on two numbers.
+
+It also defines the `OperationRegistry` and the shared `registry` that `Calculator`,
+`main.py`, history persistence and the command plugins dispatch through by name. Plugins
+can register new binary operations at runtime with `registry.register`.
 """
 
 # Configure logger
 import logging
+from collections import namedtuple
+
+import numpy as np
+
+from calculator.log_guards import log_guard
 logger = logging.getLogger(__name__)
+log = log_guard(logger)  # Level guards decided once, not on every call
+
+# One registered operation: its name, function, number of operands, op code, optional
+# NumPy ufunc for batches, and the symbol printed between its operands
+Operation = namedtuple("Operation", ["name", "function", "arity", "op_code", "ufunc", "symbol"])
 
 def add(a, b):
     """
@@ -27,7 +41,8 @@ def add(a, b):
     add(2, 3) -> 5
     """
     result = a + b
-    logger.debug(f"Performed addition: {a} + {b} = {result}")
+    if log.debug:
+        logger.debug("Performed addition: %s + %s = %s", a, b, result)
     return result
 
 
@@ -49,7 +64,8 @@ def subtract(a, b):
     subtract(5, 2) -> 3
     """
     result = a - b
-    logger.debug(f"Performed subtraction: {a} - {b} = {result}")
+    if log.debug:
+        logger.debug("Performed subtraction: %s - %s = %s", a, b, result)
     return result
 
 
@@ -76,10 +92,11 @@ def divide(a, b):
     divide(5, 0) -> Raises ZeroDivisionError
     """
     if b == 0:
-        logger.error(f"Attempted division by zero: {a} / {b}")
+        logger.error("Attempted division by zero: %s / %s", a, b)
         raise ZeroDivisionError("Division by zero is not allowed.")
     result = a / b
-    logger.debug(f"Performed division: {a} / {b} = {result}")
+    if log.debug:
+        logger.debug("Performed division: %s / %s = %s", a, b, result)
     return result
 
 
@@ -101,5 +118,131 @@ def multiply(a, b):
     multiply(3, 4) -> 12
     """
     result = a * b
-    logger.debug(f"Performed multiplication: {a} * {b} = {result}")
-    return result
\ No newline at end of file
+    if log.debug:
+        logger.debug("Performed multiplication: %s * %s = %s", a, b, result)
+    return result
+
+class OperationRegistry:
+    """
+    The table of operations the calculator can dispatch to by name.
+
+    Each operation is registered once, under the name of its function, and gets the
+    next free op code. Op codes are never reused or reordered, so the one-byte op codes
+    of the columnar history store (and of binary history files) keep their meaning as
+    operations are added, including by plugins at runtime.
+
+    Attributes:
+    -----------
+    functions : list
+        The operation functions in op-code order: `functions[op_code]` is the operation.
+    codes : dict
+        Maps each operation name to its op code (e.g. 'add' -> 0).
+    """
+
+    MAX_OPERATIONS = 128  # Op codes are stored as int8
+
+    def __init__(self):
+        """Initializes an empty registry."""
+        self.functions = []
+        self.codes = {}
+        self._operations = {}
+
+    def register(self, function, ufunc=None, arity: int = 2, symbol: str = None, replace: bool = False) -> Operation:
+        """
+        Register an operation under the name of its function.
+
+        Registering the same function again returns its existing entry.
+
+        Parameters:
+        -----------
+        function (callable): The operation, called as `function(a, b)`.
+        ufunc (numpy.ufunc, optional): A NumPy equivalent used by `Calculator.evaluate_batch`.
+            Without one, batches call `function` once per row.
+        arity (int): The number of operands. History keeps two operands per entry, so
+            only binary operations can be registered.
+        symbol (str, optional): How the operation is printed between its operands.
+            Defaults to its name.
+        replace (bool): Whether to replace another function registered under the same
+            name, keeping its op code.
+
+        Returns:
+        --------
+        Operation: The registry entry of the operation.
+
+        Raises:
+        -------
+        ValueError: If the name is not a valid identifier, the arity is not 2, the
+            name is taken by another function and `replace` is False, or the registry is full.
+        """
+        name = getattr(function, "__name__", "")
+        if not name.isidentifier():
+            raise ValueError(f"Operation name must be an identifier: {name!r}")
+        if arity != 2:
+            raise ValueError(f"Only binary operations can be registered, got arity {arity} for {name}.")
+        existing = self._operations.get(name)
+        if existing is not None:
+            if existing.function is function:
+                return existing
+            if not replace:
+                raise ValueError(f"Operation already registered: {name}")
+            op_code = existing.op_code
+        else:
+            op_code = len(self.functions)
+            if op_code >= self.MAX_OPERATIONS:
+                raise ValueError(f"Cannot register more than {self.MAX_OPERATIONS} operations.")
+            self.functions.append(function)
+        operation = Operation(name, function, arity, op_code, ufunc, symbol or name)
+        self.functions[op_code] = function
+        self.codes[name] = op_code
+        self._operations[name] = operation
+        logger.info(f"Registered operation {name} with op code {op_code}.")
+        return operation
+
+    def get(self, name: str, default=None):
+        """
+        Return the registry entry of an operation, or `default` if the name is unknown.
+
+        A name that is not a string (e.g. a list from a JSON request) is unknown too,
+        instead of raising `TypeError` when it cannot be hashed.
+        """
+        if not isinstance(name, str):
+            return default
+        return self._operations.get(name, default)
+
+    def __getitem__(self, name: str) -> Operation:
+        """
+        Return the registry entry of an operation.
+
+        Raises:
+        -------
+        KeyError: If the name is unknown.
+        """
+        return self._operations[name]
+
+    def __contains__(self, name) -> bool:
+        """Return whether an operation is registered under the name."""
+        return isinstance(name, str) and name in self._operations
+
+    def __len__(self) -> int:
+        """Return the number of registered operations."""
+        return len(self.functions)
+
+    def __iter__(self):
+        """Iterate over the registry entries in op-code order."""
+        return iter(sorted(self._operations.values(), key=lambda operation: operation.op_code))
+
+# The shared registry. The built-in operations are registered first, in this order,
+# so their op codes match the history files written before the registry existed.
+registry = OperationRegistry()
+registry.register(add, np.add, symbol="+")
+registry.register(subtract, np.subtract, symbol="-")
+registry.register(multiply, np.multiply, symbol="x")
+registry.register(divide, np.divide, symbol="/")
+
+# Operations in op-code order: the position of each function is its stable integer op
+# code, which lets the columnar history store keep one byte per entry instead of a
+# function reference. Both names are live views of the registry.
+OPERATIONS = registry.functions
+
+# Map each operation name to its op code (e.g. 'add' -> 0)
+OP_CODES = registry.codes
@@ -0,0 +1,166 @@
+"""
+Result Cache Module.
+
+This module defines the `ResultCache` class, a bounded least-recently-used cache of
+operation results that `Calculator` consults before performing an operation, once it
+has been enabled with `Calculator.enable_result_cache`.
+
+Operands are keyed together with their type, because equal numbers of different types
+hash alike but do not give the same result: `Decimal("1") + Decimal("0.1")` is
+`Decimal("1.1")`, while `1.0 + 0.1` is the float `1.1`. When an operand is a Decimal,
+the precision and rounding of the current decimal context are part of the key too.
+Equal operands of the same type share an entry, so e.g. `Decimal("1.0")` and
+`Decimal("1.00")` may return a result that differs only in trailing zeros. Float and
+Decimal zeros are the exception: `-0.0 == 0.0`, but `1 / -0.0` and `0.0 * -1` differ
+from `1 / 0.0` and `0.0 * 1`, so when an operand is zero its sign is keyed too.
+
+Only successful results are cached: an operation that raises, such as a division by
+zero, is performed (and recorded) again on every call.
+
+The cache can be shared by threads: each lookup and store holds the cache's lock for
+its few dictionary operations, so an eviction by one thread never runs between
+another thread's lookup and its move to the most recently used end.
+"""
+
+# Import logging
+import logging
+import math
+import threading
+from collections import OrderedDict
+from decimal import Decimal, getcontext
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+def result_key(operation, a, b) -> tuple:
+    """
+    Build the cache key of one operation call.
+
+    Parameters:
+    -----------
+    operation (Callable): The operation function.
+    a: The first operand.
+    b: The second operand.
+
+    Returns:
+    --------
+    tuple: The key, including the operand types, the signs of zero operands and, for
+    Decimal operands, the decimal context.
+    """
+    type_a, type_b = type(a), type(b)
+    key = operation, type_a, a, type_b, b
+    if not a or not b:
+        key += (_zero_sign(a), _zero_sign(b))
+    if type_a is Decimal or type_b is Decimal:
+        context = getcontext()
+        key += (context.prec, context.rounding)
+    return key
+
+def _zero_sign(value):
+    """Return the sign of a float or Decimal operand (True/-1.0 if negative), or None for other types."""
+    if type(value) is float:
+        return math.copysign(1.0, value)
+    if type(value) is Decimal:
+        return value.is_signed()
+    return None
+
+class ResultCache:
+    """
+    A bounded least-recently-used cache of operation results.
+
+    Attributes:
+    -----------
+    maxsize : int
+        The largest number of results kept.
+    hits : int
+        Lookups that found a result.
+    misses : int
+        Lookups that found nothing.
+    evictions : int
+        Results dropped to make room for newer ones.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Initializes an empty cache.
+
+        Parameters:
+        -----------
+        maxsize (int): The largest number of results kept.
+
+        Raises:
+        -------
+        ValueError: If `maxsize` is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError(f"Result cache size must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, default=None):
+        """
+        Look up a result and mark it as most recently used.
+
+        Parameters:
+        -----------
+        key (tuple): The key built by `result_key`.
+        default: Returned when the key is not cached.
+
+        Returns:
+        --------
+        The cached result, or `default`.
+        """
+        with self._lock:
+            try:
+                result = self._results[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._results.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key, result):
+        """
+        Store a result, evicting the least recently used one if the cache is full.
+
+        Parameters:
+        -----------
+        key (tuple): The key built by `result_key`.
+        result: The result of the operation.
+        """
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every cached result and reset the counters."""
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Report the cache counters.
+
+        Returns:
+        --------
+        dict: The hits, misses, evictions, current size and maximum size.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "size": len(self._results), "maxsize": self.maxsize}
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._results)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the cache and its counters."""
+        return (f"ResultCache({len(self)}/{self.maxsize} results, {self.hits} hits, "
+                f"{self.misses} misses, {self.evictions} evictions)")
@@ -4,6 +4,17 @@ import sys
 # Import logging for logs
 import logging
 
+# Import csv, json and time for the batch entry point
+import csv
+import decimal
+import json
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
 # Import App to start the app
 from app import App
 
@@ -13,20 +24,29 @@ from calculator import Calculator
 # Importing the Calculation class to manage individual arithmetic operations.
 from calculator.calculation import Calculation
 
+# Import Calculations to keep the in-memory history bounded in batch mode
+from calculator.calculations import Calculations
+from calculator.history_store import HistoryStore
+from calculator.log_guards import refresh_log_guards
+from calculator.numeric import parse_number
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
+BATCH_BLOCK_ROWS = 1000  # Request rows read, and result records written, at a time in batch mode
+PARALLEL_CHUNK_ROWS = 5000  # Request rows sent to a worker process at a time in parallel batch mode
+
 def parse_args(args):
     """
     Parses the command-line arguments.
     
     Expected arguments: a, b, operation
-    - a: first operand (float)
-    - b: second operand (float)
+    - a: first operand (a number of the active numeric backend, float by default)
+    - b: second operand (a number of the active numeric backend, float by default)
     - operation: a string specifying the arithmetic operation (add, subtract, multiply, divide)
     
     Returns:
-        tuple: (a, b, operation) where a and b are floats if valid.
+        tuple: (a, b, operation) where a and b are numbers if valid.
     
     Raises:
         ValueError: If the arguments are not in the correct format or are invalid.
@@ -37,22 +57,22 @@ def parse_args(args):
     a_str, b_str, operation = args
 
     try:
-        # Convert operands to float
-        a = float(a_str)
-        b = float(b_str)
-    except ValueError:
+        # Convert operands with the active numeric backend
+        a = parse_number(a_str)
+        b = parse_number(b_str)
+    except (ValueError, TypeError):
         raise ValueError(f"Invalid number input: {a_str} or {b_str} is not a valid number.")
     
     return a, b, operation
 
 def perform_operation(a, b, operation):
     """
-    Maps the operation string to the corresponding Calculator method.
+    Performs the registered operation named by the operation string.
     
     Args:
         a (float): First operand.
         b (float): Second operand.
-        operation (str): Arithmetic operation (add, subtract, multiply, divide).
+        operation (str): A registered operation name (add, subtract, multiply, divide, or one added at runtime).
     
     Returns:
         float: The result of the operation.
@@ -61,24 +81,309 @@ def perform_operation(a, b, operation):
         ValueError: If the operation is unknown.
         ZeroDivisionError: If attempting division by zero.
     """
-    logger.debug(f"Performing operation: {a} {operation} {b}")
-    if operation == 'add':
-        return Calculator.add(a, b)
-    elif operation == 'subtract':
-        return Calculator.subtract(a, b)
-    elif operation == 'multiply':
-        return Calculator.multiply(a, b)
-    elif operation == 'divide':
+    logger.debug("Performing operation: %s %s %s", a, operation, b)
+    try:
+        # One registry lookup, which also covers operations registered at runtime
+        return Calculator.calculate(operation, a, b)
+    except ZeroDivisionError:
+        # Log error for division by zero and raise exception
+        logger.error(f"Attempted to divide {a} by {b}. Division by zero is not allowed.")
+        raise ZeroDivisionError("Cannot divide by zero.")
+
+def _jsonl_requests(stream):
+    """Yield (line number, (a, b, operation) or error message) for each JSON-lines request."""
+    return _parse_jsonl_lines(enumerate(stream, 1))
+
+def _parse_jsonl_lines(numbered_lines):
+    """Yield (line number, (a, b, operation) or error message) for (line number, line) pairs."""
+    for number, line in numbered_lines:
+        if not line.strip():
+            continue  # Blank lines carry no request
         try:
-            return Calculator.divide(a, b)
-        except ZeroDivisionError:
-            # Log error for division by zero and raise exception
-            logger.error(f"Attempted to divide {a} by {b}. Division by zero is not allowed.")
-            raise ZeroDivisionError("Cannot divide by zero.")
+            request = json.loads(line)
+            yield number, parse_args([request["a"], request["b"], request["operation"]])
+        except (ValueError, TypeError) as e:
+            yield number, f"Invalid request: {e}"
+        except KeyError as e:
+            yield number, f"Invalid request: missing field {e}"
+
+def _csv_requests(stream):
+    """Yield (line number, (a, b, operation) or error message) for each CSV request after the header."""
+    rows = csv.reader(stream)
+    columns = _csv_columns(next(rows, []))
+    return _parse_csv_rows(enumerate(rows, 2), columns)
+
+def _csv_columns(header) -> list:
+    """Return the positions of the a, b and operation columns in a CSV header row."""
+    header = [name.strip().lower() for name in header]
+    try:
+        return [header.index(name) for name in ("a", "b", "operation")]
+    except ValueError:
+        raise ValueError("CSV batch input needs a header with columns a, b and operation.") from None
+
+def _parse_csv_rows(numbered_rows, columns):
+    """Yield (line number, (a, b, operation) or error message) for (line number, row) pairs."""
+    for number, row in numbered_rows:
+        if not row:
+            continue  # Blank lines carry no request
+        try:
+            yield number, parse_args([row[column].strip() for column in columns])
+        except ValueError as e:
+            yield number, f"Invalid request: {e}"
+        except IndexError:
+            yield number, "Invalid request: missing columns"
+
+def _json_result(result):
+    """Return a result as JSON can hold it: exact and non-finite results become strings (e.g. 'inf')."""
+    if isinstance(result, float) and not math.isfinite(result):
+        return str(result)  # JSON has no Infinity or NaN
+    return result
+
+def _write_jsonl(output, records):
+    """Write (line number, result, error) records as JSON lines, in one write; exact and non-finite results are strings."""
+    lines = [json.dumps({"line": number, "error": error}) if error is not None
+             else json.dumps({"line": number, "result": _json_result(result)}, default=str, allow_nan=False)
+             for number, result, error in records]
+    output.write("\n".join(lines) + "\n")
+
+def _write_csv(output, records):
+    """Write (line number, result, error) records as CSV rows of `line,result,error`."""
+    csv.writer(output, lineterminator="\n").writerows(records)
+
+def run_batch(stream, output=None, input_format: str = "jsonl") -> int:
+    """
+    Streams a file of calculation requests through `perform_operation`.
+
+    Each JSON-lines request is an object such as `{"a": 6, "b": 3, "operation": "divide"}`;
+    a CSV file has a header with the columns `a`, `b` and `operation`. One record is
+    written per request, in the same format: its line number and result, or its line
+    number and error. Requests are read and records written `BATCH_BLOCK_ROWS` at a
+    time. The calculations are recorded in a separate history store that is emptied
+    after each block (batch mode never saves history), so memory stays flat however
+    long the input is, and the caller's `Calculations.history` is left as it was. A
+    throughput summary is printed to stderr.
+
+    Parameters:
+    -----------
+    stream (TextIO): The requests, one per line.
+    output (TextIO, optional): Where the records are written. Defaults to stdout.
+    input_format (str): 'jsonl' or 'csv'.
+
+    Returns:
+    --------
+    int: The number of requests processed.
+
+    Raises:
+    -------
+    ValueError: If the format is unknown, or a CSV input has no a, b and operation columns.
+    """
+    output = output or sys.stdout
+    if input_format == "jsonl":
+        requests, write_records = _jsonl_requests(stream), _write_jsonl
+    elif input_format == "csv":
+        requests, write_records = _csv_requests(stream), _write_csv
+        output.write("line,result,error\n")
     else:
-        # Log error for unknown operation and raise exception
-        logger.error(f"Unknown operation: {operation}")
-        raise ValueError(f"Unknown operation: {operation}")
+        raise ValueError(f"Unknown batch format: {input_format}")
+
+    rows = errors = 0
+    started = time.perf_counter()
+    history, Calculations.history = Calculations.history, HistoryStore(memory_limit=0)
+    try:
+        while True:
+            block = list(islice(requests, BATCH_BLOCK_ROWS))
+            if not block:
+                break
+            records = _evaluate_requests(block)
+            errors += sum(error is not None for _, _, error in records)
+            write_records(output, records)
+            rows += len(block)
+            Calculations.history.clear()  # Keep memory flat; batch results live in the output
+    finally:
+        Calculations.history = history
+    output.flush()
+    _report_batch(rows, errors, time.perf_counter() - started)
+    return rows
+
+def _error_message(error: Exception) -> str:
+    """Return the error text of a failed request; decimal signals are named, as their text is not readable."""
+    if isinstance(error, decimal.DecimalException) and not isinstance(error, ZeroDivisionError):
+        return f"Arithmetic error: {type(error).__name__}"
+    return str(error)
+
+def _evaluate_requests(requests) -> list:
+    """Perform parsed requests and return their (line number, result, error) records."""
+    records = []
+    for number, request in requests:
+        result = error = None
+        if isinstance(request, str):
+            error = request  # The request could not be parsed
+        else:
+            try:
+                result = perform_operation(*request)
+            except (ValueError, ArithmeticError) as e:
+                error = _error_message(e)
+        records.append((number, result, error))
+    return records
+
+def _report_batch(rows: int, errors: int, elapsed: float):
+    """Log and print the throughput summary of a batch run to stderr."""
+    rate = rows / elapsed if elapsed > 0 else float("inf")
+    logger.info(f"Batch finished: {rows} rows, {errors} errors in {elapsed:.3f}s.")
+    print(f"Processed {rows} rows ({errors} errors) in {elapsed:.3f}s ({rate:,.0f} rows/s).", file=sys.stderr)
+
+def _init_worker():
+    """
+    Prepare a batch worker process.
+
+    The worker gets an empty, unlimited history store of its own, so that it never
+    touches entries or a spill file inherited from the parent. Its logging is turned
+    off: failed requests are reported in the output records, and handlers inherited
+    by a forked worker (log files, the log queue) are not safe to share.
+    """
+    Calculations.history = HistoryStore(memory_limit=0)
+    logging.disable(logging.CRITICAL)
+    refresh_log_guards()
+
+def _evaluate_chunk(input_format: str, chunk, columns=None) -> tuple:
+    """
+    Evaluate one chunk of requests in a worker process.
+
+    Parameters:
+    -----------
+    input_format (str): 'jsonl' or 'csv'.
+    chunk (list): (line number, line) pairs, or (line number, row) pairs for CSV.
+    columns (list, optional): The positions of the a, b and operation CSV columns.
+
+    Returns:
+    --------
+    tuple: The (line number, result, error) records, the (op_code, operand1, operand2,
+    result) history columns of the chunk's calculations, and their (errors,
+    expressions, exact) side tables keyed by position in the chunk.
+    """
+    requests = _parse_jsonl_lines(chunk) if input_format == "jsonl" else _parse_csv_rows(chunk, columns)
+    records = _evaluate_requests(requests)
+    history = Calculations.history.columns()
+    side_tables = Calculations.history.side_tables()
+    Calculations.history.clear()  # The columns keep their arrays; the next chunk starts empty
+    return records, history, side_tables
+
+def run_parallel_batch(stream, output=None, input_format: str = "jsonl", workers: int = None,
+                       keep_history: bool = True) -> int:
+    """
+    Evaluates a file of calculation requests in a pool of worker processes.
+
+    The input and output are the same as for `run_batch`. The input is split into
+    chunks of `PARALLEL_CHUNK_ROWS` rows, which the workers parse and evaluate; records
+    are written in input order as chunks complete. At most two chunks per worker are
+    in flight, so memory stays bounded by the chunk size, not the input size. The
+    calculations each worker performed are merged into `Calculations.history` in
+    input order, with their errors and exact values, unless `keep_history` is False.
+
+    Parameters:
+    -----------
+    stream (TextIO): The requests, one per line.
+    output (TextIO, optional): Where the records are written. Defaults to stdout.
+    input_format (str): 'jsonl' or 'csv'.
+    workers (int, optional): The number of worker processes. Defaults to the CPU count.
+    keep_history (bool): Whether to merge the workers' calculations into history.
+
+    Returns:
+    --------
+    int: The number of requests processed.
+
+    Raises:
+    -------
+    ValueError: If the format or worker count is invalid, or a CSV input has no a, b and operation columns.
+    """
+    output = output or sys.stdout
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Invalid worker count: {workers}")
+    columns = None
+    if input_format == "jsonl":
+        numbered = ((number, line) for number, line in enumerate(stream, 1) if line.strip())
+        write_records = _write_jsonl
+    elif input_format == "csv":
+        rows = csv.reader(stream)
+        columns = _csv_columns(next(rows, []))
+        numbered = ((number, row) for number, row in enumerate(rows, 2) if row)
+        write_records = _write_csv
+        output.write("line,result,error\n")
+    else:
+        raise ValueError(f"Unknown batch format: {input_format}")
+
+    rows = errors = 0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        pending = deque()
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(islice(numbered, PARALLEL_CHUNK_ROWS))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_evaluate_chunk, input_format, chunk, columns))
+            if not pending:
+                break
+            records, history, side_tables = pending.popleft().result()  # The oldest chunk, to keep input order
+            write_records(output, records)
+            rows += len(records)
+            errors += sum(error is not None for _, _, error in records)
+            if keep_history and len(history[0]):
+                history_errors, expressions, exact = side_tables
+                Calculations.history.extend(*history, exact=exact, errors=history_errors, expressions=expressions)
+    output.flush()
+    logger.info(f"Parallel batch used {workers} workers.")
+    _report_batch(rows, errors, time.perf_counter() - started)
+    return rows
+
+def batch_main(args) -> int:
+    """
+    Runs the batch entry point:
+    `main.py --batch <requests.jsonl|requests.csv|-> [--output <file>] [--workers <n>]`.
+
+    The format is taken from the input file's extension (`.csv`, otherwise JSON lines);
+    `-` reads JSON lines from stdin. Records go to stdout unless `--output` is given.
+    With `--workers`, the requests are evaluated by `run_parallel_batch` in that many
+    worker processes (0 means one per CPU); as in `run_batch`, history is not kept.
+
+    Parameters:
+    -----------
+    args (list): The arguments after the script name.
+
+    Returns:
+    --------
+    int: The number of requests processed.
+    """
+    usage = "Usage: main.py --batch <requests.jsonl|requests.csv|-> [--output <file>] [--workers <n>]"
+    if len(args) % 2 or args[0] != "--batch":
+        raise ValueError(usage)
+    options = dict(zip(args[2::2], args[3::2]))
+    if len(options) != len(args[2::2]) or not set(options) <= {"--output", "--workers"}:
+        raise ValueError(usage)
+    source = args[1]
+    input_format = "csv" if source.lower().endswith(".csv") else "jsonl"
+    if "--workers" in options:
+        try:
+            workers = int(options["--workers"])
+        except ValueError:
+            raise ValueError(f"Invalid worker count: {options['--workers']}") from None
+
+        def run(stream, output):
+            return run_parallel_batch(stream, output, input_format, workers or None, keep_history=False)
+    else:
+        def run(stream, output):
+            return run_batch(stream, output, input_format)
+
+    output = open(options["--output"], "w", encoding="utf-8", newline="") if "--output" in options else sys.stdout
+    try:
+        if source == "-":
+            return run(sys.stdin, output)
+        with open(source, encoding="utf-8", newline="") as stream:
+            return run(stream, output)
+    finally:
+        if output is not sys.stdout:
+            output.close()
 
 def main():
     """
@@ -107,7 +412,27 @@ def main():
 if __name__ == "__main__":
     """
     Entry point for the application.
-    Initializes and starts the CLI application using App.
+    Initializes the CLI application using App and starts the interactive loop,
+    or runs a command script when one is given with `--script <file>`, or read from
+    stdin with `--script -`. Piped stdin alone still starts the interactive loop, so
+    redirected invocations keep their behaviour. `--batch <file>` streams a file of calculation
+    requests through `perform_operation` instead, without starting the application.
     """
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        # Failed requests are reported in the output records; keep their error logs
+        # off the console, which Python's last-resort handler would print them to
+        logging.getLogger().addHandler(logging.NullHandler())
+        try:
+            batch_main(sys.argv[1:])
+        except (OSError, ValueError) as e:
+            sys.exit(str(e))
+        sys.exit(0)
     app = App()
-    app.start()
\ No newline at end of file
+    if len(sys.argv) == 3 and sys.argv[1] == "--script":
+        if sys.argv[2] == "-":
+            app.run_script(sys.stdin)
+        else:
+            with open(sys.argv[2], encoding="utf-8") as script:
+                app.run_script(script)
+    else:
+        app.start()
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Smoke tests for the benchmark suite.
+
+These tests run the benchmarks at tiny sizes to make sure they keep working as the
+code they measure changes; they do not check the timings themselves.
+"""
+
+import json
+# Import pytest for unit testing framework
+import pytest   # pylint: disable=unused-import
+
+from benchmarks import (bench_calculator, bench_history_stats, bench_history_threads, bench_logging,
+                        bench_numeric_backends, bench_parallel_batch, bench_repl, bench_result_cache, bench_startup)
+from benchmarks.__main__ import main
+
+def test_bench_calculator():
+    """Test that every Calculator operation is timed."""
+    results = bench_calculator.run(calls=10, repeat=2)
+    assert set(results) == {"add", "subtract", "multiply", "divide"}
+    assert all(result["best_ns"] > 0 for result in results.values())
+
+def test_bench_startup():
+    """Test that cold, cached and first-dispatch plugin loading are timed."""
+    results = bench_startup.run(repeat=2)
+    assert results["load_plugins_cold"]["best_ms"] > 0
+    assert results["load_plugins_cached"]["best_ms"] > 0
+
+def test_bench_repl():
+    """Test that both the interactive loop and script mode are timed."""
+    results = bench_repl.run(commands=20)
+    assert results["start"]["commands_per_second"] > 0
+    assert results["run_script"]["commands_per_second"] > 0
+
+def test_runner_writes_json_report(tmp_path, monkeypatch):
+    """Test that the runner writes a JSON report with metadata and results."""
+    monkeypatch.setattr(bench_startup, "run", lambda: {"load_plugins_cold": {"best_ms": 1.0}})
+    output = tmp_path / "report.json"
+    main(["startup", "--output", str(output)])
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["results"] == {"bench_startup": {"load_plugins_cold": {"best_ms": 1.0}}}
+    assert "timestamp" in report["meta"]
+
+def test_runner_rejects_unknown_benchmarks():
+    """Test that an unknown benchmark name is an error."""
+    with pytest.raises(SystemExit):
+        main(["nonexistent"])
+
+def test_bench_logging():
+    """Test that every operation is timed with logging off, at INFO and at DEBUG."""
+    results = bench_logging.run(calls=10, repeat=2)
+    assert set(results) == {"off", "info", "debug"}
+    assert all(result["add"]["best_ns"] > 0 for result in results.values())
+
+def test_bench_result_cache():
+    """Test that the result cache benchmark reports timings and counters."""
+    results = bench_result_cache.run(calls=20, distinct=(4,))
+    assert results["4_pairs"]["hits"] == 16
+    assert results["4_pairs"]["cached_ns"] > 0
+
+def test_bench_history_stats():
+    """Test that history statistics are timed by aggregates and by scanning."""
+    results = bench_history_stats.run(sizes=(50,), repeat=1, calls=10)
+    assert results["50_entries"]["aggregates_ms"] > 0 and results["50_entries"]["scan_ms"] > 0
+    assert results["add_ns"] > 0
+
+def test_bench_history_threads():
+    """Test that sharded and global-lock appends are both timed per thread count."""
+    results = bench_history_threads.run(appends=100, thread_counts=(2,))
+    assert results["2_threads"]["sharded_per_second"] > 0
+    assert results["2_threads"]["global_lock_per_second"] > 0
+
+def test_bench_parallel_batch():
+    """Test that the sequential runner and each worker count are timed."""
+    results = bench_parallel_batch.run(rows=200, worker_counts=(1, 2))
+    assert results["sequential"]["rows_per_second"] > 0
+    assert results["2_workers"]["rows_per_second"] > 0
+
+def test_bench_numeric_backends():
+    """Test that every numeric backend is timed, including a history round trip."""
+    results = bench_numeric_backends.run(calls=20, repeat=1, entries=10)
+    assert set(results) == {"float", "decimal", "fraction"}
+    assert all(result["divide_ns"] > 0 and result["load_ms"] > 0 for result in results.values())
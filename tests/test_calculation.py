@@ -65,3 +65,23 @@ def test_divide_by_zero():
     calc = Calculation(Decimal('10'), Decimal('0'), divide)  # Create a Calculation instance with a zero divisor
     with pytest.raises(ZeroDivisionError, match=".*"):  # Expect a ZeroDivisionError to be raised
         calc.perform()  # Attempt the division operation, which should fail
+
+def test_perform_captures_result():
+    """
+    Test that perform() keeps its result on the calculation.
+
+    History reads the captured result instead of performing the calculation again.
+    """
+    calc = Calculation(Decimal('10'), Decimal('5'), add)
+    assert calc.result is None and calc.error is None  # Nothing captured before perform()
+    calc.perform()
+    assert calc.result == Decimal('15')
+    assert calc.error is None
+
+def test_perform_captures_error():
+    """Test that perform() keeps the error it raises on the calculation."""
+    calc = Calculation(Decimal('10'), Decimal('0'), divide)
+    with pytest.raises(ZeroDivisionError):
+        calc.perform()
+    assert isinstance(calc.error, ZeroDivisionError)
+    assert calc.result is None
@@ -1,16 +1,20 @@
 '''Tests for Calculations.py'''
 
 # Import required modules
+import os
+import threading
 from unittest.mock import patch, MagicMock
 from decimal import Decimal  # Import Decimal for precise arithmetic operations
+import numpy as np
 import pandas as pd
 # Import pytest for unit testing framework
 import pytest
 
 # Import necessary classes and functions from the calculator module
 from calculator.calculation import Calculation
+from calculator.config import history_config
 from calculator.calculations import Calculations
-from calculator.operations import add, subtract
+from calculator.operations import add, subtract, multiply, divide, OP_CODES
 
 @pytest.fixture
 def setup_calculations():
@@ -112,6 +116,8 @@ def mock_calculation():
     mock_calc.operation = add  # Setting operation to 'add'
     mock_calc.operation.__name__ = "add"  # Ensure operation has a name
     mock_calc.perform.return_value = 4  # Mock the result of perform() method
+    mock_calc.result = 4  # Result captured when the calculation was performed
+    mock_calc.error = None  # The calculation succeeded
     return mock_calc
 
 # Mock pandas functions
@@ -195,3 +201,195 @@ def test_clear_history_csv(mock_calculation, mock_calculations, capsys):
     # Capture printed output
     captured = capsys.readouterr()
     assert "History cleared." in captured.out
+
+def test_add_calculation_stores_captured_result():
+    """Test that a performed calculation is stored without performing it again."""
+    Calculations.history.clear()
+    calc = Calculation(Decimal('6'), Decimal('3'), subtract)
+    calc.perform()
+    with patch.object(Calculation, "perform") as mock_perform:
+        Calculations.add_calculation(calc)
+    mock_perform.assert_not_called()
+    assert Calculations.get_latest().result == 3
+
+def test_add_calculation_stores_error():
+    """Test that a failed calculation is stored with its error."""
+    Calculations.history.clear()
+    Calculations.add_calculation(Calculation(Decimal('1'), Decimal('0'), divide))
+    latest = Calculations.get_latest()
+    assert isinstance(latest.error, ZeroDivisionError)
+    assert np.isnan(latest.result)
+
+# Journal mode tests
+@pytest.fixture
+def journal(tmp_path, monkeypatch):
+    """Switch history persistence to journal mode with a temporary history file."""
+    history_file = tmp_path / "history.csv"
+    monkeypatch.setattr(history_config, "history_file", str(history_file))
+    monkeypatch.setattr(history_config, "history_mode", "journal")
+    monkeypatch.setattr(history_config, "history_batch_size", 2)
+    Calculations.clear_history()
+    return history_file
+
+def test_journal_appends_only_new_entries(journal):
+    """Test that journal saves append only the entries added since the last save."""
+    Calculations.add_calculation(Calculation(Decimal('1'), Decimal('2'), add))
+    Calculations.save_history()
+    Calculations.add_calculation(Calculation(Decimal('5'), Decimal('3'), subtract))
+    with patch.object(Calculations, "_history_frame", wraps=Calculations._history_frame) as mock_frame:
+        Calculations.save_history()
+    mock_frame.assert_called_once_with(1, 2)  # Only the new entry was formatted
+
+    df = pd.read_csv(journal)
+    assert df["Operation"].tolist() == ["add", "subtract"]
+    assert df["Result"].tolist() == [3.0, 2.0]
+
+def test_journal_fsync_policy(journal, monkeypatch):
+    """Test that the 'batch' fsync policy syncs once per appended batch."""
+    monkeypatch.setattr(history_config, "history_fsync", "batch")
+    for value in range(5):
+        Calculations.add_calculation(Calculation(Decimal(value), Decimal('1'), add))
+    with patch("os.fsync") as mock_fsync:
+        Calculations.save_history()
+    assert mock_fsync.call_count == 3  # 5 entries in batches of 2
+    assert len(pd.read_csv(journal)) == 5
+
+def test_journal_restarts_after_history_is_cleared(journal):
+    """Test that entries added after clearing the store are still appended."""
+    Calculations.add_calculation(Calculation(Decimal('1'), Decimal('1'), add))
+    Calculations.save_history()
+    Calculations.history.clear()
+    Calculations.add_calculation(Calculation(Decimal('4'), Decimal('2'), divide))
+    Calculations.save_history()
+    assert pd.read_csv(journal)["Operation"].tolist() == ["add", "divide"]
+
+def test_compact_history(journal):
+    """Test that compaction drops a torn last line and malformed rows."""
+    Calculations.add_calculation(Calculation(Decimal('1'), Decimal('2'), add))
+    Calculations.save_history()
+    with open(journal, "a", encoding="utf-8") as handle:
+        handle.write("7,8,power,15\n9,1,add,1")  # Unknown operation and an interrupted row
+    Calculations.compact_history()
+
+    df = pd.read_csv(journal)
+    assert df.values.tolist() == [[1.0, 2.0, "add", 3.0]]
+    assert not os.path.exists(f"{journal}.tmp")
+
+# Loading tests
+@pytest.fixture
+def history_file(tmp_path, monkeypatch):
+    """Write a small history file, including an unknown operation, and point HISTORY_FILE at it."""
+    path = tmp_path / "history.csv"
+    path.write_text(
+        "Operand1,Operand2,Operation,Result\n"
+        "2.0,3.0,add,5.0\n"
+        "7.0,2.0,power,49.0\n"
+        "4.0,1.0,subtract,3.0\n"
+        "3.0,2.0,divide,1.5\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(history_config, "history_file", str(path))
+    return path
+
+@pytest.mark.parametrize("chunksize", [None, 1, 2])
+def test_load_history_in_bulk(history_file, chunksize):
+    """Test that loading maps operation names in bulk and skips unknown operations, chunked or not."""
+    Calculations.load_history(chunksize=chunksize)
+    history = Calculations.get_history()
+    assert [calc.operation.__name__ for calc in history] == ["add", "subtract", "divide"]
+    assert history.result.tolist() == [5.0, 3.0, 1.5]
+    assert history.operand1.dtype == np.float64
+
+def test_stream_history(history_file):
+    """Test that streaming yields column chunks without touching the in-memory history."""
+    Calculations.history.clear()
+    chunks = list(Calculations.stream_history(chunksize=2))
+    assert len(chunks) == 2
+    op_codes = np.concatenate([chunk[0] for chunk in chunks])
+    assert op_codes.tolist() == [OP_CODES["add"], OP_CODES["subtract"], OP_CODES["divide"]]
+    assert len(Calculations.get_history()) == 0
+
+def test_load_history_missing_file(tmp_path, monkeypatch, capsys):
+    """Test that loading a missing file reports it and keeps the current history."""
+    monkeypatch.setattr(history_config, "history_file", str(tmp_path / "missing.csv"))
+    Calculations.history.clear()
+    Calculations.add_calculation(Calculation(Decimal('1'), Decimal('1'), add))
+    Calculations.load_history()
+    assert "No history file found." in capsys.readouterr().out
+    assert len(Calculations.get_history()) == 1
+
+def test_spilled_history_is_saved_and_searched(journal, monkeypatch):
+    """Test that history spilled past the memory limit is still saved and searchable."""
+    monkeypatch.setattr(Calculations.history, "memory_limit", 4)
+    for value in range(10):
+        Calculations.add_calculation(Calculation(Decimal(value), Decimal('2'), multiply if value % 3 else add))
+    assert Calculations.history.spilled_count > 0
+    Calculations.save_history()
+
+    assert pd.read_csv(journal)["Operand1"].tolist() == [float(value) for value in range(10)]
+    assert [calc.a for calc in Calculations.find_by_operation("add")] == [0.0, 3.0, 6.0, 9.0]
+
+@pytest.fixture
+def binary_history(tmp_path, monkeypatch):
+    """Point HISTORY_FILE at a binary (.npy) history file in a temporary directory."""
+    path = tmp_path / "history.npy"
+    monkeypatch.setattr(history_config, "history_file", str(path))
+    Calculations.clear_history()
+    return path
+
+def test_binary_history_round_trip(binary_history):
+    """Test that a .npy history file is saved and loaded as binary records."""
+    Calculations.add_calculation(Calculation(Decimal('7'), Decimal('2'), subtract))
+    Calculations.add_calculation(Calculation(Decimal('1'), Decimal('4'), divide))
+    Calculations.save_history()
+    assert np.load(binary_history)["result"].tolist() == [5.0, 0.25]
+
+    Calculations.history.clear()
+    Calculations.load_history(chunksize=1)
+    assert [calc.operation.__name__ for calc in Calculations.get_history()] == ["subtract", "divide"]
+    assert Calculations.get_history().operand2.tolist() == [2.0, 4.0]
+
+def test_convert_history_between_formats(history_file, tmp_path):
+    """Test converting CSV to binary and back, skipping unknown operations."""
+    binary_file, csv_file = str(tmp_path / "converted.npy"), str(tmp_path / "converted.csv")
+    assert Calculations.convert_history(binary_file, chunksize=2) == 3
+    assert Calculations.convert_history(csv_file, source=binary_file) == 3
+    assert pd.read_csv(csv_file).values.tolist() == [
+        [2.0, 3.0, "add", 5.0], [4.0, 1.0, "subtract", 3.0], [3.0, 2.0, "divide", 1.5]
+    ]
+
+def test_save_while_other_threads_calculate(tmp_path, monkeypatch):
+    """Test that saves running alongside appending threads write a consistent prefix of history."""
+    monkeypatch.setattr(history_config, "history_file", str(tmp_path / "history.csv"))
+    monkeypatch.setattr(history_config, "history_mode", "rewrite")
+    Calculations.clear_history()
+    done = threading.Event()
+    saved = []
+
+    def calculate(thread):
+        for i in range(1500):
+            Calculations.add_result(add, thread, i, thread + i)
+
+    def save():
+        while not done.is_set():
+            with patch("builtins.print"):
+                Calculations.save_history()
+            if os.path.exists(history_config.history_file):
+                saved.append(pd.read_csv(history_config.history_file))
+
+    saver = threading.Thread(target=save)
+    saver.start()
+    workers = [threading.Thread(target=calculate, args=(thread,)) for thread in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    done.set()
+    saver.join()
+
+    history = Calculations.get_history()
+    assert len(history) == 6000
+    final = Calculations._history_frame()
+    assert saved
+    for frame in saved:
+        assert frame.equals(final.iloc[:len(frame)].reset_index(drop=True).astype(frame.dtypes))
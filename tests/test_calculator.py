@@ -1,10 +1,15 @@
 '''My Calculator Test'''
 
 # Import pytest for testing framework support
-import pytest # pylint: disable=unused-import
+import pytest
+
+# Import NumPy to build operand arrays for batch evaluation
+import numpy as np
 
 # Import the Calculator class from the calculator module
 from calculator import Calculator
+from calculator.calculations import Calculations
+from calculator.operations import multiply
 
 def test_addition():
     '''Test that the addition function correctly adds two numbers.'''
@@ -44,3 +49,52 @@ def test_divide():
         assert False, "Expected ZeroDivisionError, but no exception was raised."
     except ZeroDivisionError:
         pass  # Correct behavior, no action needed
+
+def test_evaluate_batch():
+    '''Test that a batch is evaluated element-wise and appended to history in bulk.'''
+    Calculations.history.clear()  # Start from an empty history
+    result = Calculator.evaluate_batch("add", np.array([1.0, 2.0, 3.0]), np.array([4.0, 5.0, 6.0]))
+    assert result.tolist() == [5.0, 7.0, 9.0], f"Unexpected batch result {result}"
+
+    # Every operand pair of the batch is recorded
+    assert len(Calculations.get_history()) == 3
+    assert Calculations.history.result.tolist() == [5.0, 7.0, 9.0]
+
+def test_evaluate_batch_accepts_operation_function():
+    '''Test that evaluate_batch accepts an operation function and broadcasts scalars.'''
+    result = Calculator.evaluate_batch(multiply, [1, 2, 3], 2)
+    assert result.tolist() == [2.0, 4.0, 6.0], f"Unexpected batch result {result}"
+
+def test_evaluate_batch_divide_by_zero_is_masked():
+    '''Test that division by zero masks the affected elements instead of raising.'''
+    Calculations.history.clear()
+    result = Calculator.evaluate_batch("divide", [10, 5, 8], [2, 0, 4])
+    assert result.mask.tolist() == [False, True, False]
+    assert result.compressed().tolist() == [5.0, 2.0]
+
+    # Only the rows that produced a result are recorded
+    assert Calculations.history.result.tolist() == [5.0, 2.0]
+
+def test_evaluate_batch_unknown_operation():
+    '''Test that an unknown batch operation raises a ValueError.'''
+    with pytest.raises(ValueError, match="Unknown operation: power"):
+        Calculator.evaluate_batch("power", [1], [2])
+
+def test_evaluate_records_one_entry():
+    '''Test that an expression is evaluated and recorded as a single history entry.'''
+    Calculations.clear_history()
+    assert Calculator.evaluate("(2 + x) * 4 / 8", {"x": 3}) == 2.5
+    history = Calculations.get_history()
+    assert len(history) == 1
+    entry = history[0]
+    assert (entry.a, entry.b, entry.operation.__name__, entry.result) == (20.0, 8.0, "divide", 2.5)
+    assert entry.expression == "(2 + x) * 4 / 8"
+
+def test_evaluate_division_by_zero_is_recorded():
+    '''Test that an expression whose last operation fails is recorded with its error.'''
+    Calculations.clear_history()
+    with pytest.raises(ZeroDivisionError):
+        Calculator.evaluate("(1 + 2) / (3 - 3)")
+    entry = Calculations.get_history()[0]
+    assert isinstance(entry.error, ZeroDivisionError)
+    assert entry.expression == "(1 + 2) / (3 - 3)"
@@ -6,6 +6,7 @@ are correctly handled by the app. The tests also cover cases of invalid inputs,
 missing arguments, and proper error handling during command execution.
 """
 
+import io
 from unittest.mock import patch
 # Import pytest for unit testing framework
 import pytest   # pylint: disable=unused-import
@@ -49,6 +50,38 @@ def test_app_invalid_command():
             app.start()
     mock_print.assert_any_call("No such command: unknown")
 
+def test_app_run_script():
+    """Test script mode runs commands from a stream, writes their output and stops at exit."""
+    app = App()
+    script = io.StringIO("add 1 2\n\nunknown\nexit\nadd 5 5\n")
+    output = io.StringIO()
+    assert app.run_script(script, output) == 3
+    assert output.getvalue() == (
+        "The result of 1 + 2 is equal to 3.0\n"
+        "No such command: unknown\n"
+        "Exiting...\n"
+    )
+
+def test_app_run_script_chunks(monkeypatch, capsys):
+    """Test script mode reads input in several chunks and prints a throughput summary."""
+    monkeypatch.setattr("app.SCRIPT_READ_HINT", 1)
+    app = App()
+    output = io.StringIO()
+    assert app.run_script(io.StringIO("add 1 1\nmultiply 2 3\n"), output) == 2
+    assert output.getvalue() == (
+        "The result of 1 + 1 is equal to 2.0\n"
+        "The result of 2 x 3 is equal to 6.0\n"
+    )
+    assert "Processed 2 commands" in capsys.readouterr().err
+
+def test_app_run_script_builtin_exit():
+    """Test script mode stops at the built-in exit when no exit plugin is registered."""
+    app = App()
+    del app.command_handler.commands["exit"]
+    output = io.StringIO()
+    assert app.run_script(io.StringIO("exit\nadd 1 1\n"), output) == 1
+    assert output.getvalue() == "Exiting application...\n"
+
 def test_add_command(capfd):
     """Test addition command with valid inputs."""
     command = addCommand()
@@ -0,0 +1,66 @@
+"""
+Tests for config.py.
+
+These tests verify that history settings are resolved lazily from the environment,
+can be injected directly, and that importing the calculator stays cheap.
+"""
+
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+import pytest
+
+from calculator.config import HistoryConfig
+
+# Maximum time, in milliseconds, that `import calculator` may take in a fresh interpreter
+IMPORT_BUDGET_MS = 300
+
+def test_settings_resolve_from_environment():
+    """Test that settings are read from the environment on first use and then cached."""
+    config = HistoryConfig()
+    with patch.dict(os.environ, {"HISTORY_FILE": "env_history.csv", "HISTORY_BATCH_SIZE": "50"}):
+        assert config.history_file == "env_history.csv"
+        assert config.history_batch_size == 50
+    # The resolved value is kept even after the environment changes
+    assert config.history_file == "env_history.csv"
+
+def test_settings_defaults():
+    """Test that unset settings fall back to their defaults."""
+    config = HistoryConfig()
+    with patch.dict(os.environ, {"HISTORY_MODE": "", "HISTORY_FSYNC": ""}):
+        assert config.history_mode == "rewrite"
+        assert config.history_fsync == "save"
+
+def test_configure_and_reset():
+    """Test that injected settings override the environment until reset."""
+    config = HistoryConfig()
+    with patch.dict(os.environ, {"HISTORY_FILE": "env_history.csv"}):
+        config.configure(history_file="injected.csv")
+        assert config.history_file == "injected.csv"
+        config.reset()
+        assert config.history_file == "env_history.csv"
+
+def test_configure_unknown_setting():
+    """Test that unknown settings are rejected."""
+    with pytest.raises(TypeError, match="Unknown history setting: colour"):
+        HistoryConfig().configure(colour="blue")
+    with pytest.raises(AttributeError):
+        HistoryConfig().colour  # pylint: disable=expression-not-assigned
+
+def test_import_calculator_is_cheap():
+    """Test that importing the calculator does not build the App and stays within its time budget."""
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import calculator\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        "print(elapsed, 'app' in sys.modules, 'pandas' in sys.modules, 'dotenv' in sys.modules)\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    runs = [subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+            for _ in range(3)]
+    _, app_loaded, pandas_loaded, dotenv_loaded = runs[-1].stdout.split()
+    assert (app_loaded, pandas_loaded, dotenv_loaded) == ("False", "False", "False")
+    best = min(float(run.stdout.split()[0]) for run in runs)
+    assert best < IMPORT_BUDGET_MS, f"import calculator took {best:.1f} ms (budget {IMPORT_BUDGET_MS} ms)"
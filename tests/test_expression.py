@@ -0,0 +1,55 @@
+"""
+Tests for compiling and evaluating arithmetic expressions.
+"""
+
+# Import pytest for unit testing framework
+import pytest
+
+from calculator.expression import compile_expression
+from calculator.operations import add, divide, subtract
+
+@pytest.mark.parametrize("text, variables, expected", [
+    ("(2 + 3) * 4 / 8", None, 2.5),
+    ("2 + 3 * 4", None, 14),
+    ("-(a + b) * 2", {"a": 1, "b": 2}, -6),
+    ("x * x - +y", {"x": 3, "y": 1.5}, 7.5),
+])
+def test_evaluate(text, variables, expected):
+    """Test that expressions follow operator precedence, parentheses and variables."""
+    assert compile_expression(text).evaluate(variables) == expected
+
+def test_outermost_operation_and_operands():
+    """Test that the outermost operation is kept apart from its evaluated operands."""
+    compiled = compile_expression("(2 + 3) * 4 / 7")
+    assert compiled.operation is divide
+    assert compiled.operands() == (20, 7)
+    assert compile_expression("-x").operation is subtract
+    assert compile_expression("a + 1").names == frozenset({"a"})
+
+def test_compiled_expressions_are_cached_by_text():
+    """Test that the same text is compiled once and reused with other variables."""
+    compile_expression.cache_clear()
+    first = compile_expression("k * 2 + 1")
+    second = compile_expression("k * 2 + 1")
+    assert first is second
+    assert compile_expression.cache_info().hits == 1
+    assert (first.evaluate({"k": 1}), second.evaluate({"k": 5})) == (3, 11)
+
+@pytest.mark.parametrize("text", [
+    "2 ** 3", "abs(2) + 1", "5", "_x + 1", "'a' + 1", "True + 1", "a.b + 1", "1 +", "~1 + 2", "",
+])
+def test_invalid_expressions(text):
+    """Test that unsupported syntax, values, names and bare numbers are rejected."""
+    with pytest.raises(ValueError):
+        compile_expression(text)
+
+def test_missing_variable():
+    """Test that evaluating without a value for every variable is an error."""
+    with pytest.raises(ValueError, match="y"):
+        compile_expression("x + y").evaluate({"x": 1})
+
+def test_division_by_zero():
+    """Test that a division by zero anywhere in the expression raises."""
+    with pytest.raises(ZeroDivisionError):
+        compile_expression("(1 / 0) + 2").evaluate()
+    assert compile_expression("1 + 0").operation is add
@@ -0,0 +1,39 @@
+"""
+Tests for history_file.py.
+
+This module contains test cases for the binary (.npy) history file format.
+"""
+
+# Import necessary modules for testing
+import numpy as np
+# Import pytest for testing framework support
+import pytest
+
+from calculator.history_file import RECORD_DTYPE, is_binary, open_records, record_columns, write_records
+from calculator.operations import OP_CODES
+
+def test_write_and_open_records(tmp_path):
+    """Test that pages written with or without a known count read back as records."""
+    pages = [([OP_CODES["add"]], [1.0], [2.0], [3.0]), ([OP_CODES["multiply"]] * 2, [2.0, 3.0], [2.0, 3.0], [4.0, 9.0])]
+    for count in (3, None):
+        path = tmp_path / f"history-{count}.npy"
+        assert write_records(path, iter(pages), count=count) == 3
+        records = open_records(path)
+        assert records.dtype == RECORD_DTYPE
+        assert records["result"].tolist() == [3.0, 4.0, 9.0]
+    assert not list(tmp_path.glob("*.tmp"))
+
+def test_record_columns_skips_unknown_op_codes():
+    """Test that records with an op code outside the operations table are skipped."""
+    records = np.zeros(3, dtype=RECORD_DTYPE)
+    records["op_code"] = [OP_CODES["divide"], 42, -1]
+    op_code, _, _, _ = record_columns(records)
+    assert op_code.tolist() == [OP_CODES["divide"]]
+
+def test_open_records_rejects_other_arrays(tmp_path):
+    """Test that a .npy file that is not a history file is rejected."""
+    path = tmp_path / "other.npy"
+    np.save(path, np.arange(5))
+    assert is_binary(path) and not is_binary(tmp_path / "history.csv")
+    with pytest.raises(ValueError):
+        open_records(path)
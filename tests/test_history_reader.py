@@ -0,0 +1,71 @@
+"""
+Tests for history_reader.py.
+
+This module contains test cases for `HistoryReader`, which queries a persisted
+history file (CSV or binary) without loading it into `Calculations.history`.
+"""
+
+# Import necessary modules for testing
+import tracemalloc
+import numpy as np
+# Import pytest for testing framework support
+import pytest
+
+from calculator.calculations import Calculations
+from calculator.history_file import write_records
+from calculator.history_reader import HistoryReader, HistoryRow
+from calculator.operations import OP_CODES
+
+@pytest.fixture(params=["npy", "csv"])
+def history_path(request, tmp_path):
+    """Write a 10-entry history file (add, then divide, alternating) in each format."""
+    operands = np.arange(10, dtype=np.float64)
+    op_codes = np.where(operands % 2, OP_CODES["divide"], OP_CODES["add"]).astype(np.int8)
+    binary_file = str(tmp_path / "history.npy")
+    write_records(binary_file, [(op_codes, operands, operands + 1, operands * 2)], count=10)
+    if request.param == "npy":
+        return binary_file
+    csv_file = str(tmp_path / "history.csv")
+    Calculations.convert_history(csv_file, source=binary_file)
+    return csv_file
+
+def test_count(history_path):
+    """Test counting all entries and the entries of one operation."""
+    reader = HistoryReader(history_path, page_size=3)
+    assert reader.count() == 10
+    assert reader.count("divide") == 5
+    assert reader.count("multiply") == 0
+
+def test_rows_with_offset_and_limit(history_path):
+    """Test filtering and paging entries across page boundaries."""
+    reader = HistoryReader(history_path, page_size=3)
+    assert list(reader.rows("divide", offset=1, limit=2)) == [
+        HistoryRow(3, 3.0, 4.0, "divide", 6.0), HistoryRow(5, 5.0, 6.0, "divide", 10.0)
+    ]
+    assert [row.position for row in reader.rows(offset=8)] == [8, 9]
+
+def test_tail(history_path):
+    """Test that the tail holds the last entries, oldest first."""
+    reader = HistoryReader(history_path, page_size=3)
+    assert [row.position for row in reader.tail(4)] == [6, 7, 8, 9]
+    assert [row.a for row in reader.tail(2, "add")] == [6.0, 8.0]
+    assert reader.tail(0) == []
+
+def test_unknown_operation(history_path):
+    """Test that an unknown operation is rejected."""
+    with pytest.raises(ValueError):
+        HistoryReader(history_path).count("power")
+
+def test_tail_memory_stays_flat(tmp_path):
+    """Test that a tail query over a memory-mapped file does not read the file into memory."""
+    size = 500_000
+    operands = np.arange(size, dtype=np.float64)
+    path = str(tmp_path / "large.npy")
+    write_records(path, [(np.zeros(size, dtype=np.int8), operands, operands, operands)], count=size)
+
+    tracemalloc.start()
+    rows = HistoryReader(path).tail(20)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert rows[-1].position == size - 1
+    assert peak < size * 25 // 4  # Well under the 12.5 MB the records would take
@@ -0,0 +1,88 @@
+"""
+Tests for the running history aggregates and `Calculations.get_stats`.
+"""
+
+import threading
+
+import numpy as np
+# Import pytest for unit testing framework
+import pytest
+
+from calculator import Calculator
+from calculator.calculation import Calculation
+from calculator.calculations import Calculations
+from calculator.config import history_config
+from calculator.history_stats import HistoryAggregates
+from calculator.history_store import HistoryStore
+from calculator.operations import OP_CODES, add, divide
+
+@pytest.fixture
+def empty_history():
+    """Run a test on an empty history."""
+    Calculations.history.clear()
+    yield Calculations.history
+    Calculations.history.clear()
+
+def scanned_stats(store: HistoryStore) -> dict:
+    """Compute the total aggregates by scanning every entry, to compare with the running ones."""
+    results = store.result[~np.isnan(store.result)]
+    return {"count": len(store), "errors": len(store) - len(results), "sum": float(results.sum()),
+            "min": float(results.min()), "max": float(results.max()), "mean": float(results.mean())}
+
+def test_empty_summary():
+    """Test that empty aggregates have no min, max or mean."""
+    assert HistoryAggregates().summary() == {
+        "total": {"count": 0, "errors": 0, "sum": 0, "min": None, "max": None, "mean": None},
+        "operations": {},
+    }
+
+def test_aggregates_cover_every_write_path(empty_history):
+    """Test that single calculations, cached results, batches and bulk extends are all aggregated."""
+    Calculator.add(1, 2)
+    Calculations.add_result(add, 2, 2, 4)
+    Calculator.evaluate_batch("divide", [10, 5, 8], [2, 0, 4])  # The masked element is not recorded
+    empty_history.extend(OP_CODES["add"], np.array([1.0]), np.array([1.0]), np.array([2.0]))
+    Calculations.add_calculation(Calculation.create(1, 0, divide))  # Recorded with its error and a NaN result
+
+    stats = Calculations.get_stats()
+    assert stats["operations"]["add"] == {"count": 3, "errors": 0, "sum": 9.0, "min": 2.0, "max": 4.0, "mean": 3.0}
+    assert stats["operations"]["divide"]["count"] == 3 and stats["operations"]["divide"]["errors"] == 1
+    assert stats["total"] == scanned_stats(empty_history)
+
+def test_aggregates_cover_appends_from_threads(empty_history):
+    """Test that entries still in per-thread shards are aggregated before the summary is read."""
+    def work():
+        for i in range(1000):
+            Calculator.multiply(i, 2)
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    total = Calculations.get_stats()["total"]
+    assert total["count"] == 4000 and total["sum"] == 4 * 2 * sum(range(1000))
+
+def test_aggregates_rebuilt_on_load_and_reset_on_clear(empty_history, tmp_path, monkeypatch):
+    """Test that loading history rebuilds the aggregates from the file, and clearing resets them."""
+    monkeypatch.setattr(history_config, "history_file", str(tmp_path / "history.csv"))
+    Calculator.add(1, 2)
+    Calculator.subtract(10, 4)
+    Calculations.save_history()
+    Calculator.multiply(100, 100)
+
+    Calculations.load_history(chunksize=1)
+    stats = Calculations.get_stats()
+    assert stats["total"]["count"] == 2 and stats["total"]["max"] == 6.0
+    assert set(stats["operations"]) == {"add", "subtract"}
+
+    Calculations.clear_history()
+    assert Calculations.get_stats()["total"]["count"] == 0
+
+def test_aggregates_include_spilled_entries():
+    """Test that spilling entries to disk does not change the aggregates."""
+    store = HistoryStore(capacity=4, memory_limit=8)
+    for i in range(20):
+        store.append(OP_CODES["add"], i, 1, i + 1.0)
+    assert store.spilled_count > 0
+    assert store.summary()["total"] == scanned_stats(store)
+    store.clear()
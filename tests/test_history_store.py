@@ -0,0 +1,177 @@
+"""
+Tests for history_store.py.
+
+This module contains test cases for the columnar `HistoryStore` and the
+`CalculationView` objects it hands out.
+"""
+
+# Import necessary modules for testing
+import threading
+from decimal import Decimal
+from fractions import Fraction
+import numpy as np
+# Import pytest for testing framework support
+import pytest
+
+from calculator.calculation import Calculation
+from calculator.config import history_config
+from calculator.history_store import HistoryStore, CalculationView
+from calculator.operations import add, divide, multiply, OP_CODES
+
+def test_append_and_view():
+    """Test that an appended entry reads back through a view."""
+    store = HistoryStore()
+    store.append(OP_CODES["add"], Decimal("2"), Decimal("3"), Decimal("5"))
+
+    view = store[0]
+    assert isinstance(view, CalculationView)
+    assert (view.a, view.b, view.result) == (2.0, 3.0, 5.0)
+    assert view.operation is add
+    assert view.perform() == 5.0
+    assert repr(view) == "Calculation(2.0, 3.0, add)"
+
+def test_view_equals_calculation():
+    """Test that a view compares equal to the calculation it was built from."""
+    store = HistoryStore()
+    store.append(OP_CODES["divide"], 10, 4, 2.5)
+    assert store[-1] == Calculation(Decimal("10"), Decimal("4"), divide)
+    assert store[-1] != Calculation(Decimal("10"), Decimal("4"), add)
+
+def test_extend_grows_capacity():
+    """Test that bulk appends grow the columns past the initial capacity."""
+    store = HistoryStore(capacity=4)
+    a = np.arange(10, dtype=np.float64)
+    store.extend(OP_CODES["add"], a, a, a + a)
+    store.append(OP_CODES["divide"], 1, 2, 0.5)
+
+    assert len(store) == 11
+    assert store.result[:10].tolist() == (a + a).tolist()
+    assert store.op_code[-1] == OP_CODES["divide"]
+    assert [view.a for view in store[8:]] == [8.0, 9.0, 1.0]
+
+def test_operation_positions_index():
+    """Test that the per-operation index follows appends, bulk appends and clear."""
+    store = HistoryStore(capacity=2)
+    store.append(OP_CODES["add"], 1, 1, 2)
+    store.extend(OP_CODES["divide"], [4, 6], [2, 3], [2, 2])
+    codes = np.array([OP_CODES["add"], OP_CODES["divide"], OP_CODES["add"]], dtype=np.int8)
+    store.extend(codes, [1, 2, 3], [1, 2, 3], [2, 1, 6])
+
+    assert store.positions(OP_CODES["add"]).tolist() == [0, 3, 5]
+    assert store.positions(OP_CODES["divide"]).tolist() == [1, 2, 4]
+    assert store.positions(OP_CODES["multiply"]).tolist() == []
+    store.clear()
+    assert store.positions(OP_CODES["add"]).tolist() == []
+
+def test_clear_and_index_errors():
+    """Test that clearing empties the store and out-of-range access raises."""
+    store = HistoryStore()
+    store.append(OP_CODES["add"], 1, 1, 2)
+    store.clear()
+    assert len(store) == 0 and not store
+    with pytest.raises(IndexError):
+        store[0]  # pylint: disable=pointless-statement
+
+def test_memory_limit_spills_oldest_entries(tmp_path, monkeypatch):
+    """Test that entries past the memory limit spill to disk and stay readable."""
+    monkeypatch.setattr(history_config, "history_spill_file", str(tmp_path / "history.spill"))
+    store = HistoryStore(capacity=4, memory_limit=8)
+    for i in range(20):
+        store.append(OP_CODES["add"] if i % 2 else OP_CODES["multiply"], i, 1, i + 1)
+
+    assert len(store) == 20
+    assert store.resident_count <= 8 and store.spilled_count == 20 - store.resident_count
+    assert store.nbytes == 8 * 25
+    assert (tmp_path / "history.spill").stat().st_size == store.spilled_count * 25
+    assert [view.a for view in store] == [float(i) for i in range(20)]
+    assert store[0] == Calculation(Decimal("0"), Decimal("1"), multiply)
+    assert store.positions(OP_CODES["add"]).tolist() == list(range(1, 20, 2))
+    assert store.columns(2, 12)[3].tolist() == [float(i + 1) for i in range(2, 12)]
+    assert store.result.tolist() == [float(i + 1) for i in range(20)]
+
+    store.clear()
+    assert len(store) == 0 and store.spilled_count == 0
+    assert (tmp_path / "history.spill").stat().st_size == 0
+
+def test_memory_limit_with_large_batch():
+    """Test that a bulk append larger than the memory limit is spilled down to the limit."""
+    store = HistoryStore(memory_limit=100)
+    a = np.arange(1000, dtype=np.float64)
+    store.extend(OP_CODES["divide"], a, a + 1, a / (a + 1))
+    store.append(OP_CODES["add"], 1, 2, 3, error=None)
+
+    assert len(store) == 1001
+    assert store.resident_count <= 100 and store.nbytes == 100 * 25
+    assert store.positions(OP_CODES["divide"]).tolist() == list(range(1000))
+    assert store.positions(OP_CODES["add"]).tolist() == [1000]
+    assert store[999].b == 1000.0 and store[-1].result == 3.0
+
+def test_memory_limit_spills_side_tables(tmp_path, monkeypatch):
+    """Test that the errors, expressions and exact values of spilled entries leave memory with them."""
+    monkeypatch.setattr(history_config, "history_spill_file", str(tmp_path / "history.spill"))
+    store = HistoryStore(memory_limit=100)
+    for i in range(5000):
+        error = ZeroDivisionError("Cannot divide by zero.") if i % 1000 == 1 else None
+        store.append(OP_CODES["add"], Fraction(i, 3), Fraction(1, 3), Fraction(i + 1, 3), error,
+                     "x + 1" if i % 1000 == 2 else None, exact=True)
+    big = Fraction(1, 3)
+    store.extend(OP_CODES["add"], np.ones(300), np.ones(300), np.full(300, 2.0), [(big, big, 2 * big)] * 300)
+
+    assert len(store) == 5300 and store.resident_count <= 100
+    assert len(store.exact) + len(store.errors) + len(store.expressions) <= 100
+    assert store[0].result == Fraction(1, 3) and store[4999].a == Fraction(4999, 3)
+    assert str(store[1001].error) == "Cannot divide by zero." and store[1001].expression is None
+    assert store[2002].expression == "x + 1" and store[2003].error is None
+    assert store[5000].result == Fraction(2, 3)
+    errors, expressions, exact = store.side_tables(900, 2100)
+    assert (list(errors), list(expressions)) == ([1001, 2001], [1002, 2002])
+    assert list(exact) == list(range(900, 2100)) and exact[1500][2] == Fraction(1501, 3)
+
+    store.clear()
+    assert store.side_tables() == ({}, {}, {})
+    assert (tmp_path / "history.spill.side").stat().st_size == 0
+
+def test_concurrent_appends_keep_every_entry_in_thread_order():
+    """Test that entries appended from many threads are all merged, each thread's in order."""
+    store = HistoryStore(memory_limit=0)
+    threads, appends = 8, 3000
+    store.SHARD_SIZE = 64  # Make threads merge their own shards while others append
+
+    def worker(thread):
+        for i in range(appends):
+            store.append(OP_CODES["add"], thread, i, thread + i)
+            if i % 500 == 0:
+                len(store)  # Merge on read while other threads keep appending
+
+    workers = [threading.Thread(target=worker, args=(thread,)) for thread in range(threads)]
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+
+    assert len(store) == threads * appends
+    for thread in range(threads):
+        mine = store.operand1 == thread
+        assert np.array_equal(store.operand2[mine], np.arange(appends))  # In append order
+    assert len(store.positions(OP_CODES["add"])) == threads * appends
+
+def test_concurrent_append_with_spilling():
+    """Test that merges from many threads stay consistent while the store spills to disk."""
+    store = HistoryStore(memory_limit=256)
+    store.SHARD_SIZE = 32
+
+    def worker(thread):
+        for i in range(1000):
+            store.append(OP_CODES["multiply"], thread, i, thread * i)
+
+    workers = [threading.Thread(target=worker, args=(thread,)) for thread in range(4)]
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+
+    assert len(store) == 4000
+    assert store.spilled_count > 0
+    op_code, a, b, result = store.columns()
+    assert np.array_equal(a * b, result)
+    assert sorted(zip(a.tolist(), b.tolist())) == [(t, i) for t in range(4) for i in range(1000)]
@@ -0,0 +1,91 @@
+"""
+Tests for the hot-path log guards.
+"""
+
+import logging
+# Import pytest for unit testing framework
+import pytest   # pylint: disable=unused-import
+
+import calculator
+from calculator import Calculator
+from calculator.operations import divide
+from calculator.log_guards import LogGuard, log_guard, refresh_log_guards
+
+HOT_PATH_LOGGERS = ("calculator", "calculator.operations", "calculator.calculation", "calculator.calculations")
+
+@pytest.fixture
+def calculator_level():
+    """Enable the hot-path loggers, then restore their state and the guards after a test."""
+    loggers = [logging.getLogger(name) for name in HOT_PATH_LOGGERS]
+    saved = [(logger.level, logger.disabled) for logger in loggers]
+    for logger in loggers:
+        logger.disabled = False  # An earlier `fileConfig` may have disabled them
+    yield loggers[0]
+    for logger, (level, disabled) in zip(loggers, saved):
+        logger.setLevel(level)
+        logger.disabled = disabled
+    refresh_log_guards()
+
+def test_guard_follows_logger_level():
+    """Test that a guard is decided from its logger's level, and only again on refresh."""
+    logger = logging.getLogger("tests.log_guards")
+    logger.setLevel(logging.INFO)
+    guard = LogGuard(logger)
+    assert (guard.debug, guard.info) == (False, True)
+    logger.setLevel(logging.DEBUG)
+    assert guard.debug is False  # Decided once
+    guard.refresh()
+    assert (guard.debug, guard.info) == (True, True)
+
+def test_refresh_log_guards_refreshes_every_guard():
+    """Test that `refresh_log_guards` decides every registered guard again."""
+    logger = logging.getLogger("tests.log_guards.registered")
+    logger.setLevel(logging.WARNING)
+    guard = log_guard(logger)
+    assert guard.info is False
+    logger.setLevel(logging.INFO)
+    refresh_log_guards()
+    assert guard.info is True
+
+def test_debug_messages_after_refresh(caplog, calculator_level):
+    """Test that hot-path debug messages are formatted and emitted once the guards allow them."""
+    calculator_level.setLevel(logging.DEBUG)
+    refresh_log_guards()
+    with caplog.at_level(logging.DEBUG, logger="calculator"):
+        Calculator.add(2, 3)
+    assert "Performed addition: 2 + 3 = 5" in caplog.messages
+    assert "Operation successful: add(2, 3) = 5" in caplog.messages
+
+def test_root_level_change_after_import_needs_refresh(caplog, calculator_level):
+    """Test the library path: raising the root level after import logs only once the guards are refreshed."""
+    for name in HOT_PATH_LOGGERS:
+        logging.getLogger(name).setLevel(logging.NOTSET)  # Follow the root level, as without logging.conf
+    root = logging.getLogger()
+    saved = root.level
+    root.setLevel(logging.WARNING)
+    refresh_log_guards()
+    try:
+        with caplog.at_level(logging.DEBUG):  # Like logging.basicConfig(level=logging.DEBUG)
+            Calculator.add(4, 5)
+            assert "Operation successful: add(4, 5) = 9" not in caplog.messages  # The guards are stale
+            calculator.refresh_log_guards()
+            Calculator.add(4, 5)
+        assert "Operation successful: add(4, 5) = 9" in caplog.messages
+    finally:
+        root.setLevel(saved)
+
+def test_no_records_when_guards_are_off(caplog, calculator_level):
+    """Test that no hot-path records are created when the guards are off."""
+    calculator_level.setLevel(logging.WARNING)
+    refresh_log_guards()
+    with caplog.at_level(logging.DEBUG):
+        Calculator.multiply(2, 3)
+    assert not [record for record in caplog.records if record.name.startswith("calculator")]
+
+def test_division_by_zero_is_still_logged(caplog, calculator_level):
+    """Test that errors are logged whatever the guards say."""
+    calculator_level.setLevel(logging.WARNING)
+    refresh_log_guards()
+    with caplog.at_level(logging.ERROR), pytest.raises(ZeroDivisionError):
+        divide(1, 0)
+    assert "Attempted division by zero: 1 / 0" in caplog.messages
@@ -0,0 +1,99 @@
+"""
+Tests for queue-based logging.
+"""
+
+import logging
+import os
+import queue
+from unittest.mock import patch
+# Import pytest for unit testing framework
+import pytest   # pylint: disable=unused-import
+
+from app import App
+from app.log_queue import BoundedQueueHandler, queue_logging_active, start_queue_logging, stop_queue_logging
+from app.plugins.exit import exitCommand
+
+class ListHandler(logging.Handler):
+    """A handler that keeps the messages it handles."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+@pytest.fixture
+def root_handler():
+    """Give the root logger a single collecting handler, and restore it afterwards."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    handler = ListHandler()
+    root.handlers = [handler]
+    root.setLevel(logging.INFO)
+    yield handler
+    stop_queue_logging()
+    root.handlers = saved_handlers
+    root.setLevel(saved_level)
+
+def test_records_pass_through_the_queue(root_handler):
+    """Test that records reach the original handlers once the queue is flushed."""
+    start_queue_logging(100)
+    assert queue_logging_active()
+    assert root_handler not in logging.getLogger().handlers
+    logging.info("queued message")
+    assert stop_queue_logging() == 0
+    assert "queued message" in root_handler.messages
+    assert root_handler in logging.getLogger().handlers
+    assert not queue_logging_active()
+
+def test_drop_policy_counts_dropped_records():
+    """Test that the drop policy discards records while the queue is full."""
+    handler = BoundedQueueHandler(queue.Queue(1), "drop")
+    for number in range(3):
+        handler.handle(logging.makeLogRecord({"msg": f"record {number}", "levelno": logging.INFO}))
+    assert handler.dropped == 2
+    assert handler.queue.get_nowait().getMessage() == "record 0"
+
+def test_invalid_settings_are_rejected():
+    """Test that an unknown overflow policy or a non-positive size is an error."""
+    with pytest.raises(ValueError):
+        BoundedQueueHandler(queue.Queue(1), "spill")
+    with pytest.raises(ValueError):
+        start_queue_logging(0)
+
+def test_stop_reports_dropped_records(root_handler):
+    """Test that stopping reports how many records were dropped."""
+    handler = start_queue_logging(1, "drop")
+    handler.dropped = 5
+    assert stop_queue_logging() == 5
+    assert "5 log records were dropped while the log queue was full." in root_handler.messages
+
+def test_app_configures_queue_logging():
+    """Test that LOG_QUEUE_SIZE turns on queue logging from App.configure_logging."""
+    with patch.dict(os.environ, {"LOG_QUEUE_SIZE": "1000", "LOG_QUEUE_OVERFLOW": "block"}):
+        App()
+    try:
+        handler = logging.getLogger().handlers[0]
+        assert isinstance(handler, BoundedQueueHandler)
+        assert handler.overflow == "block"
+    finally:
+        stop_queue_logging()
+    assert not isinstance(logging.getLogger().handlers[0], BoundedQueueHandler)
+
+def test_stop_with_a_full_queue(root_handler):
+    """Test that stopping waits for room for its stop signal when the queue is full."""
+    handler = start_queue_logging(1, "block")
+    for number in range(20):
+        logging.info(f"record {number}")
+    assert stop_queue_logging() == handler.dropped == 0
+    assert "record 19" in root_handler.messages
+
+def test_exit_flushes_queue(root_handler):
+    """Test that the exit command writes out queued records before terminating."""
+    start_queue_logging(100)
+    logging.info("logged before exit")
+    with patch("builtins.print"), pytest.raises(SystemExit):
+        exitCommand().execute([])
+    assert not queue_logging_active()
+    assert "logged before exit" in root_handler.messages
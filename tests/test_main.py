@@ -0,0 +1,225 @@
+"""
+Tests for the command-line entry points in main.py.
+"""
+
+import decimal
+import io
+import json
+import os
+import subprocess
+import sys
+from decimal import Decimal
+from fractions import Fraction
+# Import pytest for unit testing framework
+import pytest
+
+import main
+from calculator import Calculator
+from calculator.calculations import Calculations
+from calculator.numeric import set_backend, use_backend
+from calculator.operations import registry
+
+def test_parse_args():
+    """Test that the one-shot arguments are parsed into operands and an operation."""
+    assert main.parse_args(["6", "3", "divide"]) == (6.0, 3.0, "divide")
+    with pytest.raises(ValueError):
+        main.parse_args(["6", "x", "divide"])
+
+def test_parse_args_uses_numeric_backend():
+    """Test that the one-shot arguments are parsed with the active numeric backend."""
+    with use_backend("fraction"):
+        assert main.parse_args(["1/3", "2", "add"]) == (Fraction(1, 3), Fraction(2), "add")
+        assert main.perform_operation(*main.parse_args(["1/3", "1/6", "add"])) == Fraction(1, 2)
+
+def modulo(a, b):
+    """The remainder of a / b; registered at runtime by the test below."""
+    return a % b
+
+def test_perform_operation_dispatches_through_registry():
+    """Test that operations registered at runtime are performed, and errors keep their messages."""
+    registry.register(modulo)
+    assert main.perform_operation(7, 3, "modulo") == 1
+    with pytest.raises(ZeroDivisionError, match="Cannot divide by zero."):
+        main.perform_operation(1, 0, "divide")
+    with pytest.raises(ValueError, match="Unknown operation: root"):
+        main.perform_operation(1, 2, "root")
+
+def test_run_batch_jsonl(capsys):
+    """Test that every JSON-lines request gets a result or error record, with its line number."""
+    requests = io.StringIO(
+        '{"a": 6, "b": 3, "operation": "divide"}\n'
+        '\n'
+        '{"a": 1, "b": 0, "operation": "divide"}\n'
+        '{"a": 1, "b": 2}\n'
+        'not json\n'
+        '{"a": 2, "b": 2, "operation": "power"}\n'
+    )
+    output = io.StringIO()
+    assert main.run_batch(requests, output) == 5
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert records[0] == {"line": 1, "result": 2.0}
+    assert records[1] == {"line": 3, "error": "Cannot divide by zero."}
+    assert records[2] == {"line": 4, "error": "Invalid request: missing field 'operation'"}
+    assert records[3]["line"] == 5 and records[3]["error"].startswith("Invalid request:")
+    assert records[4] == {"line": 6, "error": "Unknown operation: power"}
+    assert "Processed 5 rows (4 errors)" in capsys.readouterr().err
+
+def test_run_batch_non_string_operation(tmp_path):
+    """Test that an operation that is not a string is a row error, not a crash of the run."""
+    source, target = tmp_path / "requests.jsonl", tmp_path / "results.jsonl"
+    source.write_text('{"a": 1, "b": 2, "operation": ["add"]}\n'
+                      '{"a": 1, "b": 2, "operation": {"name": "add"}}\n'
+                      '{"a": 1, "b": 2, "operation": "add"}\n', encoding="utf-8")
+    assert main.batch_main(["--batch", str(source), "--output", str(target)]) == 3
+    records = [json.loads(line) for line in target.read_text(encoding="utf-8").splitlines()]
+    assert records == [{"line": 1, "error": "Unknown operation: ['add']"},
+                       {"line": 2, "error": "Unknown operation: {'name': 'add'}"},
+                       {"line": 3, "result": 3.0}]
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_batch_arithmetic_errors_are_row_errors(workers):
+    """Test that a decimal overflow is reported in its row's record, not raised out of the run."""
+    text = ('{"a": "1e999999999", "b": "1e999999999", "operation": "multiply"}\n'
+            '{"a": "1.5", "b": "2", "operation": "add"}\n')
+    output = io.StringIO()
+    set_backend("decimal")
+    try:
+        if workers is None:
+            main.run_batch(io.StringIO(text), output)
+        else:
+            main.run_parallel_batch(io.StringIO(text), output, workers=workers)
+    finally:
+        set_backend(None)
+        Calculations.history.clear()
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert records == [{"line": 1, "error": "Arithmetic error: Overflow"}, {"line": 2, "result": "3.5"}]
+
+def test_run_batch_csv():
+    """Test that CSV requests are read by header and answered with CSV records."""
+    requests = io.StringIO("operation,a,b\nadd,1,2\nmultiply,x,2\nsubtract\n")
+    output = io.StringIO()
+    assert main.run_batch(requests, output, "csv") == 3
+    assert output.getvalue().splitlines() == [
+        "line,result,error",
+        "2,3.0,",
+        "3,,Invalid request: Invalid number input: x or 2 is not a valid number.",
+        "4,,Invalid request: missing columns",
+    ]
+    with pytest.raises(ValueError):
+        main.run_batch(io.StringIO("x,y\n1,2\n"), io.StringIO(), "csv")
+
+def test_run_batch_keeps_history_bounded(monkeypatch):
+    """Test that batch history is emptied after each block, so memory does not grow with the input."""
+    monkeypatch.setattr(main, "BATCH_BLOCK_ROWS", 10)
+    sizes = []  # The batch history size after each block is evaluated
+    evaluate_requests = main._evaluate_requests
+
+    def evaluate_block(block):
+        records = evaluate_requests(block)
+        sizes.append(len(Calculations.history))
+        return records
+
+    monkeypatch.setattr(main, "_evaluate_requests", evaluate_block)
+    Calculations.history.clear()
+    requests = io.StringIO('{"a": 1, "b": 2, "operation": "add"}\n' * 25)
+    output = io.StringIO()
+    assert main.run_batch(requests, output) == 25
+    assert len(output.getvalue().splitlines()) == 25
+    assert sizes == [10, 10, 5]
+    assert len(Calculations.get_history()) == 0
+
+def test_run_batch_keeps_caller_history():
+    """Test that a batch run leaves the history the caller had before it untouched."""
+    Calculations.history.clear()
+    Calculator.add(1, 2)
+    main.run_batch(io.StringIO('{"a": 5, "b": 5, "operation": "multiply"}\n'), io.StringIO())
+    history = Calculations.get_history()
+    assert [(entry.a, entry.b, entry.result) for entry in history] == [(1.0, 2.0, 3.0)]
+    Calculations.history.clear()
+
+def test_batch_non_finite_results_are_valid_json():
+    """Test that a float overflow to infinity is written as a string, so every record is valid JSON."""
+    output = io.StringIO()
+    main.run_batch(io.StringIO('{"a": 1e308, "b": 10, "operation": "multiply"}\n'
+                               '{"a": -1e308, "b": 10, "operation": "multiply"}\n'), output)
+    lines = output.getvalue().splitlines()
+    assert "Infinity" not in output.getvalue()
+    records = [json.loads(line, parse_constant=pytest.fail) for line in lines]
+    assert records == [{"line": 1, "result": "inf"}, {"line": 2, "result": "-inf"}]
+
+def test_batch_main_writes_output_file(tmp_path):
+    """Test the --batch entry point with an input and an output file."""
+    source, target = tmp_path / "requests.csv", tmp_path / "results.csv"
+    source.write_text("a,b,operation\n4,2,divide\n", encoding="utf-8")
+    assert main.batch_main(["--batch", str(source), "--output", str(target)]) == 1
+    assert target.read_text(encoding="utf-8") == "line,result,error\n2,2.0,\n"
+    with pytest.raises(ValueError):
+        main.batch_main(["--batch"])
+
+@pytest.mark.parametrize("input_format, text", [
+    ("jsonl", '{"a": 6, "b": 3, "operation": "divide"}\n\n{"a": 1, "b": 0, "operation": "divide"}\n'
+              '{"a": 2, "b": 5, "operation": "multiply"}\nnot json\n' * 7),
+    ("csv", "a,b,operation\n" + "6,3,divide\n1,0,divide\n\n2,5,multiply\nx,1,add\n" * 7),
+])
+def test_run_parallel_batch_matches_run_batch(monkeypatch, input_format, text):
+    """Test that parallel records come back in input order, identical to the sequential ones."""
+    monkeypatch.setattr(main, "PARALLEL_CHUNK_ROWS", 3)
+    expected = io.StringIO()
+    main.run_batch(io.StringIO(text), expected, input_format)
+    Calculations.history.clear()
+    output = io.StringIO()
+    assert main.run_parallel_batch(io.StringIO(text), output, input_format, workers=2) == 28
+    assert output.getvalue() == expected.getvalue()
+
+def test_run_parallel_batch_merges_history(monkeypatch):
+    """Test that the workers' calculations are merged into history in input order."""
+    monkeypatch.setattr(main, "PARALLEL_CHUNK_ROWS", 2)
+    Calculations.history.clear()
+    requests = io.StringIO("".join(f'{{"a": {i}, "b": 1, "operation": "add"}}\n' for i in range(9)))
+    main.run_parallel_batch(requests, io.StringIO(), workers=3)
+    history = Calculations.get_history()
+    assert [entry.a for entry in history] == [float(i) for i in range(9)]
+    assert [entry.result for entry in history] == [i + 1.0 for i in range(9)]
+    assert history[0].operation.__name__ == "add"
+
+def test_run_parallel_batch_merges_errors_and_exact_values(monkeypatch):
+    """Test that merged worker history keeps each row's error and exact values, not only its floats."""
+    monkeypatch.setattr(main, "PARALLEL_CHUNK_ROWS", 2)
+    Calculations.history.clear()
+    requests = io.StringIO('{"a": "0.1", "b": "0.2", "operation": "add"}\n'
+                           '{"a": "1e999999999", "b": "1e999999999", "operation": "multiply"}\n'
+                           '{"a": "1", "b": "3", "operation": "divide"}\n')
+    set_backend("decimal")
+    try:
+        main.run_parallel_batch(requests, io.StringIO(), workers=2)
+        history = Calculations.get_history()
+        assert len(history) == 3
+        assert (history[0].a, history[0].result) == (Decimal("0.1"), Decimal("0.3"))
+        assert history[2].result == Decimal(1) / Decimal(3)
+        assert isinstance(history[1].error, decimal.Overflow) and history[0].error is None
+    finally:
+        set_backend(None)
+        Calculations.history.clear()
+
+def test_batch_main_with_workers(tmp_path):
+    """Test that --workers runs the batch in worker processes without keeping history."""
+    source, target = tmp_path / "requests.jsonl", tmp_path / "results.jsonl"
+    source.write_text('{"a": 4, "b": 2, "operation": "divide"}\n', encoding="utf-8")
+    Calculations.history.clear()
+    assert main.batch_main(["--batch", str(source), "--output", str(target), "--workers", "2"]) == 1
+    assert json.loads(target.read_text(encoding="utf-8")) == {"line": 1, "result": 2.0}
+    assert len(Calculations.get_history()) == 0
+    with pytest.raises(ValueError):
+        main.batch_main(["--batch", str(source), "--workers", "many"])
+    with pytest.raises(ValueError):
+        main.batch_main(["--batch", str(source), "--threads", "2"])
+
+@pytest.mark.parametrize("args, script_mode", [(["--script", "-"], True), ([], False)])
+def test_script_mode_needs_opt_in(args, script_mode):
+    """Test that stdin is run as a script only with '--script -'; piped stdin alone starts the interactive loop."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    run = subprocess.run([sys.executable, "main.py", *args], cwd=root, input="add 1 2\nexit\n",
+                         capture_output=True, text=True, timeout=60)
+    assert "The result of 1 + 2 is equal to 3.0" in run.stdout
+    assert ("Type 'exit' to exit" in run.stdout) is not script_mode
+    assert ("Processed 2 commands" in run.stderr) is script_mode
@@ -0,0 +1,168 @@
+"""
+Tests for the numeric backends and their use by the calculator and history.
+"""
+
+from decimal import Decimal
+from fractions import Fraction
+# Import pytest for unit testing framework
+import pytest
+
+from calculator import Calculator
+from calculator.calculations import Calculations
+from calculator.config import history_config
+from calculator.history_reader import HistoryReader
+from calculator.numeric import DecimalBackend, NumericBackend, get_backend, parse_number, set_backend, use_backend
+
+@pytest.fixture
+def session_backend():
+    """Run a test on an empty history, and restore the configured session backend afterwards."""
+    Calculations.history.clear()
+    yield set_backend
+    set_backend(None)
+    Calculations.history.clear()
+
+@pytest.mark.parametrize("backend, text, expected", [
+    ("float", "0.1", 0.1),
+    ("decimal", " 0.1 ", Decimal("0.1")),
+    ("fraction", "1/3", Fraction(1, 3)),
+])
+def test_parse_number(backend, text, expected):
+    """Test that each backend parses text to its own number type."""
+    value = parse_number(text, backend)
+    assert value == expected and type(value) is type(expected)
+
+@pytest.mark.parametrize("backend", ["float", "decimal", "fraction"])
+def test_parse_number_rejects_invalid_input(backend):
+    """Test that invalid input is a ValueError for every backend."""
+    with pytest.raises(ValueError):
+        parse_number("abc", backend)
+
+def test_floats_convert_through_their_shortest_text():
+    """Test that exact backends convert floats as written, not as their binary value."""
+    assert parse_number(0.1, "decimal") == Decimal("0.1")
+    assert parse_number(0.1, "fraction") == Fraction(1, 10)
+    assert parse_number(Fraction(1, 4), "decimal") == Decimal("0.25")
+
+def test_get_backend():
+    """Test backend lookup by name, with a decimal precision, and unknown names."""
+    assert get_backend("decimal", precision=5).context.prec == 5
+    assert get_backend("decimal", precision=5) is get_backend("decimal", precision=5)
+    with pytest.raises(ValueError):
+        get_backend("complex")
+
+def test_backend_base_class_is_abstract():
+    """Test that a backend without `parse` and `_convert_number` cannot be created."""
+    with pytest.raises(TypeError):
+        NumericBackend()
+
+    class HalfBackend(NumericBackend):
+        """A backend that only parses."""
+
+        def parse(self, text):
+            return float(text)
+
+    with pytest.raises(TypeError):
+        HalfBackend()
+
+def test_use_backend_is_scoped(session_backend):
+    """Test that use_backend applies inside its block only, over the session backend."""
+    session_backend("fraction")
+    with use_backend("decimal") as backend:
+        assert get_backend() is backend
+        assert type(parse_number("1")) is Decimal
+    assert type(parse_number("1")) is Fraction
+
+def test_calculator_per_call_backend(session_backend):
+    """Test that a call converts its operands to its backend, and computes in its context."""
+    assert Calculator.divide(1, 3, backend="fraction") == Fraction(1, 3)
+    assert Calculator.divide(1, 3, backend=DecimalBackend(precision=4)) == Decimal("0.3333")
+    assert Calculator.add(0.1, 0.2, backend="decimal") == Decimal("0.3")
+    assert Calculator.add(0.1, 0.2) == 0.1 + 0.2  # The float backend uses operands as given
+
+def test_evaluate_converts_constants_and_variables(session_backend):
+    """Test that an expression's literals and variables follow the backend, without recompiling."""
+    assert Calculator.evaluate("0.1 + 0.2") == 0.1 + 0.2
+    assert Calculator.evaluate("0.1 + 0.2", backend="fraction") == Fraction(3, 10)
+    assert Calculator.evaluate("x / 3 - 1", {"x": 1}, backend="fraction") == Fraction(-2, 3)
+
+def test_history_keeps_exact_values(session_backend):
+    """Test that exact values are kept in history only while an exact backend is active."""
+    Calculator.add(Decimal("0.1"), Decimal("0.2"))
+    session_backend("fraction")
+    Calculator.divide(1, 3)
+    first, second = Calculations.get_history()
+    assert type(first.result) is float
+    assert (second.a, second.b, second.result) == (Fraction(1), Fraction(3), Fraction(1, 3))
+
+def test_history_follows_per_call_backend(session_backend):
+    """Test that a call's own exact backend decides whether history keeps its exact values."""
+    assert Calculator.add(0.1, 0.2, backend="fraction") == Fraction(3, 10)
+    assert Calculations.get_latest().result == Fraction(3, 10)
+    assert Calculator.evaluate("1/3", backend="fraction") == Fraction(1, 3)
+    assert Calculations.get_latest().result == Fraction(1, 3)
+    session_backend("fraction")
+    Calculator.add(1, 2, backend="float")
+    assert type(Calculations.get_latest().result) is float
+
+def test_history_keeps_values_beyond_float_range(session_backend):
+    """Test that an exact result too large for a float is returned and kept, with an inf float column."""
+    session_backend("fraction")
+    huge = Fraction(10 ** 200)
+    assert Calculator.multiply(huge, huge) == Fraction(10 ** 400)
+    assert Calculator.subtract(-huge * huge, 1) == -Fraction(10 ** 400) - 1
+    first, second = Calculations.get_history()
+    assert (first.result, second.result) == (Fraction(10 ** 400), -Fraction(10 ** 400) - 1)
+    assert list(Calculations.history.result) == [float("inf"), float("-inf")]
+    assert list(Calculations.history.operand1) == [1e200, float("-inf")]
+
+def test_history_file_round_trip(session_backend, tmp_path, monkeypatch):
+    """Test that exact values are saved to CSV as text and loaded back exactly."""
+    history_file = tmp_path / "history.csv"
+    monkeypatch.setattr(history_config, "history_file", str(history_file))
+    session_backend("fraction")
+    Calculator.divide(1, 3)
+    Calculator.multiply(0.5, 2)
+    Calculations.save_history()
+    assert history_file.read_text().splitlines()[1:] == ["1,3,divide,1/3", "1/2,2,multiply,1"]
+
+    Calculations.load_history()
+    assert [entry.result for entry in Calculations.get_history()] == [Fraction(1, 3), Fraction(1)]
+    assert Calculations.history.result[0] == pytest.approx(1 / 3)
+
+def test_exact_history_file_read_with_float_backend(session_backend, tmp_path, monkeypatch):
+    """Test that a CSV saved with the fraction backend loads, counts, converts and compacts with float."""
+    history_file = tmp_path / "history.csv"
+    monkeypatch.setattr(history_config, "history_file", str(history_file))
+    session_backend("fraction")
+    Calculator.multiply(2, 3)
+    Calculator.divide(1, 3)
+    Calculator.add("1/3", "1/6")
+    Calculations.save_history()
+    saved = history_file.read_text()
+    assert saved.splitlines()[1:] == ["2,3,multiply,6", "1,3,divide,1/3", "1/3,1/6,add,1/2"]
+
+    session_backend("float")
+    for chunksize in (None, 1):  # Whole file, and a switch to text parsing after the first chunk
+        Calculations.load_history(chunksize)
+        assert [entry.result for entry in Calculations.get_history()] == [6.0, 1 / 3, 0.5]
+    assert Calculations.get_history()[2].a == 1 / 3
+    assert HistoryReader(page_size=1).count() == 3
+    assert [row.result for row in HistoryReader().rows("add")] == [0.5]
+
+    binary_file = tmp_path / "history.npy"
+    assert Calculations.convert_history(str(binary_file)) == 3
+    assert [row.result for row in HistoryReader(str(binary_file)).rows()] == [6.0, 1 / 3, 0.5]
+
+    Calculations.compact_history()  # Keeps every row, exactly as saved
+    assert history_file.read_text() == saved
+
+def test_compaction_drops_only_invalid_rows(tmp_path, monkeypatch):
+    """Test that compaction keeps exact text, drops rows without valid operands and blanks invalid results."""
+    history_file = tmp_path / "history.csv"
+    monkeypatch.setattr(history_config, "history_file", str(history_file))
+    history_file.write_text("Operand1,Operand2,Operation,Result\n1/3,1/6,add,1/2\nx,1,add,2\n"
+                            "Operand1,Operand2,Operation,Result\n1,0,divide,\n2,2,add,oops\n")
+    Calculations.compact_history()
+    assert history_file.read_text().splitlines() == [
+        "Operand1,Operand2,Operation,Result", "1/3,1/6,add,1/2", "1,0,divide,", "2,2,add,",
+    ]
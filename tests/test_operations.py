@@ -1,7 +1,13 @@
 '''Operations tests'''
 
+import numpy as np
+import pytest
+
 # Import the necessary functions from the calculator operations module
-from calculator.operations import add, subtract, multiply, divide
+from calculator import Calculator
+from calculator.calculations import Calculations
+from calculator.config import history_config
+from calculator.operations import add, subtract, multiply, divide, OperationRegistry, OPERATIONS, OP_CODES, registry
 
 def test_addition():
     '''Test that the addition function correctly adds two numbers.'''
@@ -71,3 +77,76 @@ def test_negative_large_numbers():
     assert add(-1e308, -1e308) == -float('inf')  # Negative overflow for addition
     assert multiply(-1e155, 1e155) == -1e310  # Large negative multiplication check
     assert divide(-1e308, 1) == -1e308  # Large negative division check
+
+# Operation registry tests
+
+def exponent(a, b):
+    '''Raise a to the power b; registered at runtime by the tests below.'''
+    return a ** b
+
+@pytest.fixture
+def exponent_operation():
+    '''Register `exponent` in the shared registry (registering it again is a no-op) and clear history.'''
+    Calculations.history.clear()
+    yield registry.register(exponent)
+    Calculations.history.clear()
+
+def test_builtin_op_codes_are_stable():
+    '''Test that the built-in operations keep the op codes history files were written with.'''
+    assert [registry[name].op_code for name in ("add", "subtract", "multiply", "divide")] == [0, 1, 2, 3]
+    assert OPERATIONS[:4] == [add, subtract, multiply, divide]
+    assert registry["divide"].ufunc is np.divide and registry["multiply"].symbol == "x"
+
+def test_register_is_idempotent(exponent_operation):
+    '''Test that registering the same function again returns its entry and op code.'''
+    assert registry.register(exponent) is exponent_operation
+    assert OP_CODES["exponent"] == exponent_operation.op_code and OPERATIONS[exponent_operation.op_code] is exponent
+    assert "exponent" in registry and registry.get("root") is None
+
+def test_register_rejects_invalid_operations(exponent_operation):
+    '''Test that taken names, non-identifier names and non-binary operations are rejected.'''
+    def other_exponent(a, b):
+        return a ** b
+    other_exponent.__name__ = "exponent"
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(other_exponent)
+    with pytest.raises(ValueError, match="identifier"):
+        registry.register(lambda a, b: a)
+    with pytest.raises(ValueError, match="arity"):
+        registry.register(exponent, arity=1)
+
+def test_register_replace_keeps_op_code():
+    '''Test that replacing an operation in a separate registry keeps its op code.'''
+    local = OperationRegistry()
+    local.register(add)
+    def add_checked(a, b):
+        return add(a, b)
+    add_checked.__name__ = "add"
+    assert local.register(add_checked, replace=True).op_code == 0
+    assert local.functions == [add_checked] and len(local) == 1
+
+def test_runtime_operation_is_recorded_and_saved(exponent_operation, tmp_path, monkeypatch):
+    '''Test that a runtime operation dispatches by name, is indexed in history and round-trips through CSV.'''
+    assert Calculator.calculate("exponent", 2, 10) == 1024
+    Calculator.add(1, 2)
+    assert Calculations.history.positions(exponent_operation.op_code).tolist() == [0]
+    assert Calculations.get_history()[0].operation is exponent
+
+    history_file = tmp_path / "history.csv"
+    monkeypatch.setattr(history_config, "history_file", str(history_file))
+    Calculations.save_history()
+    assert history_file.read_text().splitlines()[1] == "2.0,10.0,exponent,1024.0"
+    Calculations.load_history()
+    assert [entry.result for entry in Calculations.get_history()] == [1024, 3]
+
+def test_calculate_unknown_operation():
+    '''Test that an unknown operation name is a ValueError.'''
+    with pytest.raises(ValueError, match="Unknown operation: root"):
+        Calculator.calculate("root", 2, 3)
+
+def test_evaluate_batch_without_ufunc(exponent_operation):
+    '''Test that batches of an operation without a ufunc are computed per element, masking failures.'''
+    result = Calculator.evaluate_batch("exponent", [2, 0, 3], [3, -1, 2])
+    assert result.mask.tolist() == [False, True, False]
+    assert result.compressed().tolist() == [8, 9]
+    assert len(Calculations.history) == 2
@@ -8,13 +8,23 @@ correct behavior of the plugin manager under various scenarios, including succes
 plugin loading, handling missing plugins, and error handling when a plugin fails to load.
 """
 
+import json
+import os
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 # Import pytest for unit testing framework
 import pytest   # pylint: disable=unused-import
-from app.commands import CommandHandler
-from app.plugins.history import historyCommand
+from app.commands import CommandHandler, LazyCommand
+from app.commands.operation import OperationCommand
+from app.plugins import plugins_manager
+from app.plugins.add import addCommand
+from app.plugins.eval import evalCommand, parse_eval_args
+from app.plugins.history import historyCommand, parse_show_options, write_lines
 from app.plugins.plugins_manager import load_plugins
+from calculator.calculation import Calculation
 from calculator.calculations import Calculations
+from calculator.config import history_config
+from calculator.operations import add, divide, registry
 
 def test_plugins_load():
     """Test that plugins are loaded dynamically."""
@@ -64,13 +74,17 @@ def mock_calculations():
     mock_calc1.a = 2
     mock_calc1.b = 4
     mock_calc1.operation = MagicMock(__name__="add")
-    mock_calc1.perform.return_value = 6  # Expected result of 2 + 4 = 6
+    mock_calc1.result = 6  # Stored result of 2 + 4 = 6
+    mock_calc1.error = None
+    mock_calc1.position = 0
 
     mock_calc2 = MagicMock()
     mock_calc2.a = 5
     mock_calc2.b = 3
     mock_calc2.operation = MagicMock(__name__="subtract")
-    mock_calc2.perform.return_value = 2  # Expected result of 5 - 3 = 2
+    mock_calc2.result = 2  # Stored result of 5 - 3 = 2
+    mock_calc2.error = None
+    mock_calc2.position = 1
 
     with patch.object(Calculations, 'get_history', return_value=[mock_calc1, mock_calc2]) as mock_get_history, \
          patch.object(Calculations, 'save_history') as mock_save_history, \
@@ -95,8 +109,104 @@ def test_show_history(mock_calculations, capsys):
     assert "1. 2 add 4 equal to 6" in captured.out
     assert "2. 5 subtract 3 equal to 2" in captured.out
 
-    # Ensure get_history was called
+    # Ensure get_history was called and nothing was recomputed
     mock_get_history.assert_called_once()
+    mock_get_history.return_value[0].perform.assert_not_called()
+
+def test_show_history_by_operation(capsys):
+    """Test that 'history show <op>' only lists entries of that operation."""
+    mock_calc = MagicMock(a=2, b=4, operation=MagicMock(__name__="add"), result=6, error=None)
+    with patch.object(Calculations, "find_by_operation", return_value=[mock_calc]) as mock_find:
+        historyCommand().execute(["show", "ADD"])
+        mock_find.assert_called_once_with("add")
+    assert "📜 Calculation History (add):" in capsys.readouterr().out
+
+    with patch.object(Calculations, "find_by_operation", return_value=[]):
+        historyCommand().execute(["show", "divide"])
+    assert "📜 No divide history available." in capsys.readouterr().out
+
+def test_history_stats(capsys):
+    """Test that 'history stats' prints per-operation and total aggregates of the in-memory history."""
+    Calculations.history.clear()
+    historyCommand().execute(["stats"])
+    assert "📊 No history available." in capsys.readouterr().out
+    Calculations.add_calculation(Calculation.create(Decimal("1"), Decimal("2"), add))
+    Calculations.add_calculation(Calculation.create(Decimal("3"), Decimal("4"), add))
+    historyCommand().execute(["stats"])
+    out = capsys.readouterr().out
+    assert "📊 History Statistics (2 entries):" in out
+    assert "add   : count 2, sum 10.0, min 3.0, max 7.0, mean 5.0" in out
+    assert "total : count 2, sum 10.0, min 3.0, max 7.0, mean 5.0" in out
+    Calculations.history.clear()
+
+def test_history_file_queries(tmp_path, monkeypatch, capsys):
+    """Test 'history show --file' and 'history count' read the file without loading it."""
+    history_file = tmp_path / "history.csv"
+    history_file.write_text("Operand1,Operand2,Operation,Result\n1,2,add,3\n8,4,divide,2\n", encoding="utf-8")
+    monkeypatch.setattr(history_config, "history_file", str(history_file))
+    Calculations.history.clear()
+
+    historyCommand().execute(["show", "--file", "divide"])
+    assert "📜 History File (divide):\n2. 8.0 divide 4.0 equal to 2.0" in capsys.readouterr().out
+    historyCommand().execute(["count"])
+    assert "📜 2 entries in the history file." in capsys.readouterr().out
+    historyCommand().execute(["count", "power"])
+    assert "Unknown operation: power" in capsys.readouterr().out
+    assert len(Calculations.history) == 0
+
+@pytest.fixture
+def ten_calculations():
+    """Fill the history with 1 + 1, 2 + 1, ..., 10 + 1."""
+    Calculations.history.clear()
+    for value in range(1, 11):
+        Calculations.add_calculation(Calculation(Decimal(value), Decimal(1), add))
+    yield
+    Calculations.history.clear()
+
+def test_show_history_paging(ten_calculations, capsys):
+    """Test 'history show' with --limit, --offset and --tail."""
+    historyCommand().execute(["show", "--offset", "2", "--limit", "2"])
+    assert capsys.readouterr().out == "\n📜 Calculation History:\n3. 3.0 add 1.0 equal to 4.0\n4. 4.0 add 1.0 equal to 5.0\n"
+    historyCommand().execute(["show", "add", "--tail", "3", "--limit", "1"])
+    assert capsys.readouterr().out.splitlines()[-1] == "8. 8.0 add 1.0 equal to 9.0"
+
+def test_show_history_numbers_match_file(tmp_path, monkeypatch, capsys):
+    """Test that 'history show <op>' numbers entries by history position, like 'history show --file <op>'."""
+    monkeypatch.setattr(history_config, "history_file", str(tmp_path / "history.csv"))
+    Calculations.history.clear()
+    for a, operation in ((1, add), (8, divide), (3, add), (9, divide)):
+        Calculations.add_calculation(Calculation(Decimal(a), Decimal(1), operation))
+    Calculations.save_history()
+    capsys.readouterr()
+    historyCommand().execute(["show", "divide", "--offset", "1"])
+    memory = capsys.readouterr().out.splitlines()[-1]
+    historyCommand().execute(["show", "--file", "divide", "--offset", "1"])
+    assert capsys.readouterr().out.splitlines()[-1] == memory == "4. 9.0 divide 1.0 equal to 9.0"
+    Calculations.history.clear()
+
+def test_show_history_formats(ten_calculations, capsys):
+    """Test the CSV and JSON lines output modes."""
+    historyCommand().execute(["show", "--tail", "1", "--format", "csv"])
+    assert capsys.readouterr().out == "Operand1,Operand2,Operation,Result\n10.0,1.0,add,11.0\n"
+    historyCommand().execute(["show", "--limit", "1", "--format", "jsonl"])
+    assert json.loads(capsys.readouterr().out) == {
+        "entry": 1, "a": 1.0, "b": 1.0, "operation": "add", "result": 2.0, "error": None
+    }
+
+def test_show_history_invalid_options(capsys):
+    """Test that invalid 'history show' options print the usage."""
+    historyCommand().execute(["show", "--limit", "x"])
+    out = capsys.readouterr().out
+    assert "--limit needs a non-negative integer" in out and "Usage: history show" in out
+    with pytest.raises(ValueError):
+        parse_show_options(["--format", "xml"])
+
+def test_write_lines_batches_writes():
+    """Test that lines are written in batches rather than one write per line."""
+    out = MagicMock()
+    write_lines((str(i) for i in range(2500)), out)
+    assert out.write.call_count == 3  # 1000 + 1000 + 500 lines
+    out.flush.assert_called_once()
 
 def test_save_history(mock_calculations, capsys):
     """Test the 'save' action of the history command."""
@@ -145,3 +255,113 @@ def test_clear_history(mock_calculations, capsys):
     # Ensure the history clear message is printed
     mock_clear_history.assert_called_once()
     assert "🗑️ History cleared." in captured.out
+
+# Plugin manifest and lazy loading tests
+
+def test_plugins_are_imported_on_first_dispatch(capfd):
+    """Test that plugin modules are imported only when their command is first executed."""
+    command_handler = load_plugins()
+    assert isinstance(command_handler.commands["add"], LazyCommand)
+
+    command_handler.commands["add"].execute(["2", "3"])
+    out, _ = capfd.readouterr()
+    assert "The result of 2 + 3 is equal to 5.0" in out
+    # The placeholder was replaced by the real command
+    assert isinstance(command_handler.commands["add"], addCommand)
+
+def test_lazy_command_import_error():
+    """Test that a plugin that fails to import raises and is unregistered."""
+    handler = CommandHandler()
+    handler.register_lazy_command("broken", "app.plugins.does_not_exist", "brokenCommand")
+    with pytest.raises(ImportError):
+        handler.commands["broken"].execute([])
+    assert "broken" not in handler.commands
+
+def test_lazy_command_missing_class():
+    """Test that a plugin module without its command class raises and is unregistered."""
+    handler = CommandHandler()
+    handler.register_lazy_command("add", "app.plugins.add", "missingCommand")
+    with pytest.raises(ImportError, match="missingCommand not found"):
+        handler.commands["add"].execute([])
+    assert "add" not in handler.commands
+
+@pytest.fixture
+def plugin_dir(tmp_path, monkeypatch):
+    """Point the plugins manager at a temporary plugins directory with one plugin."""
+    (tmp_path / "alpha").mkdir()
+    (tmp_path / "alpha" / "__init__.py").write_text("", encoding="utf-8")
+    (tmp_path / "notes").mkdir()  # Not a plugin: no __init__.py
+    monkeypatch.setattr(plugins_manager, "PLUGIN_PATH", str(tmp_path))
+    monkeypatch.setattr(plugins_manager, "MANIFEST_PATH", str(tmp_path / "__pycache__" / "manifest.json"))
+    return tmp_path
+
+def test_manifest_is_cached(plugin_dir):
+    """Test that a valid cached manifest is used without scanning the plugins directory."""
+    manifest = plugins_manager.load_manifest()
+    assert manifest["plugins"] == {"alpha": {"module": "app.plugins.alpha", "class": "alphaCommand"}}
+
+    with patch.object(plugins_manager, "build_manifest") as mock_build:
+        assert plugins_manager.load_manifest()["plugins"] == manifest["plugins"]
+    mock_build.assert_not_called()
+
+def test_manifest_is_rebuilt_when_plugins_change(plugin_dir):
+    """Test that adding a plugin invalidates the cached manifest through the directory mtimes."""
+    plugins_manager.load_manifest()
+    (plugin_dir / "beta").mkdir()
+    (plugin_dir / "beta" / "__init__.py").write_text("", encoding="utf-8")
+    os.utime(plugin_dir, ns=(0, 0))  # Guarantee an mtime change on coarse-grained filesystems
+
+    assert sorted(plugins_manager.load_manifest()["plugins"]) == ["alpha", "beta"]
+
+# Eval command tests
+
+def test_parse_eval_args():
+    """Test that name=value arguments are variables and the rest is the expression."""
+    assert parse_eval_args(["(2", "+", "x)", "*", "4", "x=3"]) == ("(2 + x) * 4", {"x": 3.0})
+    with pytest.raises(ValueError):
+        parse_eval_args(["x", "+", "1", "x=abc"])
+
+def test_eval_command(capsys):
+    """Test that eval prints the value and records one history entry."""
+    Calculations.clear_history()
+    capsys.readouterr()
+    evalCommand().execute(["(2+3)*4/8"])
+    assert capsys.readouterr().out == "The result of (2+3)*4/8 is equal to 2.5\n"
+    assert len(Calculations.get_history()) == 1
+
+@pytest.mark.parametrize("args, message", [
+    ([], "Usage: eval <expression> [name=value ...]"),
+    (["2", "**", "3"], "Error: Unsupported operator in expression: Pow"),
+    (["x", "+", "1"], "Error: No value for variable(s): x"),
+    (["1/0"], "Error: Division by zero is not allowed."),
+])
+def test_eval_command_errors(capsys, args, message):
+    """Test that eval reports usage, invalid expressions, missing variables and division by zero."""
+    evalCommand().execute(args)
+    assert capsys.readouterr().out == message + "\n"
+
+# Registered operation commands
+
+def hypot(a, b):
+    """The hypotenuse of a right triangle; registered at runtime by the test below."""
+    return (a * a + b * b) ** 0.5
+
+def test_registered_operation_becomes_command(capfd):
+    """Test that an operation registered at runtime is dispatched without a plugin folder."""
+    command_handler = load_plugins()
+    assert command_handler.get_command("hypot") is None
+    registry.register(hypot)
+
+    command_handler.dispatch("hypot", ["3", "4"])
+    command_handler.dispatch("hypot", ["3"])
+    command_handler.dispatch("hypot", ["3", "x"])
+    out, _ = capfd.readouterr()
+    assert "The result of 3 hypot 4 is equal to 5.0" in out
+    assert "Usage: hypot <a> <b>" in out
+    assert "Invalid number input: 3 or x is not a valid number." in out
+    assert isinstance(command_handler.commands["hypot"], OperationCommand)
+
+    command_handler.dispatch("menu", [])
+    assert "- hypot <a> <b>" in capfd.readouterr().out
+    with pytest.raises(KeyError):
+        command_handler.dispatch("unknown", [])
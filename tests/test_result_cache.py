@@ -0,0 +1,137 @@
+"""
+Tests for the Calculator result cache.
+"""
+
+import math
+import sys
+import threading
+from collections import OrderedDict
+from decimal import Decimal, localcontext
+from unittest.mock import patch
+# Import pytest for unit testing framework
+import pytest
+
+from calculator import Calculator
+from calculator.calculation import Calculation
+from calculator.calculations import Calculations
+from calculator.operations import add, divide
+from calculator.result_cache import ResultCache, result_key
+
+@pytest.fixture
+def cache():
+    """Enable a small result cache on an empty history, and disable it afterwards."""
+    Calculations.history.clear()
+    yield Calculator.enable_result_cache(2)
+    Calculator.disable_result_cache()
+    Calculations.history.clear()
+
+def test_lru_eviction_and_counters():
+    """Test that the least recently used result is evicted and the counters follow."""
+    lru = ResultCache(2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    assert lru.get("a") == 1  # "b" is now the least recently used
+    lru.put("c", 3)
+    assert lru.get("b") is None
+    assert lru.stats() == {"hits": 1, "misses": 1, "evictions": 1, "size": 2, "maxsize": 2}
+    with pytest.raises(ValueError):
+        ResultCache(0)
+
+def test_hit_skips_calculation_but_records_history(cache):
+    """Test that a cached call returns the result and is still added to history."""
+    assert Calculator.add(2, 3) == 5
+    with patch.object(Calculation, "create") as create:
+        assert Calculator.add(2, 3) == 5
+    create.assert_not_called()
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert [(entry.a, entry.b, entry.result) for entry in Calculations.get_history()] == [(2, 3, 5), (2, 3, 5)]
+
+def test_operand_types_are_part_of_the_key(cache):
+    """Test that equal Decimal and float operands do not share a result."""
+    decimal_result = Calculator.add(Decimal("1"), Decimal("0.1"))
+    float_result = Calculator.add(1.0, 0.1)
+    assert type(decimal_result) is Decimal and decimal_result == Decimal("1.1")
+    assert type(float_result) is float
+    assert cache.misses == 2
+    assert result_key(add, 1, 2) != result_key(add, 1.0, 2.0)
+
+def test_decimal_context_is_part_of_the_key(cache):
+    """Test that a result computed at one decimal precision is not reused at another."""
+    one, three = Decimal(1), Decimal(3)
+    with localcontext() as context:
+        context.prec = 3
+        assert Calculator.divide(one, three) == Decimal("0.333")
+    assert Calculator.divide(one, three) == Decimal(1) / Decimal(3)
+    assert cache.hits == 0
+
+def test_signed_zeros_do_not_share_a_result(cache):
+    """Test that -0.0 and 0.0 operands, and signed Decimal zeros, are cached apart."""
+    assert math.copysign(1.0, Calculator.multiply(0.0, 2.0)) == 1.0
+    assert math.copysign(1.0, Calculator.multiply(-0.0, 2.0)) == -1.0
+    assert math.copysign(1.0, Calculator.add(-0.0, -0.0)) == -1.0
+    assert math.copysign(1.0, Calculator.add(0.0, -0.0)) == 1.0
+    assert Calculator.multiply(Decimal("0"), Decimal(2)).is_signed() is False
+    assert Calculator.multiply(Decimal("-0"), Decimal(2)).is_signed() is True
+    assert cache.hits == 0
+    assert result_key(add, 0.0, 1.0) != result_key(add, -0.0, 1.0)
+    assert result_key(add, 0, 1) == result_key(add, 0, 1)
+
+def test_errors_are_not_cached(cache):
+    """Test that a division by zero raises and is recorded on every call."""
+    for _ in range(2):
+        with pytest.raises(ZeroDivisionError):
+            Calculator._perform_operation(1.0, 0.0, divide)
+    assert len(cache) == 0
+    assert len(Calculations.get_history()) == 2
+
+def test_disabled_by_default():
+    """Test that no results are cached until the cache is enabled."""
+    assert Calculator.result_cache is None
+
+def test_cache_shared_by_threads(cache):
+    """Test that threads hitting and evicting the same small cache never fail, and every call is counted."""
+    calls, threads = 2000, 4
+    errors = []
+
+    def worker(thread):
+        try:
+            for i in range(calls):
+                assert Calculator.add(i % 3, thread % 2) == i % 3 + thread % 2
+        except Exception as e:  # Reported by the main thread
+            errors.append(e)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible
+    try:
+        workers = [threading.Thread(target=worker, args=(thread,)) for thread in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == calls * threads and stats["size"] <= 2
+    assert len(Calculations.history) == calls * threads
+
+def test_eviction_cannot_interleave_with_lookup():
+    """Test that another thread's eviction waits until a lookup has moved its key to the recent end."""
+    lru = ResultCache(1)
+
+    class EvictingDict(OrderedDict):
+        """Starts a thread that evicts the key being looked up, right after the lookup finds it."""
+        evictor = None
+
+        def __getitem__(self, key):
+            value = super().__getitem__(key)
+            if self.evictor is None:
+                type(self).evictor = threading.Thread(target=lru.put, args=("other", 2))
+                self.evictor.start()
+                self.evictor.join(timeout=0.2)  # Without the lock, the eviction runs now
+            return value
+
+    lru._results = EvictingDict(key=1)
+    assert lru.get("key") == 1
+    EvictingDict.evictor.join()
+    assert lru.get("other") == 2 and lru.stats()["evictions"] == 1
@@ -0,0 +1,84 @@
+"""
+Tests for command statistics.
+
+These tests cover the latency histogram, the per-command counters recorded by
+`CommandHandler.dispatch`, and the `stats` plugin command.
+"""
+
+# Import pytest for unit testing framework
+import pytest
+
+from app.commands import CLI, CommandHandler
+from app.commands.stats import CommandStats, LatencyHistogram
+from app.plugins.add import addCommand
+from app.plugins.divide import divideCommand
+from app.plugins.stats import statsCommand
+
+class FailingCommand(CLI):
+    """A command that always raises."""
+
+    def execute(self, args):
+        raise RuntimeError("boom")
+
+def test_histogram_percentiles():
+    """Test that percentiles are estimated within the bucket precision."""
+    histogram = LatencyHistogram()
+    for value in range(1, 10001):
+        histogram.record(value * 1000)
+    assert histogram.total == 10000
+    assert histogram.percentile(0.50) == pytest.approx(5_000_000, rel=0.04)
+    assert histogram.percentile(0.99) == pytest.approx(9_900_000, rel=0.04)
+    assert histogram.percentile(1.0) <= histogram.max_ns == 10_000_000
+    assert LatencyHistogram().percentile(0.5) == 0.0
+
+def test_histogram_small_values_are_exact():
+    """Test that values below the sub-bucket count get their own bucket."""
+    histogram = LatencyHistogram()
+    for value in (3, 3, 7):
+        histogram.record(value)
+    assert histogram.percentile(0.5) == 3
+
+def test_dispatch_records_counts_and_errors():
+    """Test that dispatch counts executions and failures per command."""
+    stats = CommandStats()
+    handler = CommandHandler(stats)
+    handler.register_command("fail", FailingCommand())
+    with pytest.raises(RuntimeError):
+        handler.dispatch("fail", [])
+    with pytest.raises(KeyError):
+        handler.dispatch("missing", [])
+
+    summary = stats.summary()
+    assert summary["fail"]["count"] == 1 and summary["fail"]["errors"] == 1
+    assert summary["fail"]["p99_ms"] >= summary["fail"]["p50_ms"] > 0
+    assert "missing" not in summary
+
+def test_handled_command_failures_are_counted(capsys):
+    """Test that commands which print their own error, like 'divide 1 0', are counted as errors."""
+    stats = CommandStats()
+    handler = CommandHandler(stats)
+    handler.register_command("divide", divideCommand())
+    handler.register_command("add", addCommand())
+    handler.dispatch("divide", ["1", "0"])
+    handler.dispatch("divide", ["6", "3"])
+    handler.dispatch("add", ["1", "x"])
+    handler.dispatch("add", ["1"])
+    assert "An error occurred: Cannot divide by zero." in capsys.readouterr().out
+    summary = stats.summary()
+    assert (summary["divide"]["count"], summary["divide"]["errors"]) == (2, 1)
+    assert (summary["add"]["count"], summary["add"]["errors"]) == (2, 2)
+
+def test_stats_command_show_and_reset(monkeypatch, capsys):
+    """Test that the stats command prints the recorded commands and resets them."""
+    stats = CommandStats()
+    stats.record("add", 2_000_000)
+    monkeypatch.setattr("app.plugins.stats.command_stats", stats)
+
+    statsCommand().execute([])
+    out = capsys.readouterr().out
+    assert "📊 Command Statistics:" in out and "add" in out
+
+    statsCommand().execute(["reset"])
+    assert "📊 Command statistics reset." in capsys.readouterr().out
+    statsCommand().execute([])
+    assert "📊 No commands recorded yet." in capsys.readouterr().out